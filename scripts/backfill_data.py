@@ -4,7 +4,7 @@ Backfill BigQuery tables with historical PR data.
 
 This script:
 1. Collects PRs from GitHub (merged, closed, or open)
-2. Generates embeddings for PR bodies
+2. Generates embeddings for PR bodies (pipelined with collection)
 3. Loads everything to BigQuery
 
 Usage:
@@ -14,17 +14,27 @@ Usage:
 """
 
 import argparse
+import asyncio
 import os
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # Optional faster event loop (not available on Windows)
+    uvloop = None
+
 # Add parent directory to path so we can import from src/
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.github_delivery.collector import GitHubCollector
 from src.github_delivery.bigquery_loader import BigQueryLoader
+from src.github_delivery.models import PullRequest
 
 # Load environment
 load_dotenv()
@@ -84,6 +94,14 @@ Examples:
         help='Repository (owner/name). Defaults to GITHUB_REPOSITORY env var'
     )
 
+    parser.add_argument(
+        '--cache-format',
+        type=str,
+        choices=['json', 'pickle'],
+        default='json',
+        help='PR cache storage format: json (default) or pickle (faster, tied to this code version)'
+    )
+
     parser.add_argument(
         '--dry-run',
         action='store_true',
@@ -99,6 +117,122 @@ Examples:
     return parser.parse_args()
 
 
+async def embed_from_queue(
+    loader: BigQueryLoader,
+    repo: str,
+    pr_queue: "asyncio.Queue",
+    batch_size: int = 64
+) -> Dict[int, Tuple[str, Optional[List[float]]]]:
+    """
+    Embed PR bodies as collection produces them.
+
+    Pulls PRs off the queue in batches and embeds each batch in a worker
+    thread (the embedding client is blocking), so embedding overlaps with
+    the remaining GitHub requests. A None on the queue ends the stream.
+
+    Args:
+        loader: BigQueryLoader used to generate (or reuse stored) embeddings
+        repo: Repository name
+        pr_queue: Queue of PullRequest objects, terminated by None
+        batch_size: Number of PRs per embedding batch
+
+    Returns:
+        Dict mapping PR number to (body that was embedded, embedding)
+    """
+    loop = asyncio.get_running_loop()
+    results = {}
+    batch = []
+    while True:
+        pr = await pr_queue.get()
+        if pr is not None:
+            batch.append(pr)
+
+        if batch and (pr is None or len(batch) >= batch_size):
+            try:
+                embeddings = await loop.run_in_executor(
+                    None, loader.generate_pr_embeddings, batch, batch_size, repo
+                )
+                for embedded_pr in batch:
+                    results[embedded_pr.number] = (embedded_pr.body or "", embeddings.get(embedded_pr.number))
+            except Exception as e:
+                # Keep draining the queue so collection never blocks;
+                # PRs missing from the results are embedded after collection
+                print(f"   ⚠️  Embedding batch failed, will retry after collection: {e}")
+            batch = []
+
+        if pr is None:
+            return results
+
+
+async def collect_all(
+    collector: GitHubCollector,
+    args: argparse.Namespace,
+    start_date: datetime,
+    end_date: datetime,
+    loader: Optional[BigQueryLoader] = None
+) -> Tuple[Dict[str, List[PullRequest]], Dict[int, Tuple[str, Optional[List[float]]]]]:
+    """
+    Collect merged and/or open PRs concurrently over one shared connection pool.
+
+    If a loader is given, PR bodies are embedded while collection is still
+    running (see embed_from_queue).
+
+    Args:
+        collector: Initialized GitHubCollector
+        args: Parsed command line arguments
+        start_date: Start of the collection window
+        end_date: End of the collection window (exclusive)
+        loader: Optional BigQueryLoader for pipelined embedding
+
+    Returns:
+        Tuple of (dict mapping "merged"/"open" to the PRs collected for that
+        state, dict mapping PR number to (embedded body, embedding))
+    """
+    # PRs, reviews and labels come from GraphQL (one request per 100 PRs);
+    # only file patches still need per-PR REST calls
+    fetches = {}
+    # Bounded so collection can't run arbitrarily far ahead of embedding
+    pr_queue = asyncio.Queue(maxsize=200) if loader else None
+    connector = aiohttp.TCPConnector(limit=20)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        # Don't start a collection we already know would run out of budget
+        await collector.rate_limiter.wait_if_needed_async(min_remaining=50, resource='graphql')
+        await collector.rate_limiter.wait_if_needed_async(min_remaining=50, resource='core')
+
+        if args.state in ('all', 'merged', 'closed'):
+            fetches['merged'] = collector.get_prs_graphql_async(
+                session,
+                since=start_date,
+                until=end_date,
+                state='merged',
+                pr_queue=pr_queue
+            )
+        if args.state in ('all', 'open'):
+            fetches['open'] = collector.get_prs_graphql_async(
+                session,
+                since=start_date,
+                until=end_date,
+                state='open',
+                pr_queue=pr_queue
+            )
+
+        embed_task = None
+        if loader:
+            embed_task = asyncio.ensure_future(embed_from_queue(loader, collector.repository, pr_queue))
+
+        try:
+            results = await asyncio.gather(*fetches.values())
+            embedded = {}
+            if embed_task:
+                await pr_queue.put(None)
+                embedded = await embed_task
+        finally:
+            if embed_task and not embed_task.done():
+                embed_task.cancel()
+
+    return dict(zip(fetches.keys(), results)), embedded
+
+
 def main():
     args = parse_args()
 
@@ -128,9 +262,9 @@ def main():
         start_date = end_date - timedelta(days=args.days)
         print(f"Date Range: Last {args.days} days")
     else:
-        start_date = datetime.strptime(args.start_date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+        start_date = datetime.fromisoformat(args.start_date).replace(tzinfo=timezone.utc)
         if args.end_date:
-            end_date = datetime.strptime(args.end_date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+            end_date = datetime.fromisoformat(args.end_date).replace(tzinfo=timezone.utc)
             # Make end_date exclusive by adding 1 day
             # This makes date ranges intuitive: 2025-01-01 to 2025-01-01 = entire day
             end_date = end_date + timedelta(days=1)
@@ -145,47 +279,73 @@ def main():
 
     # Initialize collector
     print("\n1️⃣  Initializing GitHub collector...")
+    # ETag cache makes re-runs over the same range mostly 304s (free against the rate limit)
     collector = GitHubCollector(
         token=github_token,
-        repository=repo
+        repository=repo,
+        etag_cache=True,
+        cache_format=args.cache_format
     )
 
+    # Seed rate limit budgets from GitHub rather than assuming a full quota
+    try:
+        limiter = collector.refresh_rate_limit()
+        print(f"   GitHub rate limit: {limiter.remaining('core')} REST / "
+              f"{limiter.remaining('graphql')} GraphQL calls remaining")
+    except Exception as e:
+        print(f"   ⚠️  Could not read GitHub rate limit: {e}")
+
     # Collect PRs
     print(f"\n2️⃣  Collecting PRs (state={args.state})...")
     print(f"   This may take a while for large date ranges...")
 
-    all_prs = []
+    # Keyed by PR number: a PR merged mid-run can show up in both fetches
+    prs_by_number: Dict[int, PullRequest] = {}
+    raw_count = 0
 
-    try:
-        if args.state == 'all' or args.state == 'merged':
-            # Collect merged PRs
-            print(f"\n   Fetching merged PRs...")
-            merged_prs = collector.get_merged_prs(
-                since=start_date,
-                until=end_date
-            )
-            print(f"   ✓ Found {len(merged_prs)} merged PRs")
-            all_prs.extend(merged_prs)
-
-        if args.state == 'all' or args.state == 'open':
-            # Collect open PRs
-            print(f"\n   Fetching open PRs...")
-            open_prs = collector.get_open_prs(limit=100)
-            print(f"   ✓ Found {len(open_prs)} open PRs")
-            all_prs.extend(open_prs)
+    def add_prs(prs: List[PullRequest]) -> None:
+        """Add PRs, keeping the most recently updated copy of each number."""
+        nonlocal raw_count
+        raw_count += len(prs)
+        for pr in prs:
+            existing = prs_by_number.get(pr.number)
+            if existing is None or pr.updated_at >= existing.updated_at:
+                prs_by_number[pr.number] = pr
 
+    try:
         if args.state == 'closed':
             print(f"\n   ⚠️  'closed' state not directly supported by collector")
             print(f"   Fetching merged PRs instead...")
-            merged_prs = collector.get_merged_prs(
-                since=start_date,
-                until=end_date
+
+        # Loader is created up front so PR bodies can be embedded during collection
+        loader = None
+        if not args.dry_run:
+            loader = BigQueryLoader(
+                project_id=bq_project,
+                dataset_id=bq_dataset
             )
-            # Note: This gets merged PRs, which are technically closed
-            print(f"   ✓ Found {len(merged_prs)} merged (closed) PRs")
-            all_prs.extend(merged_prs)
 
-        print(f"\n   📊 Total PRs collected: {len(all_prs)}")
+        # Merged and open PRs (and their files/reviews) are fetched concurrently
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        collected, embedded = asyncio.run(collect_all(collector, args, start_date, end_date, loader))
+
+        if 'merged' in collected:
+            merged_prs = collected['merged']
+            if args.state == 'closed':
+                # Note: This gets merged PRs, which are technically closed
+                print(f"   ✓ Found {len(merged_prs)} merged (closed) PRs")
+            else:
+                print(f"   ✓ Found {len(merged_prs)} merged PRs")
+            add_prs(merged_prs)
+
+        if 'open' in collected:
+            open_prs = collected['open']
+            print(f"   ✓ Found {len(open_prs)} open PRs")
+            add_prs(open_prs)
+
+        all_prs = list(prs_by_number.values())
+        print(f"\n   📊 Total PRs collected: {len(all_prs)} ({raw_count} before deduplication)")
 
         if not all_prs:
             print("\n   ⚠️  No PRs found in date range")
@@ -213,20 +373,28 @@ def main():
         print(f"   Would have loaded {len(all_prs)} PRs")
     else:
         print("\n3️⃣  Loading to BigQuery...")
-        print("   Generating embeddings and inserting data...")
+        print("   Inserting data...")
         print("   This will take several minutes...")
 
         try:
-            loader = BigQueryLoader(
-                project_id=bq_project,
-                dataset_id=bq_dataset
-            )
+            # PR bodies were embedded during collection; only embed PRs that
+            # were missed or whose kept copy has a different body after dedup
+            pr_embeddings = {number: embedding for number, (_, embedding) in embedded.items()}
+            stale_prs = [
+                pr for pr in all_prs
+                if pr.number not in embedded or embedded[pr.number][0] != (pr.body or "")
+            ]
+            if stale_prs:
+                pr_embeddings.update(loader.generate_pr_embeddings(stale_prs, batch_size=64, repo_name=repo))
 
             # Load PRs with embeddings (also loads reviews, files, labels)
-            # Uses MERGE to handle both inserts and updates
+            # Stages each table with one Parquet load, then runs the four
+            # MERGEs concurrently to handle both inserts and updates
             stats = loader.load_pull_requests(
                 repo_name=repo,
-                pull_requests=all_prs
+                pull_requests=all_prs,
+                pr_embeddings=pr_embeddings,
+                staging_mode="parquet_merge"
             )
             print(f"   ✓ Upserted {stats.get('prs_upserted', 0)} PRs (inserted new + updated existing)")
             print(f"   ✓ Loaded {stats.get('reviews', 0)} reviews")
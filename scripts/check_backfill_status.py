@@ -2,10 +2,12 @@
 """
 Check the status of BigQuery tables after backfill.
 
-Shows row counts and sample data from each table.
+Shows row counts (from table metadata) and sample data from each table.
 """
 
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from google.cloud import bigquery
 
@@ -16,6 +18,63 @@ BQ_PROJECT_ID = os.getenv("BQ_PROJECT_ID", "mozdata-nonprod")
 BQ_DATASET_ID = os.getenv("BQ_DATASET_ID", "analysis")
 TABLE_PREFIX = os.getenv("TABLE_PREFIX", "gkabbz_gh")
 
+# Recent-entries query for each table
+SAMPLE_QUERIES = {
+    "PRs": """
+    SELECT number, title, author, state, created_at
+    FROM `{table}`
+    ORDER BY created_at DESC
+    LIMIT 5
+    """,
+    "Reviews": """
+    SELECT pr_number, reviewer, state, submitted_at
+    FROM `{table}`
+    ORDER BY submitted_at DESC
+    LIMIT 5
+    """,
+    "Files": """
+    SELECT pr_number, filename, status, additions, deletions
+    FROM `{table}`
+    ORDER BY pr_number DESC
+    LIMIT 5
+    """,
+    "Labels": """
+    SELECT pr_number, name as label
+    FROM `{table}`
+    ORDER BY pr_number DESC
+    LIMIT 5
+    """,
+}
+
+
+def fetch_row_counts(client: bigquery.Client, table_ids: list) -> dict:
+    """
+    Fetch row counts for several tables in one query.
+
+    Reads table metadata from __TABLES__, so no table data is scanned.
+    Tables that don't exist are missing from the result.
+    """
+    query = f"""
+    SELECT table_id, row_count
+    FROM `{BQ_PROJECT_ID}.{BQ_DATASET_ID}.__TABLES__`
+    WHERE table_id IN UNNEST(@table_ids)
+    """
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ArrayQueryParameter("table_ids", "STRING", table_ids)
+        ]
+    )
+    return {row.table_id: row.row_count for row in client.query(query, job_config=job_config).result()}
+
+
+def fetch_samples(client: bigquery.Client, name: str, full_table: str) -> dict:
+    """Fetch the most recent entries for one table."""
+    try:
+        samples = list(client.query(SAMPLE_QUERIES[name].format(table=full_table)).result())
+        return {"samples": samples, "error": None}
+    except Exception as e:
+        return {"samples": [], "error": e}
+
 
 def main():
     print("\n📊 BigQuery Table Status Check")
@@ -30,66 +89,51 @@ def main():
         "Labels": f"{TABLE_PREFIX}_labels",
     }
 
-    for name, table_name in tables.items():
-        full_table = f"{BQ_PROJECT_ID}.{BQ_DATASET_ID}.{table_name}"
+    # Row counts come from one metadata query; samples are queried concurrently
+    with ThreadPoolExecutor(max_workers=len(tables) + 1) as executor:
+        counts_future = executor.submit(fetch_row_counts, client, list(tables.values()))
+        futures = {
+            name: executor.submit(
+                fetch_samples,
+                client,
+                name,
+                f"{BQ_PROJECT_ID}.{BQ_DATASET_ID}.{table_name}"
+            )
+            for name, table_name in tables.items()
+        }
+        statuses = {name: future.result() for name, future in futures.items()}
+        try:
+            counts = counts_future.result()
+        except Exception as e:
+            print(f"\n❌ Error reading row counts: {e}")
+            counts = {}
 
-        print(f"\n{name} Table: {table_name}")
-        print("-" * 60)
+    # Build each table's report and write it in one go
+    for name, table_name in tables.items():
+        status = statuses[name]
+        lines = [f"\n{name} Table: {table_name}", "-" * 60]
 
-        try:
-            # Get row count
-            query = f"SELECT COUNT(*) as count FROM `{full_table}`"
-            result = list(client.query(query).result())
-            count = result[0].count
+        if status["error"]:
+            lines.append(f"  ❌ Error: {status['error']}")
+            sys.stdout.write("\n".join(lines) + "\n")
+            continue
 
-            print(f"  Total rows: {count:,}")
+        count = counts.get(table_name, 0)
+        lines.append(f"  Total rows: {count:,}")
 
-            if count > 0:
-                # Get recent entries
+        if status["samples"]:
+            lines.append("  Recent entries:")
+            for row in status["samples"]:
                 if name == "PRs":
-                    query = f"""
-                    SELECT number, title, author, state, created_at
-                    FROM `{full_table}`
-                    ORDER BY created_at DESC
-                    LIMIT 5
-                    """
+                    lines.append(f"    PR #{row.number}: {row.title[:50]}... by {row.author}")
                 elif name == "Reviews":
-                    query = f"""
-                    SELECT pr_number, reviewer, state, submitted_at
-                    FROM `{full_table}`
-                    ORDER BY submitted_at DESC
-                    LIMIT 5
-                    """
+                    lines.append(f"    PR #{row.pr_number}: Reviewed by {row.reviewer} ({row.state})")
                 elif name == "Files":
-                    query = f"""
-                    SELECT pr_number, filename, status, additions, deletions
-                    FROM `{full_table}`
-                    ORDER BY pr_number DESC
-                    LIMIT 5
-                    """
+                    lines.append(f"    PR #{row.pr_number}: {row.filename} (+{row.additions}/-{row.deletions})")
                 elif name == "Labels":
-                    query = f"""
-                    SELECT pr_number, name as label
-                    FROM `{full_table}`
-                    ORDER BY pr_number DESC
-                    LIMIT 5
-                    """
-
-                results = list(client.query(query).result())
-
-                print(f"  Recent entries:")
-                for row in results:
-                    if name == "PRs":
-                        print(f"    PR #{row.number}: {row.title[:50]}... by {row.author}")
-                    elif name == "Reviews":
-                        print(f"    PR #{row.pr_number}: Reviewed by {row.reviewer} ({row.state})")
-                    elif name == "Files":
-                        print(f"    PR #{row.pr_number}: {row.filename} (+{row.additions}/-{row.deletions})")
-                    elif name == "Labels":
-                        print(f"    PR #{row.pr_number}: {row.label}")
+                    lines.append(f"    PR #{row.pr_number}: {row.label}")
 
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     print("\n" + "=" * 60)
     print("✅ Status check complete!")
@@ -17,15 +17,24 @@ Note: This is MVP code. For production, consider:
 
 import argparse
 import csv
+import gzip
+import io
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Iterable, Iterator, Tuple
 
+import orjson
 from dotenv import load_dotenv
 from google.cloud import bigquery
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Fall back to gzip NDJSON uploads
+    pa = None
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -56,16 +65,19 @@ def parse_args():
     return parser.parse_args()
 
 
-def validate_csv(csv_path: str, verbose: bool = False) -> List[Dict[str, str]]:
+def iter_valid_rows(csv_path: str, verbose: bool = False) -> Iterator[Dict[str, str]]:
     """
-    Validate CSV file and return rows.
+    Validate CSV file and yield rows one at a time.
+
+    Validation is lazy: errors are raised when the offending row is reached,
+    so callers should finish consuming the rows before acting on them.
 
     Args:
         csv_path: Path to CSV file
         verbose: Print detailed validation info
 
-    Returns:
-        List of row dictionaries
+    Yields:
+        Row dictionaries
 
     Raises:
         ValueError: If CSV is invalid
@@ -73,7 +85,7 @@ def validate_csv(csv_path: str, verbose: bool = False) -> List[Dict[str, str]]:
     if not os.path.exists(csv_path):
         raise ValueError(f"CSV file not found: {csv_path}")
 
-    rows = []
+    row_count = 0
     required_columns = {'github_login', 'display_name', 'team'}
 
     with open(csv_path, 'r') as f:
@@ -99,23 +111,114 @@ def validate_csv(csv_path: str, verbose: bool = False) -> List[Dict[str, str]]:
             if not row['team']:
                 row['team'] = None
 
-            rows.append(row)
-
             if verbose:
                 print(f"  ✓ Row {i}: {row['github_login']} → {row['display_name']} ({row['team'] or 'No team'})")
 
-    if not rows:
+            row_count += 1
+            yield row
+
+    if not row_count:
         raise ValueError("CSV has no data rows")
 
-    return rows
 
+USERS_SCHEMA = [
+    bigquery.SchemaField("github_login", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("display_name", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("team", "STRING", mode="NULLABLE"),
+    bigquery.SchemaField("last_updated", "TIMESTAMP", mode="REQUIRED"),
+]
+
+
+def _users_to_parquet(rows: Iterable[Dict[str, str]]) -> Tuple[io.BytesIO, int]:
+    """
+    Build a Parquet upload buffer from user rows via a columnar Arrow table.
+
+    Returns:
+        Tuple of (buffer positioned at start, row count)
+    """
+    logins, names, teams = [], [], []
+    for row in rows:
+        logins.append(row['github_login'])
+        names.append(row['display_name'])
+        teams.append(row['team'])
+
+    # Non-nullable fields keep the Parquet schema in line with the REQUIRED columns
+    schema = pa.schema([
+        pa.field('github_login', pa.string(), nullable=False),
+        pa.field('display_name', pa.string(), nullable=False),
+        pa.field('team', pa.string()),
+        pa.field('last_updated', pa.timestamp('us', tz='UTC'), nullable=False),
+    ])
+    now = datetime.now(timezone.utc)
+    table = pa.table({
+        'github_login': logins,
+        'display_name': names,
+        'team': teams,
+        'last_updated': [now] * len(logins),
+    }, schema=schema)
+
+    buf = io.BytesIO()
+    pq.write_table(table, buf)
+    buf.seek(0)
+    return buf, len(logins)
+
+
+def _users_to_ndjson(rows: Iterable[Dict[str, str]]) -> Tuple[io.BytesIO, int]:
+    """
+    Build a gzip-compressed NDJSON upload buffer from user rows.
+
+    BigQuery detects gzip compression on upload.
+
+    Returns:
+        Tuple of (buffer positioned at start, row count)
+    """
+    current_time = datetime.utcnow().isoformat()
+    row_count = 0
+
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode='wb') as gz:
+        for row in rows:
+            gz.write(orjson.dumps({
+                'github_login': row['github_login'],
+                'display_name': row['display_name'],
+                'team': row['team'],
+                'last_updated': current_time
+            }))
+            gz.write(b"\n")
+            row_count += 1
+    buf.seek(0)
+    return buf, row_count
+
+
+def build_upload(rows: Iterable[Dict[str, str]]) -> Tuple[io.BytesIO, int, str]:
+    """
+    Serialize user rows into an upload buffer.
 
-def load_to_bigquery(rows: List[Dict[str, str]], verbose: bool = False):
+    Uses Parquet when pyarrow is installed, otherwise gzip-compressed NDJSON.
+    Rows are serialized as they are consumed, so validation errors from
+    iter_valid_rows() surface here, before BigQuery is contacted.
+
+    Args:
+        rows: User dictionaries (e.g. from iter_valid_rows())
+
+    Returns:
+        Tuple of (buffer positioned at start, row count, BigQuery source format)
+    """
+    if pa is not None:
+        buf, row_count = _users_to_parquet(rows)
+        return buf, row_count, bigquery.SourceFormat.PARQUET
+    buf, row_count = _users_to_ndjson(rows)
+    return buf, row_count, bigquery.SourceFormat.NEWLINE_DELIMITED_JSON
+
+
+def load_to_bigquery(buf: io.BytesIO, row_count: int, source_format: str, verbose: bool = False):
     """
     Load user data to BigQuery using MERGE for idempotency.
 
     Args:
-        rows: List of user dictionaries
+        buf: Upload buffer from build_upload()
+        row_count: Number of users in the buffer
+        source_format: BigQuery source format of the buffer
         verbose: Print detailed progress
     """
     # Get BigQuery configuration
@@ -127,7 +230,6 @@ def load_to_bigquery(rows: List[Dict[str, str]], verbose: bool = False):
 
     if verbose:
         print(f"\n  Target table: {table_id}")
-        print(f"  Loading {len(rows)} users...")
 
     # Initialize client
     client = bigquery.Client(project=project_id)
@@ -139,37 +241,21 @@ def load_to_bigquery(rows: List[Dict[str, str]], verbose: bool = False):
     # Load data to staging table
     print(f"\n  1. Loading to staging table...")
 
-    # Convert rows to BigQuery format
-    bq_rows = []
-    current_time = datetime.utcnow().isoformat()
-
-    for row in rows:
-        bq_rows.append({
-            'github_login': row['github_login'],
-            'display_name': row['display_name'],
-            'team': row['team'],
-            'last_updated': current_time
-        })
-
     # Load to staging table
     job_config = bigquery.LoadJobConfig(
-        schema=[
-            bigquery.SchemaField("github_login", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("display_name", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("team", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("last_updated", "TIMESTAMP", mode="REQUIRED"),
-        ],
+        schema=USERS_SCHEMA,
+        source_format=source_format,
         write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,
     )
 
-    job = client.load_table_from_json(
-        bq_rows,
+    job = client.load_table_from_file(
+        buf,
         staging_table_id,
         job_config=job_config
     )
     job.result()  # Wait for completion
 
-    print(f"  ✓ Loaded {len(bq_rows)} rows to staging")
+    print(f"  ✓ Loaded {row_count} rows to staging")
 
     # MERGE from staging to production
     print(f"\n  2. Merging to production table...")
@@ -200,7 +286,7 @@ def load_to_bigquery(rows: List[Dict[str, str]], verbose: bool = False):
     client.delete_table(staging_table_id)
     print(f"  ✓ Staging table deleted")
 
-    print(f"\n✅ Successfully loaded {len(rows)} users to {table_id}")
+    print(f"\n✅ Successfully loaded {row_count} users to {table_id}")
 
 
 def main():
@@ -211,17 +297,19 @@ def main():
     print("=" * 60)
 
     try:
-        # Validate CSV
+        # Validate CSV: rows are validated as they are serialized into the
+        # upload buffer, so the whole file is checked before BigQuery is used
         print(f"\n  Validating CSV: {args.csv_path}")
-        rows = validate_csv(args.csv_path, verbose=args.verbose)
-        print(f"  ✓ CSV valid: {len(rows)} users")
+        rows = iter_valid_rows(args.csv_path, verbose=args.verbose)
+        buf, user_count, source_format = build_upload(rows)
+        print(f"  ✓ CSV valid: {user_count} users")
 
         if args.dry_run:
             print("\n  🔍 Dry run - not loading to BigQuery")
             return
 
         # Load to BigQuery
-        load_to_bigquery(rows, verbose=args.verbose)
+        load_to_bigquery(buf, user_count, source_format, verbose=args.verbose)
 
     except ValueError as e:
         print(f"\n❌ Validation Error: {e}")
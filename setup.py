@@ -50,6 +50,10 @@ setup(
             "black>=23.0.0",
             "flake8>=6.0.0",
         ],
+        "fast": [
+            "ciso8601>=2.3.0",
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+        ],
     },
     entry_points={
         "console_scripts": [
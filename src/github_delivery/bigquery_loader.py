@@ -5,12 +5,320 @@ This module loads GitHub PR data into BigQuery tables with vector embeddings
 for semantic search capabilities.
 """
 
-from typing import List, Optional, Dict, Any
+import gzip
+import hashlib
+import itertools
+import json
+import tempfile
+import threading
+import time
+import uuid
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Callable, List, Optional, Dict, Any, Iterable, Tuple
 from datetime import datetime, timezone
+from google.api_core import exceptions as api_exceptions
 from google.cloud import bigquery
+from google.cloud.bigquery.format_options import ParquetOptions
 from .models import PullRequest, Review, FileStat, Label
 from .embeddings import EmbeddingGenerator
 
+try:
+    import msgspec
+    _MSGSPEC_ENCODER = msgspec.json.Encoder()
+except ImportError:  # Fall back to per-row orjson/json encoding
+    _MSGSPEC_ENCODER = None
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library encoder
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet staging is optional; JSON loads work without it
+    pa = None
+
+# Column-oriented batch of rows: column name -> list of values (one per row)
+Columns = Dict[str, List[Any]]
+
+# Process-wide table metadata cache: table ID -> (expiry, Table).
+# Shared by every BigQueryLoader so repeated loaders skip tables.get calls.
+_TABLE_CACHE: Dict[str, Tuple[float, bigquery.Table]] = {}
+_TABLE_CACHE_TTL = 300  # seconds
+_TABLE_CACHE_LOCK = threading.Lock()
+
+# How long a loader reuses the existing-record sets it queried for a repo
+_EXISTING_CACHE_TTL = 300  # seconds
+
+# Most PRs load_pull_requests embeds and upserts in one pass; larger
+# batches are split so their review and patch embeddings aren't all held
+# in memory at once
+_LOAD_CHUNK_PRS = 1000
+
+# Errors worth retrying an upsert for (rate limits and BigQuery-side 5xx)
+_TRANSIENT_ERRORS = (
+    api_exceptions.TooManyRequests,
+    api_exceptions.InternalServerError,
+    api_exceptions.BadGateway,
+    api_exceptions.ServiceUnavailable,
+    api_exceptions.GatewayTimeout,
+)
+
+
+def _get_table_cached(client: bigquery.Client, table_id: str) -> bigquery.Table:
+    """
+    Get table metadata, reusing a lookup from the last _TABLE_CACHE_TTL seconds.
+
+    Failed lookups (e.g. table not found) are not cached.
+
+    Args:
+        client: BigQuery client
+        table_id: Fully qualified table ID
+
+    Returns:
+        bigquery.Table with schema and partitioning info
+    """
+    with _TABLE_CACHE_LOCK:
+        cached = _TABLE_CACHE.get(table_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+    table = client.get_table(table_id)
+    _cache_table(table_id, table)
+    return table
+
+
+def _cache_table(table_id: str, table: bigquery.Table) -> None:
+    """Store table metadata in the process-wide cache."""
+    with _TABLE_CACHE_LOCK:
+        _TABLE_CACHE[table_id] = (time.monotonic() + _TABLE_CACHE_TTL, table)
+
+
+def _column_count(columns: Columns) -> int:
+    """Get the number of rows in a column-oriented batch."""
+    return len(next(iter(columns.values()))) if columns else 0
+
+
+def _json_default(value: Any) -> str:
+    """Encode datetimes for the standard library JSON encoder."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Rows encoded per gzip write when writing NDJSON
+_NDJSON_CHUNK_ROWS = 500
+
+# Encoded load files larger than this spill from memory to a temporary file
+_LOAD_SPOOL_BYTES = 64 * 1024 * 1024
+
+
+def _write_ndjson_gzip(columns: Columns, fileobj: BinaryIO) -> None:
+    """
+    Write column-oriented rows as gzip-compressed newline-delimited JSON.
+
+    Embedding vectors make rows large and highly compressible, so gzip cuts
+    the upload several-fold. BigQuery detects the compression on load.
+    Datetime values are encoded by the JSON encoder itself (msgspec and orjson
+    do this natively), so the row builders never format timestamps. Rows are
+    built and encoded a chunk at a time, so only the compressed output grows
+    with the batch.
+
+    Args:
+        columns: Dict mapping column name to that column's values
+        fileobj: Binary file object to write to (left open)
+    """
+    names = list(columns)
+    rows = (dict(zip(names, values)) for values in zip(*columns.values()))
+    with gzip.GzipFile(fileobj=fileobj, mode='wb') as gz:
+        if _MSGSPEC_ENCODER is not None:
+            # One C call per chunk of rows, newlines included
+            while True:
+                chunk = list(itertools.islice(rows, _NDJSON_CHUNK_ROWS))
+                if not chunk:
+                    break
+                gz.write(_MSGSPEC_ENCODER.encode_lines(chunk))
+        elif orjson is not None:
+            # BigQuery reads offset-less timestamps as UTC, so say so; numpy
+            # arrays (e.g. embedding vectors) encode without a tolist() copy
+            options = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+            while True:
+                chunk = list(itertools.islice(rows, _NDJSON_CHUNK_ROWS))
+                if not chunk:
+                    break
+                gz.write(b"".join(orjson.dumps(row, option=options) for row in chunk))
+        else:
+            for row in rows:
+                gz.write(json.dumps(row, default=_json_default).encode('utf-8'))
+                gz.write(b"\n")
+
+
+# BigQuery column type -> Arrow type for Parquet staging files
+_ARROW_TYPES = {
+    "STRING": "string",
+    "INTEGER": "int64",
+    "INT64": "int64",
+    "FLOAT": "float64",
+    "FLOAT64": "float64",
+    "BOOLEAN": "bool",
+    "BOOL": "bool",
+    "TIMESTAMP": "timestamp",
+}
+
+
+# Rows per Parquet row group; each group is encoded and uploaded in turn
+_PARQUET_ROW_GROUP_ROWS = 1000
+
+
+def _write_parquet(columns: Columns, schema: List[bigquery.SchemaField], fileobj: BinaryIO) -> None:
+    """
+    Write column-oriented rows as Parquet matching a table schema.
+
+    Each column slice becomes one Arrow array, so there is no per-row work.
+    Timestamp columns hold timezone-aware datetimes, which Arrow converts in a
+    single pass without going through strings. Repeated FLOAT columns (the
+    embedding vectors) are written as list<float32>: the model's native
+    precision, half the bytes of text floats, and parsed without any text
+    conversion on the BigQuery side. Rows are written a row group at a time,
+    so only the encoded output grows with the batch.
+
+    Args:
+        columns: Dict mapping column name to that column's values
+        schema: BigQuery schema of the destination table (columns missing
+            from the batch are written as NULL)
+        fileobj: Binary file object to write to (left open)
+    """
+    row_count = _column_count(columns)
+    fields = []
+    for schema_field in schema:
+        type_name = _ARROW_TYPES.get(schema_field.field_type, "string")
+        if type_name == "timestamp":
+            arrow_type = pa.timestamp("us", tz="UTC")
+        else:
+            arrow_type = pa.type_for_alias(type_name)
+
+        if schema_field.mode == "REPEATED":
+            if type_name == "float64":
+                arrow_type = pa.float32()
+            arrow_type = pa.list_(arrow_type)
+
+        # REQUIRED columns must be non-nullable or BigQuery rejects the load
+        fields.append(pa.field(schema_field.name, arrow_type, nullable=schema_field.mode != "REQUIRED"))
+    arrow_schema = pa.schema(fields)
+
+    # Embedding values are effectively unique floats: dictionary encoding and
+    # min/max statistics on them cost write time and only add bytes
+    scalar_columns = [schema_field.name for schema_field in schema if schema_field.mode != "REPEATED"]
+    with pq.ParquetWriter(
+        fileobj,
+        arrow_schema,
+        compression="snappy",
+        use_dictionary=scalar_columns,
+        write_statistics=scalar_columns
+    ) as writer:
+        for start in range(0, max(row_count, 1), _PARQUET_ROW_GROUP_ROWS):
+            end = min(start + _PARQUET_ROW_GROUP_ROWS, row_count)
+            arrays = [
+                pa.array(columns[field.name][start:end] if field.name in columns else [None] * (end - start),
+                         type=field.type)
+                for field in arrow_schema
+            ]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=arrow_schema))
+
+
+# How each table is upserted from its staging table: the MERGE key, the
+# columns a match overwrites, and (for partitioned tables) the partition
+# column used to prune the target. Every MERGE is generated from these.
+_UpsertSpec = namedtuple("_UpsertSpec", ["label", "key_cols", "update_cols", "partition_col"])
+
+_UPSERT_SPECS = {
+    "prs": _UpsertSpec(
+        "PRs",
+        ("repo_name", "number"),
+        ("title", "body", "body_embedding", "state", "author", "html_url",
+         "created_at", "updated_at", "merged_at", "closed_at",
+         "base_branch", "head_branch", "additions", "deletions", "changed_files", "draft", "cached_at"),
+        "merged_at",
+    ),
+    "reviews": _UpsertSpec(
+        "reviews",
+        ("repo_name", "review_id"),
+        ("pr_number", "reviewer", "state", "body", "body_embedding", "submitted_at", "html_url", "cached_at"),
+        "submitted_at",
+    ),
+    "files": _UpsertSpec(
+        "file changes",
+        ("repo_name", "pr_number", "filename"),
+        ("additions", "deletions", "status", "patch", "patch_embedding", "patch_truncated", "cached_at"),
+        None,
+    ),
+    "labels": _UpsertSpec(
+        "labels",
+        ("repo_name", "pr_number", "label_name"),
+        ("label_color", "label_description"),
+        None,
+    ),
+}
+
+
+def _merge_sql(spec: _UpsertSpec, target: str, staging: str) -> str:
+    """
+    Generate the staging -> production MERGE for an upsert spec.
+
+    Staging tables belong to one loader, are truncated on every load and
+    hold a batch deduplicated in Python, so staging is read whole: it only
+    holds the current repository's batch, each row already unique on the
+    key. The repository is bound as @repo_name, filtering the target side
+    where it prunes clustered blocks. Partitioned tables also bound the
+    target by the batch's @min_/@max_ partition column; the partition column
+    is set once (merged_at, submitted_at), so an existing row is either still
+    NULL or already inside the batch's range.
+
+    Args:
+        spec: Upsert spec for the table
+        target: Fully qualified production table ID
+        staging: Fully qualified staging table ID
+
+    Returns:
+        MERGE statement taking @repo_name (and partition range) parameters
+    """
+    conditions = ["T.repo_name = @repo_name"] + [f"T.{col} = S.{col}" for col in spec.key_cols]
+    if spec.partition_col:
+        col = spec.partition_col
+        conditions.append(f"(T.{col} IS NULL OR T.{col} BETWEEN @min_{col} AND @max_{col})")
+    columns = spec.key_cols + spec.update_cols
+
+    return f"""
+MERGE `{target}` T
+USING `{staging}` S
+ON {" AND ".join(conditions)}
+WHEN MATCHED THEN
+    UPDATE SET {", ".join(f"{col} = S.{col}" for col in spec.update_cols)}
+WHEN NOT MATCHED THEN
+    INSERT ({", ".join(columns)})
+    VALUES ({", ".join(f"S.{col}" for col in columns)})
+"""
+
+
+def _range_parameters(field: str, values: List[Optional[datetime]]) -> List[bigquery.ScalarQueryParameter]:
+    """
+    Build @min_<field>/@max_<field> TIMESTAMP parameters for a batch.
+
+    Args:
+        field: Partition column name
+        values: The column's values in the batch (None values are ignored)
+
+    Returns:
+        Two query parameters (NULL bounds if the batch has no values)
+    """
+    present = [value for value in values if value is not None]
+    return [
+        bigquery.ScalarQueryParameter(f"min_{field}", "TIMESTAMP", min(present) if present else None),
+        bigquery.ScalarQueryParameter(f"max_{field}", "TIMESTAMP", max(present) if present else None),
+    ]
+
 
 class BigQueryLoader:
     """
@@ -21,6 +329,9 @@ class BigQueryLoader:
     2. Transforming data models into BigQuery row format
     3. Batch loading data into BigQuery tables
 
+    Each loader stages through its own staging tables, so separate loaders can
+    run concurrently; calls on one loader should not overlap.
+
     Example:
         >>> loader = BigQueryLoader(
         ...     project_id="mozdata-nonprod",
@@ -66,14 +377,34 @@ class BigQueryLoader:
         self.files_table = f"{project_id}.{dataset_id}.gkabbz_gh_files"
         self.labels_table = f"{project_id}.{dataset_id}.gkabbz_gh_labels"
 
-        # Staging table references (with 3-day expiration)
-        self.staging_prs_table = f"{project_id}.{dataset_id}.gkabbz_staging_gh_prs"
-        self.staging_reviews_table = f"{project_id}.{dataset_id}.gkabbz_staging_gh_reviews"
-        self.staging_files_table = f"{project_id}.{dataset_id}.gkabbz_staging_gh_files"
-        self.staging_labels_table = f"{project_id}.{dataset_id}.gkabbz_staging_gh_labels"
+        # Staging table references (with 3-day expiration). Each loader gets
+        # its own, so concurrent backfills (e.g. for different repos) can't
+        # truncate each other's staged rows or MERGE them
+        run_id = uuid.uuid4().hex[:12]
+        self.staging_prs_table = f"{project_id}.{dataset_id}.gkabbz_staging_gh_prs_{run_id}"
+        self.staging_reviews_table = f"{project_id}.{dataset_id}.gkabbz_staging_gh_reviews_{run_id}"
+        self.staging_files_table = f"{project_id}.{dataset_id}.gkabbz_staging_gh_files_{run_id}"
+        self.staging_labels_table = f"{project_id}.{dataset_id}.gkabbz_staging_gh_labels_{run_id}"
+
+        # (production, staging) table per upsert kind, and the MERGE for each
+        # (generated once per loader; repo_name is a query parameter)
+        self._upsert_tables = {
+            "prs": (self.prs_table, self.staging_prs_table),
+            "reviews": (self.reviews_table, self.staging_reviews_table),
+            "files": (self.files_table, self.staging_files_table),
+            "labels": (self.labels_table, self.staging_labels_table),
+        }
+        self._merge_sql = {
+            kind: _merge_sql(spec, *self._upsert_tables[kind])
+            for kind, spec in _UPSERT_SPECS.items()
+        }
+
+        # Existing-record sets keyed by (kind, repo_name) -> (expires_at, keys);
+        # loads add their keys so backfills over one repo stay warm
+        self._existing_cache: Dict[Tuple[str, str], Tuple[float, set]] = {}
 
-        # Ensure staging tables exist with 3-day expiration
-        self._ensure_staging_tables_exist()
+        # Staging tables are checked/created on first load, not here
+        self._staging_ready = False
 
         print(f"✓ BigQueryLoader initialized")
         print(f"  BigQuery: {project_id}.{dataset_id}")
@@ -84,6 +415,7 @@ class BigQueryLoader:
         Ensure staging tables exist with 3-day expiration.
 
         Staging tables have the same schema as production tables but:
+        - Are private to this loader (run-specific name suffix)
         - Expire after 3 days (auto-cleanup by BigQuery)
         - Used for batch loading before MERGE to production
         - Allows troubleshooting failed backfills
@@ -100,11 +432,11 @@ class BigQueryLoader:
         for staging_table, prod_table in staging_tables:
             try:
                 # Check if staging table exists
-                self.bq_client.get_table(staging_table)
+                _get_table_cached(self.bq_client, staging_table)
             except Exception:
                 # Table doesn't exist, create it with same schema as production
                 try:
-                    prod_table_ref = self.bq_client.get_table(prod_table)
+                    prod_table_ref = _get_table_cached(self.bq_client, prod_table)
 
                     # Create staging table with same schema
                     staging_table_ref = bigquery.Table(staging_table, schema=prod_table_ref.schema)
@@ -118,31 +450,135 @@ class BigQueryLoader:
                     if prod_table_ref.clustering_fields:
                         staging_table_ref.clustering_fields = prod_table_ref.clustering_fields
 
-                    self.bq_client.create_table(staging_table_ref)
+                    _cache_table(staging_table, self.bq_client.create_table(staging_table_ref))
                     print(f"  Created staging table: {staging_table.split('.')[-1]}")
                 except Exception as e:
                     print(f"  Warning: Could not create staging table {staging_table}: {e}")
 
-    def load_pull_requests(
+    def generate_pr_embeddings(
+        self,
+        pull_requests: List[PullRequest],
+        batch_size: int = 64,
+        repo_name: Optional[str] = None
+    ) -> Dict[int, Optional[List[float]]]:
+        """
+        Generate PR body embeddings for a whole set of PRs in large batches.
+
+        When repo_name is given, embeddings already stored in BigQuery are
+        reused for PRs whose body hasn't changed, so re-running a backfill
+        only embeds new or edited PRs.
+
+        Args:
+            pull_requests: PRs whose bodies should be embedded
+            batch_size: Maximum number of bodies per embedding request
+            repo_name: Repository name used to look up stored embeddings
+
+        Returns:
+            Dict mapping PR number to its body embedding (None if body was empty)
+        """
+        # Empty bodies have no embedding: skip them for both the stored
+        # embedding lookup and the embedding call
+        with_body = [pr for pr in pull_requests if pr.body and pr.body.strip()]
+
+        stored = {}
+        if repo_name and with_body:
+            stored = self._get_stored_pr_embeddings(repo_name, with_body)
+
+        need_embed = [pr for pr in with_body if pr.number not in stored]
+        if stored:
+            print(f"     Reusing {len(stored)} stored embeddings, "
+                  f"generating {len(need_embed)} new")
+
+        pr_embeddings: Dict[int, Optional[List[float]]] = {pr.number: None for pr in pull_requests}
+        pr_embeddings.update(stored)
+        if need_embed:
+            embeddings = self.embedding_gen.generate_batch_embeddings(
+                [pr.body for pr in need_embed], batch_size=batch_size
+            )
+            pr_embeddings.update({pr.number: embedding for pr, embedding in zip(need_embed, embeddings)})
+        return pr_embeddings
+
+    def _get_stored_pr_embeddings(
         self,
         repo_name: str,
         pull_requests: List[PullRequest]
+    ) -> Dict[int, List[float]]:
+        """
+        Query BigQuery for body embeddings that are still valid for these PRs.
+
+        An embedding is only reused if the stored body matches the PR's
+        current body (bodies can be edited after the PR was first loaded).
+        Bodies are compared by SHA-256, so only hashes come back, not the
+        bodies themselves.
+
+        Args:
+            repo_name: Repository name (e.g., 'mozilla/bigquery-etl')
+            pull_requests: PRs about to be loaded
+
+        Returns:
+            Dict mapping PR number to its stored body embedding
+        """
+        query = """
+        SELECT number, TO_HEX(SHA256(IFNULL(body, ''))) AS body_sha256, body_embedding
+        FROM `{table}`
+        WHERE repo_name = @repo_name
+          AND number IN UNNEST(@numbers)
+          AND ARRAY_LENGTH(body_embedding) > 0
+        """.format(table=self.prs_table)
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter("repo_name", "STRING", repo_name),
+                bigquery.ArrayQueryParameter("numbers", "INT64", [pr.number for pr in pull_requests])
+            ]
+        )
+
+        try:
+            results = self.bq_client.query(query, job_config=job_config).result()
+        except Exception as e:
+            # If table doesn't exist yet or query fails, embed everything
+            print(f"     Could not query stored embeddings (table may not exist): {e}")
+            return {}
+
+        current_hashes = {
+            pr.number: hashlib.sha256((pr.body or "").encode("utf-8")).hexdigest()
+            for pr in pull_requests
+        }
+        return {
+            row.number: list(row.body_embedding)
+            for row in results
+            if row.body_sha256 == current_hashes.get(row.number)
+        }
+
+    def load_pull_requests(
+        self,
+        repo_name: str,
+        pull_requests: List[PullRequest],
+        pr_embeddings: Optional[Dict[int, Optional[List[float]]]] = None,
+        staging_mode: str = "parquet_merge"
     ) -> Dict[str, int]:
         """
         Load pull requests with embeddings into BigQuery.
 
         This method:
-        1. Checks for existing PRs and filters to only new ones
-        2. Generates embeddings for new PR bodies only
-        3. Transforms PRs to BigQuery row format
-        4. Loads new PRs into the prs table
-        5. Checks for existing reviews/files/labels and loads only new ones
+        1. Generates embeddings for review bodies and patches in one call,
+           alongside PR bodies (unless precomputed)
+        2. Builds columns for the prs, reviews, files and labels tables
+        3. Upserts the four tables concurrently, each loading its staging
+           table and then MERGEing it into production (see _upsert); each
+           upsert starts as soon as its own embeddings are ready, so labels
+           start before step 1 and PRs overlap the other embeddings
 
         This is idempotent - you can safely re-run with the same date range.
 
         Args:
             repo_name: Repository name (e.g., "mozilla/bigquery-etl")
             pull_requests: List of PullRequest objects to load
+            pr_embeddings: Optional precomputed body embeddings keyed by PR
+                number (see generate_pr_embeddings). Generated here if omitted.
+            staging_mode: "parquet_merge" (default) loads staging tables from
+                Parquet, falling back to gzip NDJSON without pyarrow; "json"
+                always uses gzip NDJSON.
 
         Returns:
             Dict with counts of loaded records:
@@ -159,34 +595,258 @@ class BigQueryLoader:
             print("  ⊘ No pull requests to load")
             return {"prs": 0, "reviews": 0, "files": 0, "labels": 0}
 
+        # Staging only ever holds this batch, so the MERGE needs each PR once:
+        # keep the most recently updated copy of any PR collected twice
+        latest_prs: Dict[int, PullRequest] = {}
+        for pr in pull_requests:
+            current = latest_prs.get(pr.number)
+            if current is None or pr.updated_at >= current.updated_at:
+                latest_prs[pr.number] = pr
+        if len(latest_prs) < len(pull_requests):
+            print(f"  ⊘ Dropped {len(pull_requests) - len(latest_prs)} duplicate PRs from batch")
+            pull_requests = list(latest_prs.values())
+
+        # Embeddings are ~25 KB each as Python lists, so very large batches
+        # are embedded and upserted a slice of PRs at a time to bound memory
+        if len(pull_requests) > _LOAD_CHUNK_PRS:
+            print(f"\n📥 Loading {len(pull_requests)} PRs for {repo_name} "
+                  f"in slices of {_LOAD_CHUNK_PRS}")
+            totals = {"prs_upserted": 0, "reviews": 0, "files": 0, "labels": 0}
+            for start in range(0, len(pull_requests), _LOAD_CHUNK_PRS):
+                chunk_result = self.load_pull_requests(
+                    repo_name,
+                    pull_requests[start:start + _LOAD_CHUNK_PRS],
+                    pr_embeddings,
+                    staging_mode
+                )
+                for key in totals:
+                    totals[key] += chunk_result[key]
+            return totals
+
         print(f"\n📥 Loading {len(pull_requests)} PRs for {repo_name}")
 
-        # Step 1: Generate embeddings for ALL PRs
-        print("  1. Generating PR body embeddings...")
-        pr_bodies = [pr.body or "" for pr in pull_requests]
-        pr_embeddings = self.embedding_gen.generate_batch_embeddings(pr_bodies)
+        # Ensure staging tables exist with 3-day expiration (once per loader)
+        if not self._staging_ready:
+            self._ensure_staging_tables_exist()
+            self._staging_ready = True
 
-        # Step 2: Use MERGE to upsert PRs (handles both INSERT and UPDATE)
-        print("  2. Upserting PRs to BigQuery using MERGE...")
-        cached_at = datetime.now(timezone.utc)
+        # Flatten reviews, files and labels once, keeping their PR number;
+        # the embedding texts and the table columns are both built from these
+        reviews: List[Tuple[int, Review]] = []
+        files: List[Tuple[int, FileStat]] = []
+        labels: List[Tuple[int, Label]] = []
+        for pr in pull_requests:
+            reviews.extend((pr.number, review) for review in pr.reviews)
+            files.extend((pr.number, file_stat) for file_stat in pr.file_stats)
+            labels.extend((pr.number, label) for label in pr.labels)
+        review_bodies = [review.body or "" for _, review in reviews]
+        patches = [file_stat.patch or "" for _, file_stat in files]
+
+        use_parquet = staging_mode == "parquet_merge" and pa is not None
+        if staging_mode == "parquet_merge" and pa is None:
+            print("  ⚠️  pyarrow not installed - staging from JSON instead of Parquet")
 
-        upserted_count = self._merge_prs(repo_name, pull_requests, pr_embeddings, cached_at)
-        print(f"    ✓ Upserted {upserted_count} PRs (inserted new + updated existing)")
+        cached_at = datetime.now(timezone.utc)
 
-        # Step 5: Load related data (reviews, files, labels)
-        # Each method checks for existing records and only loads new ones
-        print("  5. Loading reviews/files/labels...")
-        review_count = self._load_reviews(repo_name, pull_requests)
-        file_count = self._load_files(repo_name, pull_requests)
-        label_count = self._load_labels(repo_name, pull_requests)
+        # Each table is upserted (staging load + MERGE) as soon as its columns
+        # are ready; the tables are independent, so upserts run concurrently
+        with ThreadPoolExecutor(max_workers=4) as upsert_executor:
+            upsert_futures = []
+
+            def submit_upsert(kind: str, columns: Columns):
+                if columns:
+                    upsert_futures.append((kind, upsert_executor.submit(
+                        self._upsert, kind, repo_name, columns, use_parquet
+                    )))
+
+            # Labels need no embeddings, so they load while embeddings generate
+            label_columns = self._build_label_columns(repo_name, labels)
+            submit_upsert("labels", label_columns)
+
+            # Step 1: Generate embeddings. Review bodies and patches go through
+            # one call so they share batches (and deduplication); PR bodies run
+            # alongside it since they reuse embeddings already in BigQuery
+            print(f"  1. Generating embeddings for {len(review_bodies)} review bodies and "
+                  f"{len(patches)} patches" + (" and PR bodies..." if pr_embeddings is None else "..."))
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                pr_future = None
+                if pr_embeddings is None:
+                    pr_future = executor.submit(self.generate_pr_embeddings, pull_requests)
+                text_future = executor.submit(
+                    self.embedding_gen.generate_batch_embeddings, review_bodies + patches, 64
+                )
+
+                # Step 2: Transform to BigQuery columns as embeddings arrive.
+                # PRs upsert while review and patch embeddings are generating
+                print("  2. Preparing rows...")
+                if pr_future is not None:
+                    pr_embeddings = pr_future.result()
+                pr_columns = self._build_pr_columns(repo_name, pull_requests, pr_embeddings, cached_at)
+                submit_upsert("prs", pr_columns)
+
+                text_embeddings = text_future.result()
+            review_embeddings = text_embeddings[:len(review_bodies)]
+            patch_embeddings = text_embeddings[len(review_bodies):]
+
+            review_columns = self._build_review_columns(repo_name, reviews, review_embeddings, cached_at)
+            file_columns = self._build_file_columns(repo_name, files, patch_embeddings, cached_at)
+            submit_upsert("reviews", review_columns)
+            submit_upsert("files", file_columns)
+
+            # Step 3: Wait for every upsert
+            print(f"  3. Upserting {len(upsert_futures)} tables through staging...")
+            for kind, future in upsert_futures:
+                print(f"    ✓ Upserted {future.result()} {_UPSERT_SPECS[kind].label}")
 
         return {
-            "prs_upserted": upserted_count,
-            "reviews": review_count,
-            "files": file_count,
-            "labels": label_count
+            "prs_upserted": _column_count(pr_columns),
+            "reviews": _column_count(review_columns),
+            "files": _column_count(file_columns),
+            "labels": _column_count(label_columns)
         }
 
+    def _upsert(
+        self,
+        kind: str,
+        repo_name: str,
+        columns: Columns,
+        use_parquet: bool = False,
+        max_retries: int = 4
+    ) -> int:
+        """
+        Upsert one table: load its staging table, then MERGE into production.
+
+        Every load goes through the MERGE, even a repository's first: two
+        loaders for the same repository (each with its own staging tables)
+        may run at once, and only the MERGE keeps their rows unique.
+
+        Rate limits and transient BigQuery errors are retried with exponential
+        backoff, so the embeddings already in `columns` aren't thrown away.
+
+        Args:
+            kind: Upsert kind ("prs", "reviews", "files" or "labels")
+            repo_name: Repository name
+            columns: Column-oriented rows for the table
+            use_parquet: Stage as Parquet instead of gzip NDJSON
+            max_retries: Retries after a transient failure
+
+        Returns:
+            Number of rows upserted
+        """
+        spec = _UPSERT_SPECS[kind]
+        _, staging_table = self._upsert_tables[kind]
+
+        for attempt in range(max_retries + 1):
+            try:
+                self._load_columns(columns, staging_table, use_parquet)
+
+                query_parameters = [bigquery.ScalarQueryParameter("repo_name", "STRING", repo_name)]
+                if spec.partition_col:
+                    query_parameters += _range_parameters(spec.partition_col, columns[spec.partition_col])
+                merge_config = bigquery.QueryJobConfig(query_parameters=query_parameters)
+                self.bq_client.query(self._merge_sql[kind], job_config=merge_config).result()
+                break
+            except _TRANSIENT_ERRORS as e:
+                if attempt == max_retries:
+                    raise
+                wait_time = min(2 ** attempt, 30) + 1
+                print(f"    ⚠️  Upserting {spec.label} failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
+                print(f"    Retrying in {wait_time}s...")
+                time.sleep(wait_time)
+
+        # Keep any cached existing-record set in step with what was just loaded
+        key_cols = spec.key_cols[1:]  # Everything but repo_name
+        if len(key_cols) == 1:
+            self._add_existing(kind, repo_name, columns[key_cols[0]])
+        else:
+            self._add_existing(kind, repo_name, zip(*(columns[col] for col in key_cols)))
+
+        return _column_count(columns)
+
+    def _cached_existing(self, kind: str, repo_name: str) -> Optional[set]:
+        """Get a cached existing-record set, or None if missing or expired."""
+        cached = self._existing_cache.get((kind, repo_name))
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        return None
+
+    def _cache_existing(self, kind: str, repo_name: str, keys: set) -> set:
+        """Cache an existing-record set for _EXISTING_CACHE_TTL seconds."""
+        self._existing_cache[(kind, repo_name)] = (time.monotonic() + _EXISTING_CACHE_TTL, keys)
+        return keys
+
+    def _add_existing(self, kind: str, repo_name: str, keys: Iterable[Any]) -> None:
+        """Add newly loaded keys to a cached set (no-op if nothing is cached)."""
+        cached = self._cached_existing(kind, repo_name)
+        if cached is not None:
+            cached.update(keys)
+
+    def _get_all_existing(self, repo_name: str) -> Dict[str, set]:
+        """
+        Query BigQuery for existing PRs, reviews, files and labels in one job.
+
+        Returns the same sets as the four _get_existing_* methods, but with a
+        single UNION ALL query instead of four round-trips. If the combined
+        query fails (e.g. one table doesn't exist yet), falls back to the
+        per-table queries.
+
+        Args:
+            repo_name: Repository name (e.g., 'mozilla/bigquery-etl')
+
+        Returns:
+            Dict with keys "prs", "reviews", "files", "labels" mapping to the
+            sets of existing PR numbers, review IDs, (pr_number, filename)
+            and (pr_number, label_name)
+        """
+        kinds = ("prs", "reviews", "files", "labels")
+        cached = {kind: self._cached_existing(kind, repo_name) for kind in kinds}
+        if all(keys is not None for keys in cached.values()):
+            return cached
+
+        query = """
+        SELECT 'prs' AS kind, number AS num, CAST(NULL AS STRING) AS name
+        FROM `{prs_table}` WHERE repo_name = @repo_name
+        UNION ALL
+        SELECT 'reviews', review_id, NULL
+        FROM `{reviews_table}` WHERE repo_name = @repo_name
+        UNION ALL
+        SELECT 'files', pr_number, filename
+        FROM `{files_table}` WHERE repo_name = @repo_name
+        UNION ALL
+        SELECT 'labels', pr_number, label_name
+        FROM `{labels_table}` WHERE repo_name = @repo_name
+        """.format(
+            prs_table=self.prs_table,
+            reviews_table=self.reviews_table,
+            files_table=self.files_table,
+            labels_table=self.labels_table
+        )
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter("repo_name", "STRING", repo_name)
+            ]
+        )
+
+        try:
+            results = self.bq_client.query(query, job_config=job_config).result()
+        except Exception as e:
+            print(f"     Could not query existing records in one pass ({e}), querying per table")
+            return {
+                "prs": self._get_existing_pr_numbers(repo_name),
+                "reviews": self._get_existing_review_ids(repo_name),
+                "files": self._get_existing_files(repo_name),
+                "labels": self._get_existing_labels(repo_name),
+            }
+
+        existing = {"prs": set(), "reviews": set(), "files": set(), "labels": set()}
+        for row in results:
+            if row.kind in ("prs", "reviews"):
+                existing[row.kind].add(row.num)
+            else:
+                existing[row.kind].add((row.num, row.name))
+        return {kind: self._cache_existing(kind, repo_name, existing[kind]) for kind in kinds}
+
     def _get_existing_pr_numbers(self, repo_name: str) -> set:
         """
         Query BigQuery to get existing PR numbers for a repository.
@@ -197,6 +857,10 @@ class BigQueryLoader:
         Returns:
             Set of existing PR numbers
         """
+        cached = self._cached_existing("prs", repo_name)
+        if cached is not None:
+            return cached
+
         query = """
         SELECT number
         FROM `{table}`
@@ -212,7 +876,7 @@ class BigQueryLoader:
         try:
             results = self.bq_client.query(query, job_config=job_config).result()
             existing_numbers = {row.number for row in results}
-            return existing_numbers
+            return self._cache_existing("prs", repo_name, existing_numbers)
         except Exception as e:
             # If table doesn't exist yet or query fails, return empty set
             print(f"     Could not query existing PRs (table may not exist): {e}")
@@ -228,6 +892,10 @@ class BigQueryLoader:
         Returns:
             Set of existing review IDs
         """
+        cached = self._cached_existing("reviews", repo_name)
+        if cached is not None:
+            return cached
+
         query = """
         SELECT review_id
         FROM `{table}`
@@ -243,7 +911,7 @@ class BigQueryLoader:
         try:
             results = self.bq_client.query(query, job_config=job_config).result()
             existing_ids = {row.review_id for row in results}
-            return existing_ids
+            return self._cache_existing("reviews", repo_name, existing_ids)
         except Exception as e:
             # If table doesn't exist yet or query fails, return empty set
             print(f"     Could not query existing reviews (table may not exist): {e}")
@@ -259,6 +927,10 @@ class BigQueryLoader:
         Returns:
             Set of (pr_number, filename) tuples representing existing file records
         """
+        cached = self._cached_existing("files", repo_name)
+        if cached is not None:
+            return cached
+
         query = """
         SELECT pr_number, filename
         FROM `{table}`
@@ -274,7 +946,7 @@ class BigQueryLoader:
         try:
             results = self.bq_client.query(query, job_config=job_config).result()
             existing_files = {(row.pr_number, row.filename) for row in results}
-            return existing_files
+            return self._cache_existing("files", repo_name, existing_files)
         except Exception as e:
             # If table doesn't exist yet or query fails, return empty set
             print(f"     Could not query existing files (table may not exist): {e}")
@@ -290,6 +962,10 @@ class BigQueryLoader:
         Returns:
             Set of (pr_number, label_name) tuples representing existing label records
         """
+        cached = self._cached_existing("labels", repo_name)
+        if cached is not None:
+            return cached
+
         query = """
         SELECT pr_number, label_name
         FROM `{table}`
@@ -305,493 +981,288 @@ class BigQueryLoader:
         try:
             results = self.bq_client.query(query, job_config=job_config).result()
             existing_labels = {(row.pr_number, row.label_name) for row in results}
-            return existing_labels
+            return self._cache_existing("labels", repo_name, existing_labels)
         except Exception as e:
             # If table doesn't exist yet or query fails, return empty set
             print(f"     Could not query existing labels (table may not exist): {e}")
             return set()
 
-    def _merge_prs(
+    def _load_columns(
         self,
-        repo_name: str,
-        pull_requests: List[PullRequest],
-        embeddings: List[Optional[List[float]]],
-        cached_at: datetime
-    ) -> int:
+        columns: Columns,
+        table_id: str,
+        use_parquet: bool = False
+    ):
         """
-        Upsert PRs to BigQuery using staging table + MERGE pattern.
+        Batch load rows into a staging table, replacing its previous contents.
 
-        This approach avoids streaming buffer conflicts by:
-        1. Loading all PRs to staging table (batch load)
-        2. MERGEing from staging to production (single query with deduplication)
+        Truncating keeps the following MERGE's input to this batch instead of
+        every load since the table's 3-day expiry.
 
         Args:
-            repo_name: Repository name
-            pull_requests: List of PRs to upsert
-            embeddings: List of embeddings (one per PR)
-            cached_at: Timestamp when data was collected
-
-        Returns:
-            Number of PRs upserted
+            columns: Column-oriented rows matching the staging table schema
+            table_id: Fully qualified staging table ID
+            use_parquet: Upload as Parquet instead of gzip-compressed
+                NDJSON (requires pyarrow)
         """
-        if not pull_requests:
-            return 0
-
-        print(f"     Loading {len(pull_requests)} PRs to staging table...")
-
-        # Step 1: Transform PRs to rows
-        pr_rows = []
-        for pr, embedding in zip(pull_requests, embeddings):
-            row = self._pr_to_bigquery_row(repo_name, pr, embedding, cached_at)
-            pr_rows.append(row)
-
-        # Step 2: Batch load to staging table
+        # Load against the table's known schema: no autodetect pass, no
+        # table creation and no tolerance for unknown or bad values
+        schema = _get_table_cached(self.bq_client, table_id).schema
         job_config = bigquery.LoadJobConfig(
-            write_disposition="WRITE_APPEND",  # Append to staging (3-day expiry handles cleanup)
+            schema=schema,
+            write_disposition="WRITE_TRUNCATE",  # Staging holds only this batch
+            create_disposition="CREATE_NEVER",  # Created by _ensure_staging_tables_exist
+            ignore_unknown_values=False,
+            max_bad_records=0,
         )
 
-        load_job = self.bq_client.load_table_from_json(
-            pr_rows,
-            self.staging_prs_table,
-            job_config=job_config
-        )
-        load_job.result()  # Wait for load to complete
+        if use_parquet:
+            parquet_options = ParquetOptions()
+            parquet_options.enable_list_inference = True  # Load list columns as ARRAYs
 
-        print(f"     Merging from staging to production...")
-
-        # Step 3: MERGE from staging to production with deduplication
-        # Deduplication: If multiple rows for same PR exist in staging, take most recent cached_at
-        merge_query = """
-        MERGE `{prod_table}` T
-        USING (
-            SELECT * EXCEPT(row_num)
-            FROM (
-                SELECT *,
-                       ROW_NUMBER() OVER (PARTITION BY repo_name, number ORDER BY cached_at DESC) as row_num
-                FROM `{staging_table}`
-                WHERE repo_name = '{repo_name}'
-            )
-            WHERE row_num = 1
-        ) S
-        ON T.repo_name = S.repo_name AND T.number = S.number
-        WHEN MATCHED THEN
-            UPDATE SET
-                title = S.title,
-                body = S.body,
-                body_embedding = S.body_embedding,
-                state = S.state,
-                author = S.author,
-                html_url = S.html_url,
-                created_at = S.created_at,
-                updated_at = S.updated_at,
-                merged_at = S.merged_at,
-                closed_at = S.closed_at,
-                base_branch = S.base_branch,
-                head_branch = S.head_branch,
-                additions = S.additions,
-                deletions = S.deletions,
-                changed_files = S.changed_files,
-                draft = S.draft,
-                cached_at = S.cached_at
-        WHEN NOT MATCHED THEN
-            INSERT (
-                repo_name, number, title, body, body_embedding, state, author, html_url,
-                created_at, updated_at, merged_at, closed_at,
-                base_branch, head_branch, additions, deletions, changed_files, draft, cached_at
+            job_config.source_format = bigquery.SourceFormat.PARQUET
+            job_config.parquet_options = parquet_options
+            load_job = self._load_encoded(
+                lambda fileobj: _write_parquet(columns, schema, fileobj),
+                table_id,
+                job_config
             )
-            VALUES (
-                S.repo_name, S.number, S.title, S.body, S.body_embedding, S.state, S.author, S.html_url,
-                S.created_at, S.updated_at, S.merged_at, S.closed_at,
-                S.base_branch, S.head_branch, S.additions, S.deletions, S.changed_files, S.draft, S.cached_at
+        else:
+            job_config.source_format = bigquery.SourceFormat.NEWLINE_DELIMITED_JSON
+            load_job = self._load_encoded(
+                lambda fileobj: _write_ndjson_gzip(columns, fileobj),
+                table_id,
+                job_config
             )
-        """.format(
-            prod_table=self.prs_table,
-            staging_table=self.staging_prs_table,
-            repo_name=repo_name
-        )
 
-        merge_job = self.bq_client.query(merge_query)
-        merge_job.result()  # Wait for MERGE to complete
+        load_job.result()  # Wait for load to complete
+
+    def _load_encoded(
+        self,
+        write: Callable[[BinaryIO], None],
+        table_id: str,
+        job_config: bigquery.LoadJobConfig
+    ) -> bigquery.LoadJob:
+        """
+        Encode the batch to a spooled temporary file, then start its load job.
 
-        return len(pull_requests)
+        Encoding finishes before the upload starts, so an encoder error never
+        reaches BigQuery as a well-formed but truncated file. The file stays in
+        memory up to _LOAD_SPOOL_BYTES and spills to disk beyond that, and it
+        is seekable, so the client can resend a failed resumable-upload chunk.
+
+        Args:
+            write: Encoder that writes the batch to a binary file object
+            table_id: Fully qualified destination table ID
+            job_config: Load job configuration matching the encoder's format
 
-    def _pr_to_bigquery_row(
+        Returns:
+            The started load job
+        """
+        with tempfile.SpooledTemporaryFile(max_size=_LOAD_SPOOL_BYTES) as fileobj:
+            write(fileobj)
+            fileobj.seek(0)
+            return self.bq_client.load_table_from_file(
+                fileobj,
+                table_id,
+                job_config=job_config
+            )
+
+    def _build_pr_columns(
         self,
         repo_name: str,
-        pr: PullRequest,
-        embedding: Optional[List[float]],
+        pull_requests: List[PullRequest],
+        pr_embeddings: Dict[int, Optional[List[float]]],
         cached_at: datetime
-    ) -> Dict[str, Any]:
+    ) -> Columns:
         """
-        Transform a PullRequest to BigQuery row format.
+        Transform PullRequests to BigQuery columns (one list per column).
 
         Maps PullRequest fields to the schema defined in prs.yaml.
 
         Args:
             repo_name: Repository name
-            pr: PullRequest object
-            embedding: 768-dimensional embedding (or None if body was empty)
+            pull_requests: PRs to transform
+            pr_embeddings: 768-dimensional body embeddings keyed by PR number
+                (missing or None if the body was empty)
             cached_at: Timestamp when data was collected
 
         Returns:
-            Dictionary matching BigQuery schema
+            Columns matching the prs table schema
         """
+        prs = pull_requests
+        count = len(prs)
         return {
             # Identity
-            "repo_name": repo_name,
-            "number": pr.number,
+            "repo_name": [repo_name] * count,
+            "number": [pr.number for pr in prs],
 
             # Content
-            "title": pr.title,
-            "body": pr.body,
-            "body_embedding": embedding or [],  # Empty array if no embedding
+            "title": [pr.title for pr in prs],
+            "body": [pr.body for pr in prs],
+            "body_embedding": [pr_embeddings.get(pr.number) or [] for pr in prs],  # Empty array if no embedding
 
             # Metadata
-            "state": pr.state.value,
-            "author": pr.author.login,
-            "html_url": pr.html_url,
+            "state": [pr.state.value for pr in prs],
+            "author": [pr.author.login for pr in prs],
+            "html_url": [pr.html_url for pr in prs],
 
             # Timestamps
-            "created_at": pr.created_at.isoformat(),
-            "updated_at": pr.updated_at.isoformat(),
-            "merged_at": pr.merged_at.isoformat() if pr.merged_at else None,
-            "closed_at": pr.closed_at.isoformat() if pr.closed_at else None,
+            "created_at": [pr.created_at for pr in prs],
+            "updated_at": [pr.updated_at for pr in prs],
+            "merged_at": [pr.merged_at for pr in prs],
+            "closed_at": [pr.closed_at for pr in prs],
 
             # Branch info
-            "base_branch": pr.base_branch,
-            "head_branch": pr.head_branch,
+            "base_branch": [pr.base_branch for pr in prs],
+            "head_branch": [pr.head_branch for pr in prs],
 
             # Size metrics
-            "additions": pr.additions,
-            "deletions": pr.deletions,
-            "changed_files": pr.changed_files,
+            "additions": [pr.additions for pr in prs],
+            "deletions": [pr.deletions for pr in prs],
+            "changed_files": [pr.changed_files for pr in prs],
 
             # Flags
-            "draft": pr.draft,
+            "draft": [pr.draft for pr in prs],
 
             # Cache tracking
-            "cached_at": cached_at.isoformat()
+            "cached_at": [cached_at] * count
         }
 
-    def _load_reviews(
+    def _build_review_columns(
         self,
         repo_name: str,
-        pull_requests: List[PullRequest]
-    ) -> int:
+        reviews: List[Tuple[int, Review]],
+        review_embeddings: List[Optional[List[float]]],
+        cached_at: datetime
+    ) -> Columns:
         """
-        Load reviews with embeddings into BigQuery using staging table + MERGE.
-
-        Extracts reviews from all PRs, generates embeddings for review bodies,
-        and loads them into the reviews table via staging table to avoid streaming buffer issues.
+        Build reviews table columns.
 
         Args:
             repo_name: Repository name
-            pull_requests: List of PRs containing reviews
+            reviews: (PR number, review) pairs for every review in the batch
+            review_embeddings: Review body embeddings, in the same order
+            cached_at: Timestamp when data was collected
 
         Returns:
-            Number of reviews loaded
+            Columns matching the reviews schema (empty dict if no reviews)
         """
-        # Collect all reviews from all PRs
-        all_reviews = []
-        pr_numbers = []
-
-        for pr in pull_requests:
-            for review in pr.reviews:
-                all_reviews.append(review)
-                pr_numbers.append(pr.number)
-
-        if not all_reviews:
-            print("  4. ⊘ No reviews to load")
-            return 0
-
-        print(f"  4. Loading {len(all_reviews)} reviews...")
-
-        # Generate embeddings for ALL review bodies
-        print(f"     Generating review body embeddings...")
-        review_bodies = [review.body or "" for review in all_reviews]
-        review_embeddings = self.embedding_gen.generate_batch_embeddings(review_bodies)
-
-        # Transform to BigQuery rows
-        cached_at = datetime.now(timezone.utc)
-        review_rows = []
-
-        for review, pr_number, embedding in zip(all_reviews, pr_numbers, review_embeddings):
-            row = {
-                "repo_name": repo_name,
-                "pr_number": pr_number,
-                "review_id": review.id,
-                "reviewer": review.user.login,
-                "state": review.state.value,
-                "body": review.body,
-                "body_embedding": embedding or [],
-                "submitted_at": review.submitted_at.isoformat(),
-                "html_url": review.html_url,
-                "cached_at": cached_at.isoformat()
-            }
-            review_rows.append(row)
+        if not reviews:
+            print("     ⊘ No reviews to load")
+            return {}
 
-        # Load to staging table
-        print(f"     Loading {len(review_rows)} reviews to staging table...")
-        job_config = bigquery.LoadJobConfig(
-            write_disposition="WRITE_APPEND",
-        )
+        count = len(reviews)
+        return {
+            "repo_name": [repo_name] * count,
+            "pr_number": [pr_number for pr_number, _ in reviews],
+            "review_id": [review.id for _, review in reviews],
+            "reviewer": [review.user.login for _, review in reviews],
+            "state": [review.state.value for _, review in reviews],
+            "body": [review.body for _, review in reviews],
+            "body_embedding": [embedding or [] for embedding in review_embeddings],
+            "submitted_at": [review.submitted_at for _, review in reviews],
+            "html_url": [review.html_url for _, review in reviews],
+            "cached_at": [cached_at] * count
+        }
 
-        load_job = self.bq_client.load_table_from_json(
-            review_rows,
-            self.staging_reviews_table,
-            job_config=job_config
-        )
-        load_job.result()
-
-        # MERGE from staging to production with deduplication
-        print(f"     Merging from staging to production...")
-        merge_query = f"""
-        MERGE `{self.reviews_table}` T
-        USING (
-            SELECT * EXCEPT(row_num)
-            FROM (
-                SELECT *,
-                       ROW_NUMBER() OVER (PARTITION BY repo_name, review_id ORDER BY cached_at DESC) as row_num
-                FROM `{self.staging_reviews_table}`
-                WHERE repo_name = '{repo_name}'
-            )
-            WHERE row_num = 1
-        ) S
-        ON T.repo_name = S.repo_name AND T.review_id = S.review_id
-        WHEN MATCHED THEN
-            UPDATE SET
-                pr_number = S.pr_number,
-                reviewer = S.reviewer,
-                state = S.state,
-                body = S.body,
-                body_embedding = S.body_embedding,
-                submitted_at = S.submitted_at,
-                html_url = S.html_url,
-                cached_at = S.cached_at
-        WHEN NOT MATCHED THEN
-            INSERT (repo_name, pr_number, review_id, reviewer, state, body, body_embedding, submitted_at, html_url, cached_at)
-            VALUES (S.repo_name, S.pr_number, S.review_id, S.reviewer, S.state, S.body, S.body_embedding, S.submitted_at, S.html_url, S.cached_at)
-        """
-
-        merge_job = self.bq_client.query(merge_query)
-        merge_job.result()
-
-        print(f"    ✓ Upserted {len(review_rows)} reviews")
-        return len(review_rows)
-
-    def _load_files(
+    def _build_file_columns(
         self,
         repo_name: str,
-        pull_requests: List[PullRequest]
-    ) -> int:
+        files: List[Tuple[int, FileStat]],
+        patch_embeddings: List[Optional[List[float]]],
+        cached_at: datetime
+    ) -> Columns:
         """
-        Load file changes with embeddings into BigQuery using staging table + MERGE.
-
-        Extracts file stats from all PRs, generates embeddings for patches,
-        and loads them into the files table via staging table to avoid streaming buffer issues.
+        Build files table columns.
 
         Args:
             repo_name: Repository name
-            pull_requests: List of PRs containing file stats
+            files: (PR number, file stat) pairs for every file in the batch
+            patch_embeddings: Patch embeddings, in the same order
+            cached_at: Timestamp when data was collected
 
         Returns:
-            Number of file records loaded
+            Columns matching the files schema (empty dict if no files)
         """
-        # Collect all file stats from all PRs
-        all_files = []
-        pr_numbers = []
+        if not files:
+            print("     ⊘ No file changes to load")
+            return {}
 
-        for pr in pull_requests:
-            for file_stat in pr.file_stats:
-                all_files.append(file_stat)
-                pr_numbers.append(pr.number)
-
-        if not all_files:
-            print("  5. ⊘ No file changes to load")
-            return 0
-
-        print(f"  5. Loading {len(all_files)} file changes...")
-
-        # Generate embeddings for ALL patches (code diffs)
-        print(f"     Generating patch embeddings...")
-        patches = [file_stat.patch or "" for file_stat in all_files]
-        patch_embeddings = self.embedding_gen.generate_batch_embeddings(patches)
-
-        # Transform to BigQuery rows
-        cached_at = datetime.now(timezone.utc)
-        file_rows = []
-
-        for file_stat, pr_number, embedding in zip(all_files, pr_numbers, patch_embeddings):
-            row = {
-                "repo_name": repo_name,
-                "pr_number": pr_number,
-                "filename": file_stat.filename,
-                "additions": file_stat.additions,
-                "deletions": file_stat.deletions,
-                "status": file_stat.status,
-                "patch": file_stat.patch,
-                "patch_embedding": embedding or [],
-                "patch_truncated": False,  # GitHub API doesn't indicate truncation in our cache
-                "cached_at": cached_at.isoformat()
-            }
-            file_rows.append(row)
-
-        # Load to staging table
-        print(f"     Loading {len(file_rows)} file changes to staging table...")
-        job_config = bigquery.LoadJobConfig(
-            write_disposition="WRITE_APPEND",
-        )
+        count = len(files)
+        return {
+            "repo_name": [repo_name] * count,
+            "pr_number": [pr_number for pr_number, _ in files],
+            "filename": [file_stat.filename for _, file_stat in files],
+            "additions": [file_stat.additions for _, file_stat in files],
+            "deletions": [file_stat.deletions for _, file_stat in files],
+            "status": [file_stat.status for _, file_stat in files],
+            "patch": [file_stat.patch for _, file_stat in files],
+            "patch_embedding": [embedding or [] for embedding in patch_embeddings],
+            "patch_truncated": [False] * count,  # GitHub API doesn't indicate truncation in our cache
+            "cached_at": [cached_at] * count
+        }
 
-        load_job = self.bq_client.load_table_from_json(
-            file_rows,
-            self.staging_files_table,
-            job_config=job_config
-        )
-        load_job.result()
-
-        # MERGE from staging to production with deduplication
-        print(f"     Merging from staging to production...")
-        merge_query = f"""
-        MERGE `{self.files_table}` T
-        USING (
-            SELECT * EXCEPT(row_num)
-            FROM (
-                SELECT *,
-                       ROW_NUMBER() OVER (PARTITION BY repo_name, pr_number, filename ORDER BY cached_at DESC) as row_num
-                FROM `{self.staging_files_table}`
-                WHERE repo_name = '{repo_name}'
-            )
-            WHERE row_num = 1
-        ) S
-        ON T.repo_name = S.repo_name AND T.pr_number = S.pr_number AND T.filename = S.filename
-        WHEN MATCHED THEN
-            UPDATE SET
-                additions = S.additions,
-                deletions = S.deletions,
-                status = S.status,
-                patch = S.patch,
-                patch_embedding = S.patch_embedding,
-                patch_truncated = S.patch_truncated,
-                cached_at = S.cached_at
-        WHEN NOT MATCHED THEN
-            INSERT (repo_name, pr_number, filename, additions, deletions, status, patch, patch_embedding, patch_truncated, cached_at)
-            VALUES (S.repo_name, S.pr_number, S.filename, S.additions, S.deletions, S.status, S.patch, S.patch_embedding, S.patch_truncated, S.cached_at)
-        """
-
-        merge_job = self.bq_client.query(merge_query)
-        merge_job.result()
-
-        print(f"    ✓ Upserted {len(file_rows)} file changes")
-        return len(file_rows)
-
-    def _load_labels(
+    def _build_label_columns(
         self,
         repo_name: str,
-        pull_requests: List[PullRequest]
-    ) -> int:
+        labels: List[Tuple[int, Label]]
+    ) -> Columns:
         """
-        Load PR labels into BigQuery using staging table + MERGE.
+        Build labels table columns.
 
-        Extracts labels from all PRs and loads them into the labels table
-        via staging table to avoid streaming buffer issues.
         Labels don't need embeddings (they're simple keywords).
 
         Args:
             repo_name: Repository name
-            pull_requests: List of PRs containing labels
+            labels: (PR number, label) pairs for every label in the batch
 
         Returns:
-            Number of label records loaded
-        """
-        # Collect all labels from all PRs
-        all_label_tuples = []  # (pr_number, label_name, label_color, label_description)
-
-        for pr in pull_requests:
-            for label in pr.labels:
-                all_label_tuples.append((pr.number, label.name, label.color, label.description))
-
-        if not all_label_tuples:
-            print("  6. ⊘ No labels to load")
-            return 0
-
-        print(f"  6. Loading {len(all_label_tuples)} labels...")
-
-        # Transform to BigQuery rows
-        label_rows = []
-        for pr_number, label_name, label_color, label_description in all_label_tuples:
-            row = {
-                "repo_name": repo_name,
-                "pr_number": pr_number,
-                "label_name": label_name,
-                "label_color": label_color,
-                "label_description": label_description
-            }
-            label_rows.append(row)
-
-        # Load to staging table
-        print(f"     Loading {len(label_rows)} labels to staging table...")
-        job_config = bigquery.LoadJobConfig(
-            write_disposition="WRITE_APPEND",
-        )
-
-        load_job = self.bq_client.load_table_from_json(
-            label_rows,
-            self.staging_labels_table,
-            job_config=job_config
-        )
-        load_job.result()
-
-        # MERGE from staging to production with deduplication
-        print(f"     Merging from staging to production...")
-        merge_query = f"""
-        MERGE `{self.labels_table}` T
-        USING (
-            SELECT * EXCEPT(row_num)
-            FROM (
-                SELECT *,
-                       ROW_NUMBER() OVER (PARTITION BY repo_name, pr_number, label_name ORDER BY repo_name) as row_num
-                FROM `{self.staging_labels_table}`
-                WHERE repo_name = '{repo_name}'
-            )
-            WHERE row_num = 1
-        ) S
-        ON T.repo_name = S.repo_name AND T.pr_number = S.pr_number AND T.label_name = S.label_name
-        WHEN MATCHED THEN
-            UPDATE SET
-                label_color = S.label_color,
-                label_description = S.label_description
-        WHEN NOT MATCHED THEN
-            INSERT (repo_name, pr_number, label_name, label_color, label_description)
-            VALUES (S.repo_name, S.pr_number, S.label_name, S.label_color, S.label_description)
+            Columns matching the labels schema (empty dict if no labels)
         """
+        if not labels:
+            print("     ⊘ No labels to load")
+            return {}
 
-        merge_job = self.bq_client.query(merge_query)
-        merge_job.result()
-
-        print(f"    ✓ Upserted {len(label_rows)} labels")
-        return len(label_rows)
+        return {
+            "repo_name": [repo_name] * len(labels),
+            "pr_number": [pr_number for pr_number, _ in labels],
+            "label_name": [label.name for _, label in labels],
+            "label_color": [label.color for _, label in labels],
+            "label_description": [label.description for _, label in labels]
+        }
 
     def get_table_row_counts(self) -> Dict[str, int]:
         """
         Get current row counts for all tables.
 
-        Useful for verifying data was loaded correctly.
+        Useful for verifying data was loaded correctly. Counts come from table
+        metadata (tables.get calls, made concurrently), so no query job runs
+        and nothing is billed. Rows still in a streaming buffer are included.
 
         Returns:
             Dict with table names and row counts:
             {"prs": 100, "reviews": 250, "files": 800, "labels": 150}
+            (0 for a table that doesn't exist yet)
         """
-        counts = {}
-
-        for table_name, table_ref in [
-            ("prs", self.prs_table),
-            ("reviews", self.reviews_table),
-            ("files", self.files_table),
-            ("labels", self.labels_table)
-        ]:
-            query = f"SELECT COUNT(*) as count FROM `{table_ref}`"
-            result = self.bq_client.query(query).result()
-            count = list(result)[0].count
-            counts[table_name] = count
+        tables = {
+            "prs": self.prs_table,
+            "reviews": self.reviews_table,
+            "files": self.files_table,
+            "labels": self.labels_table
+        }
 
-        return counts
+        def fetch_count(table_ref: str) -> int:
+            try:
+                table = self.bq_client.get_table(table_ref)
+            except Exception:
+                return 0
+            _cache_table(table_ref, table)  # Fresh metadata for later loads too
+            count = table.num_rows or 0
+            if table.streaming_buffer is not None:
+                count += table.streaming_buffer.estimated_rows or 0
+            return count
+
+        with ThreadPoolExecutor(max_workers=len(tables)) as executor:
+            futures = {table_name: executor.submit(fetch_count, table_ref) for table_name, table_ref in tables.items()}
+            return {table_name: future.result() for table_name, future in futures.items()}
@@ -5,12 +5,112 @@ This module provides a concrete implementation of the PRDataSource interface
 that queries PR data from BigQuery tables.
 """
 
-from typing import List, Optional
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 from google.cloud import bigquery
 from .data_source import PRDataSource
 from .models import PullRequest, User, PRState
 
+try:
+    import pyarrow  # noqa: F401 - required by QueryJob.to_arrow
+    from google.cloud import bigquery_storage
+except ImportError:  # Results are fetched page by page over REST instead
+    bigquery_storage = None
+
+# prs table columns that make up a PullRequest, selected by every finder
+_PR_COLUMNS = (
+    "repo_name", "number", "title", "body", "state", "author", "html_url",
+    "created_at", "updated_at", "merged_at", "closed_at", "base_branch",
+    "head_branch", "additions", "deletions", "changed_files", "draft",
+)
+_PR_SELECT = ",\n            ".join(_PR_COLUMNS)
+
+# State column value -> PRState, skipping the enum constructor per row
+_PR_STATES = {state.value: state for state in PRState}
+
+# Process-wide clients shared by every BigQueryDataSource, so creating a data
+# source doesn't rebuild HTTP connections or re-fetch credentials
+_CLIENTS: Dict[str, bigquery.Client] = {}
+_BQSTORAGE_CLIENT = None
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_clients(project_id: str) -> Tuple[bigquery.Client, Any]:
+    """
+    Get the shared BigQuery client for a project and the Storage Read client.
+
+    Returns:
+        (bigquery.Client, BigQueryReadClient or None without the optional
+        google-cloud-bigquery-storage package)
+    """
+    global _BQSTORAGE_CLIENT
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(project_id)
+        if client is None:
+            client = _CLIENTS[project_id] = bigquery.Client(project=project_id)
+        # The read client takes the project per read session, so one
+        # serves every data source
+        if _BQSTORAGE_CLIENT is None and bigquery_storage is not None:
+            _BQSTORAGE_CLIENT = bigquery_storage.BigQueryReadClient()
+        return client, _BQSTORAGE_CLIENT
+
+
+# Shared query embedding generator, created on first semantic search so the
+# Vertex AI client is built once per process rather than per search
+_EMBEDDING_GENERATOR = None
+_EMBEDDING_GENERATOR_LOCK = threading.Lock()
+
+
+def _get_embedding_generator():
+    """Get the process-wide EmbeddingGenerator, creating it on first use."""
+    global _EMBEDDING_GENERATOR
+    with _EMBEDDING_GENERATOR_LOCK:
+        if _EMBEDDING_GENERATOR is None:
+            # Imported lazily: only semantic search needs the genai SDK
+            from .embeddings import EmbeddingGenerator
+            _EMBEDDING_GENERATOR = EmbeddingGenerator()
+        return _EMBEDDING_GENERATOR
+
+
+# Process-wide LRU of finder results: (SQL, parameters) -> (expiry, PRs).
+# Repeated lookups within _QUERY_CACHE_TTL skip the BigQuery round trip.
+_QUERY_CACHE: "OrderedDict[Tuple[str, Tuple], Tuple[float, List[PullRequest]]]" = OrderedDict()
+_QUERY_CACHE_SIZE = 256
+_QUERY_CACHE_TTL = 300  # seconds
+_QUERY_CACHE_LOCK = threading.Lock()
+
+
+def _copy_pr(pr: PullRequest) -> PullRequest:
+    """
+    Copy a cached PR for a caller.
+
+    The list fields are copied too, so callers can rebind attributes or
+    append reviews/labels/files without changing the cached PR. Users,
+    labels and other items are shared; nothing mutates them in place.
+    """
+    pr = copy.copy(pr)
+    pr.labels = list(pr.labels)
+    pr.reviews = list(pr.reviews)
+    pr.file_stats = list(pr.file_stats)
+    pr.requested_reviewers = list(pr.requested_reviewers)
+    pr.assignees = list(pr.assignees)
+    return pr
+
+
+def _query_cache_key(query: str, job_config: bigquery.QueryJobConfig) -> Tuple[str, Tuple]:
+    """Build the result cache key for a query and its parameters."""
+    params: List[Tuple[str, Any]] = []
+    for param in job_config.query_parameters:
+        if isinstance(param, bigquery.ArrayQueryParameter):
+            params.append((param.name, param.array_type, tuple(param.values)))
+        else:
+            params.append((param.name, param.type_, param.value))
+    return query, tuple(params)
+
 
 class BigQueryDataSource(PRDataSource):
     """
@@ -30,7 +130,9 @@ class BigQueryDataSource(PRDataSource):
         self,
         project_id: str,
         dataset_id: str,
-        table_prefix: str = "gkabbz_gh"
+        table_prefix: str = "gkabbz_gh",
+        verbose: bool = True,
+        max_bytes_budget: Optional[int] = None
     ):
         """
         Initialize BigQuery data source.
@@ -40,6 +142,11 @@ class BigQueryDataSource(PRDataSource):
             dataset_id: BigQuery dataset name (e.g., "analysis")
             table_prefix: Table name prefix (default: "gkabbz_gh")
                          In production, this could be "gh" or "github_prs"
+            verbose: Print progress (searches, SQL, result counts) as
+                     queries run
+            max_bytes_budget: Refuse queries estimated (by a free dry run)
+                              to scan more than this many bytes, and cap
+                              billed bytes at it (default: no limit)
 
         Example:
             # Development
@@ -51,7 +158,11 @@ class BigQueryDataSource(PRDataSource):
         self.project_id = project_id
         self.dataset_id = dataset_id
         self.table_prefix = table_prefix
-        self.client = bigquery.Client(project=project_id)
+        self.verbose = verbose
+        self.max_bytes_budget = max_bytes_budget
+        # Large result sets stream as Arrow over the Storage Read API
+        # (bqstorage_client is None without the optional package)
+        self.client, self.bqstorage_client = _get_clients(project_id)
 
         # Table references - built from prefix
         self.prs_table = f"{project_id}.{dataset_id}.{table_prefix}_prs"
@@ -59,10 +170,51 @@ class BigQueryDataSource(PRDataSource):
         self.files_table = f"{project_id}.{dataset_id}.{table_prefix}_files"
         self.labels_table = f"{project_id}.{dataset_id}.{table_prefix}_labels"
 
-        print(f"✓ BigQueryDataSource initialized")
-        print(f"  Project: {project_id}")
-        print(f"  Dataset: {dataset_id}")
-        print(f"  Table prefix: {table_prefix}")
+        self._log("✓ BigQueryDataSource initialized")
+        self._log(f"  Project: {project_id}")
+        self._log(f"  Dataset: {dataset_id}")
+        self._log(f"  Table prefix: {table_prefix}")
+
+    def _log(self, message: str) -> None:
+        """Print progress output if the data source is verbose."""
+        if self.verbose:
+            print(message)
+
+    def _run_query(self, query: str, job_config: bigquery.QueryJobConfig) -> bigquery.QueryJob:
+        """
+        Start a query, checking it against max_bytes_budget first.
+
+        With a budget set, the query is dry-run (free, nothing is billed) to
+        estimate the bytes it scans, and refused if over budget; the real job
+        also gets maximum_bytes_billed as a safety net.
+
+        Args:
+            query: SQL query
+            job_config: Query configuration with the query parameters
+
+        Returns:
+            Started query job
+
+        Raises:
+            ValueError: If the query would scan more than max_bytes_budget
+        """
+        if self.max_bytes_budget is not None:
+            dry_run_config = bigquery.QueryJobConfig(
+                query_parameters=job_config.query_parameters,
+                dry_run=True,
+                use_query_cache=False,
+            )
+            dry_run = self.client.query(query, job_config=dry_run_config)
+            estimated = dry_run.total_bytes_processed or 0
+            self._log(f"  Estimated scan: {estimated / 1e6:.1f} MB")
+            if estimated > self.max_bytes_budget:
+                raise ValueError(
+                    f"Query would scan {estimated:,} bytes, over the "
+                    f"{self.max_bytes_budget:,} byte budget"
+                )
+            job_config.maximum_bytes_billed = self.max_bytes_budget
+
+        return self.client.query(query, job_config=job_config)
 
     def find_prs_by_author(
         self,
@@ -81,29 +233,13 @@ class BigQueryDataSource(PRDataSource):
         Returns:
             List of PullRequest objects
         """
-        print(f"\n🔍 Searching for PRs by author: {author}")
+        self._log(f"\n🔍 Searching for PRs by author: {author}")
 
         # Build SQL query
         #TODO: We might want to have a look up table for author. Most natural language would use someone's name e.g. for me people would ask George or George Kaberere not gkabbz (my github handle that is currently in author field)
         query = f"""
         SELECT
-            repo_name,
-            number,
-            title,
-            body,
-            state,
-            author,
-            html_url,
-            created_at,
-            updated_at,
-            merged_at,
-            closed_at,
-            base_branch,
-            head_branch,
-            additions,
-            deletions,
-            changed_files,
-            draft
+            {_PR_SELECT}
         FROM `{self.prs_table}`
         WHERE author = @author
         """
@@ -115,9 +251,9 @@ class BigQueryDataSource(PRDataSource):
         # Order by most recent first
         query += " ORDER BY created_at DESC"
         if limit is not None:
-            query += f" LIMIT {limit}"
+            query += " LIMIT @limit"
 
-        print(f"  SQL: {query[:100]}...")
+        self._log(f"  SQL: {query[:100]}...")
 
         # Configure query parameters
         query_params = [
@@ -128,58 +264,124 @@ class BigQueryDataSource(PRDataSource):
             query_params.append(
                 bigquery.ScalarQueryParameter("repo_name", "STRING", repo_name)
             )
+        if limit is not None:
+            query_params.append(bigquery.ScalarQueryParameter("limit", "INT64", limit))
 
         job_config = bigquery.QueryJobConfig(query_parameters=query_params)
 
         # Execute query
-        query_job = self.client.query(query, job_config=job_config)
-        results = query_job.result()
+        prs = self._query_prs(query, job_config)
 
-        # Transform results to PullRequest objects
-        prs = []
-        for row in results:
-            pr = self._row_to_pullrequest(row)
-            prs.append(pr)
-
-        print(f"  ✓ Found {len(prs)} PRs")
+        self._log(f"  ✓ Found {len(prs)} PRs")
         return prs
 
-    def _row_to_pullrequest(self, row: bigquery.Row) -> PullRequest:
+    def _query_prs(self, query: str, job_config: bigquery.QueryJobConfig) -> List[PullRequest]:
         """
-        Convert a BigQuery row to a PullRequest object.
+        Run a query selecting _PR_COLUMNS and convert its rows to PullRequests.
+
+        Results are cached for _QUERY_CACHE_TTL seconds, keyed on the SQL
+        text and parameter values.
 
         Args:
-            row: BigQuery row from prs table
+            query: SQL selecting the _PR_COLUMNS first, in order
+            job_config: Query configuration with the query parameters
 
         Returns:
-            PullRequest object
+            List of PullRequest objects, in result order
+        """
+        key = _query_cache_key(query, job_config)
+        with _QUERY_CACHE_LOCK:
+            cached = _QUERY_CACHE.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                _QUERY_CACHE.move_to_end(key)
+                self._log("  ✓ Using cached results")
+                # Copies, so callers enriching a PR don't change the cache
+                return [_copy_pr(pr) for pr in cached[1]]
+
+        query_job = self._run_query(query, job_config)
+        to_pr = self._values_to_pullrequest
+        users: Dict[str, User] = {}
+        prs = [to_pr(*values, users=users) for values in self._fetch_rows(query_job)]
+
+        with _QUERY_CACHE_LOCK:
+            _QUERY_CACHE[key] = (time.monotonic() + _QUERY_CACHE_TTL, prs)
+            _QUERY_CACHE.move_to_end(key)
+            while len(_QUERY_CACHE) > _QUERY_CACHE_SIZE:
+                _QUERY_CACHE.popitem(last=False)
+        return [_copy_pr(pr) for pr in prs]
+
+    def clear_query_cache(self) -> None:
         """
-        # Create author user
-        author = User(login=row.author)
+        Drop all cached finder results (e.g. after loading new data).
+        """
+        with _QUERY_CACHE_LOCK:
+            _QUERY_CACHE.clear()
+
+    def _fetch_rows(self, query_job: bigquery.QueryJob) -> Iterable[Tuple]:
+        """
+        Fetch the result rows of a query as value tuples in SELECT order.
+
+        With the Storage Read API available, results are downloaded as Arrow
+        record batches (the client falls back to REST when the first page
+        already holds every row) and zipped column by column, without
+        building a row object per result.
+
+        Args:
+            query_job: Started query job
 
-        # Parse state
-        state = PRState(row.state)
+        Returns:
+            Iterable of value tuples
+        """
+        if self.bqstorage_client is None:
+            return (row.values() for row in query_job.result())
+
+        table = query_job.to_arrow(bqstorage_client=self.bqstorage_client)
+        return zip(*(column.to_pylist() for column in table.columns))
+
+    @staticmethod
+    def _values_to_pullrequest(repo_name, number, title, body, state, author,
+                               html_url, created_at, updated_at, merged_at,
+                               closed_at, base_branch, head_branch, additions,
+                               deletions, changed_files, draft, *extra,
+                               users: Optional[Dict[str, User]] = None) -> PullRequest:
+        """
+        Convert the _PR_COLUMNS values of a result row to a PullRequest object.
 
-        # Create PullRequest
+        Args:
+            Row values in _PR_COLUMNS order; any further selected columns
+            (e.g. distance) land in extra and are ignored
+            users: Optional login -> User map shared across a result set, so
+                   an author of many PRs gets one User object
+
+        Returns:
+            PullRequest object
+        """
         # Note: We're only loading basic PR data here, not reviews/files/labels
         # Those can be loaded separately if needed
-        pr = PullRequest(
-            number=row.number,
-            title=row.title,
-            body=row.body,
-            state=state,
-            created_at=row.created_at,
-            updated_at=row.updated_at,
-            merged_at=row.merged_at,
-            closed_at=row.closed_at,
-            author=author,
-            html_url=row.html_url,
-            base_branch=row.base_branch,
-            head_branch=row.head_branch,
-            additions=row.additions,
-            deletions=row.deletions,
-            changed_files=row.changed_files,
-            draft=row.draft,
+        if users is None:
+            user = User(login=author)
+        else:
+            user = users.get(author)
+            if user is None:
+                user = users[author] = User(login=author)
+
+        return PullRequest(
+            number=number,
+            title=title,
+            body=body,
+            state=_PR_STATES[state],
+            created_at=created_at,
+            updated_at=updated_at,
+            merged_at=merged_at,
+            closed_at=closed_at,
+            author=user,
+            html_url=html_url,
+            base_branch=base_branch,
+            head_branch=head_branch,
+            additions=additions,
+            deletions=deletions,
+            changed_files=changed_files,
+            draft=draft,
             # Empty lists for related data (can be enriched later if needed)
             labels=[],
             reviews=[],
@@ -188,8 +390,6 @@ class BigQueryDataSource(PRDataSource):
             assignees=[]
         )
 
-        return pr
-
     def find_prs_by_reviewer(
         self,
         reviewer: str,
@@ -199,34 +399,25 @@ class BigQueryDataSource(PRDataSource):
         """
         Find PRs reviewed by a specific user.
 
-        This requires joining the prs table with the reviews table.
+        This requires a semi-join of the prs table with the reviews table.
         """
-        print(f"\n🔍 Searching for PRs reviewed by: {reviewer}")
+        self._log(f"\n🔍 Searching for PRs reviewed by: {reviewer}")
 
-        # Build SQL query with JOIN
+        # EXISTS is a semi-join: each PR is returned once without joining
+        # every matching review and deduplicating (the repo filter is
+        # repeated inside so reviews prunes on its leading cluster column)
+        child_repo_filter = "AND r.repo_name = @repo_name" if repo_name else ""
         query = f"""
-        SELECT DISTINCT
-            p.repo_name,
-            p.number,
-            p.title,
-            p.body,
-            p.state,
-            p.author,
-            p.html_url,
-            p.created_at,
-            p.updated_at,
-            p.merged_at,
-            p.closed_at,
-            p.base_branch,
-            p.head_branch,
-            p.additions,
-            p.deletions,
-            p.changed_files,
-            p.draft
+        SELECT
+            {_PR_SELECT}
         FROM `{self.prs_table}` p
-        JOIN `{self.reviews_table}` r
-          ON p.repo_name = r.repo_name AND p.number = r.pr_number
-        WHERE r.reviewer = @reviewer
+        WHERE EXISTS (
+            SELECT 1
+            FROM `{self.reviews_table}` r
+            WHERE r.repo_name = p.repo_name AND r.pr_number = p.number
+              AND r.reviewer = @reviewer
+              {child_repo_filter}
+        )
         """
 
         if repo_name:
@@ -234,9 +425,9 @@ class BigQueryDataSource(PRDataSource):
 
         query += " ORDER BY p.created_at DESC"
         if limit is not None:
-            query += f" LIMIT {limit}"
+            query += " LIMIT @limit"
 
-        print(f"  SQL: {query[:100]}...")
+        self._log(f"  SQL: {query[:100]}...")
 
         # Configure query parameters
         query_params = [
@@ -247,20 +438,15 @@ class BigQueryDataSource(PRDataSource):
             query_params.append(
                 bigquery.ScalarQueryParameter("repo_name", "STRING", repo_name)
             )
+        if limit is not None:
+            query_params.append(bigquery.ScalarQueryParameter("limit", "INT64", limit))
 
         job_config = bigquery.QueryJobConfig(query_parameters=query_params)
 
         # Execute query
-        query_job = self.client.query(query, job_config=job_config)
-        results = query_job.result()
-
-        # Transform results
-        prs = []
-        for row in results:
-            pr = self._row_to_pullrequest(row)
-            prs.append(pr)
+        prs = self._query_prs(query, job_config)
 
-        print(f"  ✓ Found {len(prs)} PRs")
+        self._log(f"  ✓ Found {len(prs)} PRs")
         return prs
 
     def find_prs_by_date_range(
@@ -273,27 +459,11 @@ class BigQueryDataSource(PRDataSource):
         """
         Find PRs merged within a date range.
         """
-        print(f"\n🔍 Searching for PRs merged between {start_date.date()} and {end_date.date()}")
+        self._log(f"\n🔍 Searching for PRs merged between {start_date.date()} and {end_date.date()}")
 
         query = f"""
         SELECT
-            repo_name,
-            number,
-            title,
-            body,
-            state,
-            author,
-            html_url,
-            created_at,
-            updated_at,
-            merged_at,
-            closed_at,
-            base_branch,
-            head_branch,
-            additions,
-            deletions,
-            changed_files,
-            draft
+            {_PR_SELECT}
         FROM `{self.prs_table}`
         WHERE merged_at BETWEEN @start_date AND @end_date
         """
@@ -303,9 +473,9 @@ class BigQueryDataSource(PRDataSource):
 
         query += " ORDER BY merged_at DESC"
         if limit is not None:
-            query += f" LIMIT {limit}"
+            query += " LIMIT @limit"
 
-        print(f"  SQL: {query[:100]}...")
+        self._log(f"  SQL: {query[:100]}...")
 
         # Configure query parameters
         query_params = [
@@ -317,20 +487,15 @@ class BigQueryDataSource(PRDataSource):
             query_params.append(
                 bigquery.ScalarQueryParameter("repo_name", "STRING", repo_name)
             )
+        if limit is not None:
+            query_params.append(bigquery.ScalarQueryParameter("limit", "INT64", limit))
 
         job_config = bigquery.QueryJobConfig(query_parameters=query_params)
 
         # Execute query
-        query_job = self.client.query(query, job_config=job_config)
-        results = query_job.result()
+        prs = self._query_prs(query, job_config)
 
-        # Transform results
-        prs = []
-        for row in results:
-            pr = self._row_to_pullrequest(row)
-            prs.append(pr)
-
-        print(f"  ✓ Found {len(prs)} PRs")
+        self._log(f"  ✓ Found {len(prs)} PRs")
         return prs
 
     def find_prs_by_file(
@@ -342,33 +507,22 @@ class BigQueryDataSource(PRDataSource):
         """
         Find PRs that changed a specific file.
 
-        This requires joining with the files table.
+        This requires a semi-join with the files table.
         """
-        print(f"\n🔍 Searching for PRs that changed file: {filename}")
+        self._log(f"\n🔍 Searching for PRs that changed file: {filename}")
 
+        child_repo_filter = "AND f.repo_name = @repo_name" if repo_name else ""
         query = f"""
-        SELECT DISTINCT
-            p.repo_name,
-            p.number,
-            p.title,
-            p.body,
-            p.state,
-            p.author,
-            p.html_url,
-            p.created_at,
-            p.updated_at,
-            p.merged_at,
-            p.closed_at,
-            p.base_branch,
-            p.head_branch,
-            p.additions,
-            p.deletions,
-            p.changed_files,
-            p.draft
+        SELECT
+            {_PR_SELECT}
         FROM `{self.prs_table}` p
-        JOIN `{self.files_table}` f
-          ON p.repo_name = f.repo_name AND p.number = f.pr_number
-        WHERE f.filename = @filename
+        WHERE EXISTS (
+            SELECT 1
+            FROM `{self.files_table}` f
+            WHERE f.repo_name = p.repo_name AND f.pr_number = p.number
+              AND f.filename = @filename
+              {child_repo_filter}
+        )
         """
 
         if repo_name:
@@ -376,9 +530,9 @@ class BigQueryDataSource(PRDataSource):
 
         query += " ORDER BY p.created_at DESC"
         if limit is not None:
-            query += f" LIMIT {limit}"
+            query += " LIMIT @limit"
 
-        print(f"  SQL: {query[:100]}...")
+        self._log(f"  SQL: {query[:100]}...")
 
         # Configure query parameters
         query_params = [
@@ -389,20 +543,15 @@ class BigQueryDataSource(PRDataSource):
             query_params.append(
                 bigquery.ScalarQueryParameter("repo_name", "STRING", repo_name)
             )
+        if limit is not None:
+            query_params.append(bigquery.ScalarQueryParameter("limit", "INT64", limit))
 
         job_config = bigquery.QueryJobConfig(query_parameters=query_params)
 
         # Execute query
-        query_job = self.client.query(query, job_config=job_config)
-        results = query_job.result()
-
-        # Transform results
-        prs = []
-        for row in results:
-            pr = self._row_to_pullrequest(row)
-            prs.append(pr)
+        prs = self._query_prs(query, job_config)
 
-        print(f"  ✓ Found {len(prs)} PRs")
+        self._log(f"  ✓ Found {len(prs)} PRs")
         return prs
 
     def find_prs_by_directory(
@@ -414,39 +563,29 @@ class BigQueryDataSource(PRDataSource):
         """
         Find PRs that changed files in a directory.
 
-        Uses LIKE pattern matching on filename. Since filenames are full paths like
-        'sql/project/dataset/table/file.sql', we use '%/directory/%' pattern to match
-        the directory name anywhere in the path.
+        Filenames are full paths like 'sql/project/dataset/table/file.sql', so a
+        file is in the directory if its path starts with 'directory/' or contains
+        '/directory/' (the directory name anywhere in the path). Both checks are
+        literal string matches, so '_' and '%' in directory names aren't wildcards.
         """
-        print(f"\n🔍 Searching for PRs that changed directory: {directory}")
+        self._log(f"\n🔍 Searching for PRs that changed directory: {directory}")
 
         # Ensure directory ends with /
         if not directory.endswith('/'):
             directory += '/'
 
+        child_repo_filter = "AND f.repo_name = @repo_name" if repo_name else ""
         query = f"""
-        SELECT DISTINCT
-            p.repo_name,
-            p.number,
-            p.title,
-            p.body,
-            p.state,
-            p.author,
-            p.html_url,
-            p.created_at,
-            p.updated_at,
-            p.merged_at,
-            p.closed_at,
-            p.base_branch,
-            p.head_branch,
-            p.additions,
-            p.deletions,
-            p.changed_files,
-            p.draft
+        SELECT
+            {_PR_SELECT}
         FROM `{self.prs_table}` p
-        JOIN `{self.files_table}` f
-          ON p.repo_name = f.repo_name AND p.number = f.pr_number
-        WHERE f.filename LIKE @directory_pattern
+        WHERE EXISTS (
+            SELECT 1
+            FROM `{self.files_table}` f
+            WHERE f.repo_name = p.repo_name AND f.pr_number = p.number
+              AND (STARTS_WITH(f.filename, @directory) OR STRPOS(f.filename, @nested_directory) > 0)
+              {child_repo_filter}
+        )
         """
 
         if repo_name:
@@ -454,34 +593,29 @@ class BigQueryDataSource(PRDataSource):
 
         query += " ORDER BY p.created_at DESC"
         if limit is not None:
-            query += f" LIMIT {limit}"
+            query += " LIMIT @limit"
 
-        print(f"  SQL: {query[:100]}...")
+        self._log(f"  SQL: {query[:100]}...")
 
         # Configure query parameters
-        # Use %/directory/% pattern to match directory anywhere in the path
         query_params = [
-            bigquery.ScalarQueryParameter("directory_pattern", "STRING", f"%/{directory}%"),
+            bigquery.ScalarQueryParameter("directory", "STRING", directory),
+            bigquery.ScalarQueryParameter("nested_directory", "STRING", f"/{directory}"),
         ]
 
         if repo_name:
             query_params.append(
                 bigquery.ScalarQueryParameter("repo_name", "STRING", repo_name)
             )
+        if limit is not None:
+            query_params.append(bigquery.ScalarQueryParameter("limit", "INT64", limit))
 
         job_config = bigquery.QueryJobConfig(query_parameters=query_params)
 
         # Execute query
-        query_job = self.client.query(query, job_config=job_config)
-        results = query_job.result()
-
-        # Transform results
-        prs = []
-        for row in results:
-            pr = self._row_to_pullrequest(row)
-            prs.append(pr)
+        prs = self._query_prs(query, job_config)
 
-        print(f"  ✓ Found {len(prs)} PRs")
+        self._log(f"  ✓ Found {len(prs)} PRs")
         return prs
 
     def semantic_search(
@@ -496,37 +630,19 @@ class BigQueryDataSource(PRDataSource):
         This uses ML_DISTANCE to compute cosine similarity between
         the query embedding and PR body embeddings.
         """
-        print(f"\n🔍 Semantic search: '{query}'")
+        self._log(f"\n🔍 Semantic search: '{query}'")
 
         # Step 1: Generate embedding for the query
-        from .embeddings import EmbeddingGenerator
-        embedding_gen = EmbeddingGenerator()
-        query_embedding = embedding_gen.generate_embedding(query)
+        query_embedding = _get_embedding_generator().generate_embedding(query)
 
-        print(f"  Generated query embedding ({len(query_embedding)} dims)")
+        self._log(f"  Generated query embedding ({len(query_embedding)} dims)")
 
         # Step 2: Search using vector similarity
         # ML_DISTANCE computes cosine distance (0 = identical, 2 = opposite)
         # We want smallest distances (most similar)
         sql = f"""
         SELECT
-            repo_name,
-            number,
-            title,
-            body,
-            state,
-            author,
-            html_url,
-            created_at,
-            updated_at,
-            merged_at,
-            closed_at,
-            base_branch,
-            head_branch,
-            additions,
-            deletions,
-            changed_files,
-            draft,
+            {_PR_SELECT},
             ML.DISTANCE(body_embedding, @query_embedding, 'COSINE') as distance
         FROM `{self.prs_table}`
         WHERE ARRAY_LENGTH(body_embedding) > 0
@@ -537,9 +653,9 @@ class BigQueryDataSource(PRDataSource):
 
         sql += " ORDER BY distance ASC"
         if limit is not None:
-            sql += f" LIMIT {limit}"
+            sql += " LIMIT @limit"
 
-        print(f"  SQL: {sql[:100]}...")
+        self._log(f"  SQL: {sql[:100]}...")
 
         # Configure query parameters
         query_params = [
@@ -550,20 +666,15 @@ class BigQueryDataSource(PRDataSource):
             query_params.append(
                 bigquery.ScalarQueryParameter("repo_name", "STRING", repo_name)
             )
+        if limit is not None:
+            query_params.append(bigquery.ScalarQueryParameter("limit", "INT64", limit))
 
         job_config = bigquery.QueryJobConfig(query_parameters=query_params)
 
         # Execute query
-        query_job = self.client.query(sql, job_config=job_config)
-        results = query_job.result()
-
-        # Transform results
-        prs = []
-        for row in results:
-            pr = self._row_to_pullrequest(row)
-            prs.append(pr)
+        prs = self._query_prs(sql, job_config)
 
-        print(f"  ✓ Found {len(prs)} similar PRs")
+        self._log(f"  ✓ Found {len(prs)} similar PRs")
         return prs
 
     def get_pr_detail(
@@ -574,32 +685,16 @@ class BigQueryDataSource(PRDataSource):
         """
         Get full details of a specific PR including reviews and file changes.
         """
-        print(f"\n🔍 Getting PR detail: {repo_name}#{pr_number}")
+        self._log(f"\n🔍 Getting PR detail: {repo_name}#{pr_number}")
 
         query = f"""
         SELECT
-            repo_name,
-            number,
-            title,
-            body,
-            state,
-            author,
-            html_url,
-            created_at,
-            updated_at,
-            merged_at,
-            closed_at,
-            base_branch,
-            head_branch,
-            additions,
-            deletions,
-            changed_files,
-            draft
+            {_PR_SELECT}
         FROM `{self.prs_table}`
         WHERE repo_name = @repo_name AND number = @pr_number
         """
 
-        print(f"  SQL: {query[:100]}...")
+        self._log(f"  SQL: {query[:100]}...")
 
         # Configure query parameters
         query_params = [
@@ -610,27 +705,25 @@ class BigQueryDataSource(PRDataSource):
         job_config = bigquery.QueryJobConfig(query_parameters=query_params)
 
         # Execute query
-        query_job = self.client.query(query, job_config=job_config)
-        results = query_job.result()
+        prs = self._query_prs(query, job_config)
 
         # Get first result (should be only one)
-        for row in results:
-            pr = self._row_to_pullrequest(row)
-            print(f"  ✓ Found PR: {pr.title}")
+        for pr in prs:
+            self._log(f"  ✓ Found PR: {pr.title}")
 
             # Enrich with reviews
             pr.reviews = self._get_pr_reviews(repo_name, pr_number)
             if pr.reviews:
-                print(f"  ✓ Loaded {len(pr.reviews)} review(s)")
+                self._log(f"  ✓ Loaded {len(pr.reviews)} review(s)")
 
             # Enrich with file stats
             pr.file_stats = self._get_pr_files(repo_name, pr_number)
             if pr.file_stats:
-                print(f"  ✓ Loaded {len(pr.file_stats)} file(s)")
+                self._log(f"  ✓ Loaded {len(pr.file_stats)} file(s)")
 
             return pr
 
-        print(f"  ✗ PR not found")
+        self._log(f"  ✗ PR not found")
         return None
 
     def _get_pr_reviews(self, repo_name: str, pr_number: int) -> List:
@@ -662,7 +755,7 @@ class BigQueryDataSource(PRDataSource):
         ]
 
         job_config = bigquery.QueryJobConfig(query_parameters=query_params)
-        query_job = self.client.query(query, job_config=job_config)
+        query_job = self._run_query(query, job_config)
         results = query_job.result()
 
         reviews = []
@@ -705,7 +798,7 @@ class BigQueryDataSource(PRDataSource):
         ]
 
         job_config = bigquery.QueryJobConfig(query_parameters=query_params)
-        query_job = self.client.query(query, job_config=job_config)
+        query_job = self._run_query(query, job_config)
         results = query_job.result()
 
         files = []
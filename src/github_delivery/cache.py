@@ -1,15 +1,67 @@
 """
 Persistent cache for GitHub PR data to avoid duplicate fetches.
 
-Stores PR data in JSON format organized by repository and PR number.
+Stores PR data as JSON documents (or pickles) in one SQLite database per
+repository, plus raw REST responses keyed by URL for ETag-based
+conditional requests.
 """
 
+import hashlib
 import json
 import os
+import pickle
+import sqlite3
+import threading
+import time
+import urllib.parse
+import weakref
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 from pathlib import Path
-from .models import PullRequest
+from .models import PullRequest, parse_github_timestamp
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library encoder
+    orjson = None
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize cache data to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes written by _dumps (or by older indented cache files)."""
+    if orjson is not None:
+        return orjson.loads(raw)  # orjson.JSONDecodeError subclasses json's
+    return json.loads(raw)
+
+
+# Most PR numbers bound into one SQLite IN (...) query
+_SQLITE_MAX_PARAMS = 500
+
+# Pickles (protocol 2+) start with the PROTO opcode; JSON entries with "{"
+_PICKLE_MARKER = b"\x80"
+
+# Errors raised when a stored PR can't be deserialized
+_DECODE_ERRORS = (json.JSONDecodeError, KeyError, ValueError, TypeError,
+                  AttributeError, EOFError, pickle.UnpicklingError)
+
+
+def _close_connections(connections: Dict[str, sqlite3.Connection], lock: threading.RLock) -> None:
+    """Close and forget a PRCache's SQLite connections (also its finalizer)."""
+    with lock:
+        for conn in connections.values():
+            conn.close()
+        connections.clear()
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    """Format an optional datetime as ISO 8601 (None stays None)."""
+    return value.isoformat() if value else None
 
 
 class PRCache:
@@ -19,21 +71,39 @@ class PRCache:
     Cache structure:
     cache/
     ├── mozilla_bigquery-etl/
-    │   ├── pr_8162.json
-    │   ├── pr_8161.json
-    │   └── index.json  # metadata about cached PRs
+    │   └── prs.sqlite  # one row per cached PR: number, cached_at, JSON data
+
+    PR caches written by older versions as pr_<number>.json files are
+    imported into the database the first time it is created.
     """
 
-    def __init__(self, cache_dir: str = "cache"):
+    def __init__(self, cache_dir: str = "cache", format: str = "json"):
         """
         Initialize the PR cache.
 
         Args:
             cache_dir: Directory to store cache files
+            format: How PRs are stored: "json" (default, readable by any
+                    version) or "pickle" (several times faster to store and
+                    load, but tied to the PullRequest classes of this code
+                    version - clear the cache after changing them). JSON
+                    entries are read in either format; pickled entries are
+                    only unpickled when the format is "pickle", otherwise
+                    they are treated as corrupted and refetched.
         """
+        if format not in ("json", "pickle"):
+            raise ValueError(f"Unknown cache format: {format}. Use 'json' or 'pickle'.")
+        self.format = format
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
 
+        # One connection per repository database, shared by all threads
+        self._connections: Dict[str, sqlite3.Connection] = {}
+        self._db_lock = threading.RLock()
+        # Closes the connections when the cache is garbage collected or at
+        # interpreter exit, without keeping the cache itself alive
+        weakref.finalize(self, _close_connections, self._connections, self._db_lock)
+
     def _get_repo_cache_dir(self, repository: str) -> Path:
         """Get cache directory for a specific repository."""
         # Replace / with _ for filesystem safety
@@ -42,18 +112,54 @@ class PRCache:
         repo_dir.mkdir(exist_ok=True)
         return repo_dir
 
-    def _get_pr_cache_file(self, repository: str, pr_number: int) -> Path:
-        """Get cache file path for a specific PR."""
-        repo_dir = self._get_repo_cache_dir(repository)
-        return repo_dir / f"pr_{pr_number}.json"
+    def _get_db(self, repository: str) -> sqlite3.Connection:
+        """Get the repository's database connection (call with _db_lock held)."""
+        conn = self._connections.get(repository)
+        if conn is not None:
+            return conn
 
-    def _get_index_file(self, repository: str) -> Path:
-        """Get index file path for a repository."""
         repo_dir = self._get_repo_cache_dir(repository)
-        return repo_dir / "index.json"
+        db_file = repo_dir / "prs.sqlite"
+        is_new = not db_file.exists()
+
+        # Autocommit; WAL with synchronous=NORMAL skips an fsync per write
+        conn = sqlite3.connect(str(db_file), isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS prs ("
+            "number INTEGER PRIMARY KEY, cached_at REAL NOT NULL, data BLOB NOT NULL)"
+        )
+        self._connections[repository] = conn
 
-    def _pr_to_dict(self, pr: PullRequest) -> Dict[str, Any]:
-        """Convert PullRequest to dictionary for JSON storage."""
+        if is_new:
+            self._import_json_files(conn, repo_dir)
+        return conn
+
+    def _import_json_files(self, conn: sqlite3.Connection, repo_dir: Path) -> None:
+        """Import PRs cached as pr_<number>.json files by older versions."""
+        rows = []
+        for cache_file in repo_dir.glob("pr_*.json"):
+            try:
+                raw = cache_file.read_bytes()
+                rows.append((_loads(raw)["number"], cache_file.stat().st_mtime, raw))
+            except (json.JSONDecodeError, KeyError, OSError) as e:
+                print(f"Warning: Skipping corrupted cache file {cache_file}: {e}")
+
+        if rows:
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO prs VALUES (?, ?, ?)", rows)
+            print(f"📦 Imported {len(rows)} cached PRs from JSON files into {repo_dir / 'prs.sqlite'}")
+
+    def _pr_to_dict(self, pr: PullRequest, cached_at: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Convert PullRequest to dictionary for JSON storage.
+
+        Args:
+            pr: PR to convert
+            cached_at: ISO timestamp to record (default: now); pass one
+                precomputed value when converting many PRs
+        """
         return {
             "number": pr.number,
             "title": pr.title,
@@ -61,8 +167,8 @@ class PRCache:
             "state": pr.state.value,
             "created_at": pr.created_at.isoformat(),
             "updated_at": pr.updated_at.isoformat(),
-            "merged_at": pr.merged_at.isoformat() if pr.merged_at else None,
-            "closed_at": pr.closed_at.isoformat() if pr.closed_at else None,
+            "merged_at": _iso(pr.merged_at),
+            "closed_at": _iso(pr.closed_at),
             "author": {
                 "login": pr.author.login,
                 "name": pr.author.name,
@@ -97,20 +203,26 @@ class PRCache:
             "changed_files": pr.changed_files,
             "draft": pr.draft,
             "mergeable": pr.mergeable,
-            "cached_at": datetime.now().isoformat()
+            "cached_at": cached_at or datetime.now().isoformat()
         }
 
     def _dict_to_pr(self, data: Dict[str, Any]) -> PullRequest:
         """Convert dictionary back to PullRequest object."""
         from .models import PRState, User, Label, Review, ReviewState, FileStat
 
-        # Reconstruct User objects
-        author = User(
-            login=data["author"]["login"],
-            name=data["author"].get("name"),
-            avatar_url=data["author"].get("avatar_url"),
-            html_url=data["author"].get("html_url")
-        )
+        # Reconstruct User objects, sharing one object per distinct user
+        # (the author is often also an assignee, reviewers often requested)
+        users: Dict[tuple, User] = {}
+
+        def to_user(user_data: Dict[str, Any]) -> User:
+            key = (user_data["login"], user_data.get("name"),
+                   user_data.get("avatar_url"), user_data.get("html_url"))
+            user = users.get(key)
+            if user is None:
+                user = users[key] = User(*key)
+            return user
+
+        author = to_user(data["author"])
 
         # Reconstruct other complex objects
         labels = [Label(name=label["name"], color=label["color"],
@@ -118,17 +230,11 @@ class PRCache:
 
         reviews = []
         for review_data in data["reviews"]:
-            review_user = User(
-                login=review_data["user"]["login"],
-                name=review_data["user"].get("name"),
-                avatar_url=review_data["user"].get("avatar_url"),
-                html_url=review_data["user"].get("html_url")
-            )
             review = Review(
                 id=review_data["id"],
-                user=review_user,
+                user=to_user(review_data["user"]),
                 state=ReviewState(review_data["state"]),
-                submitted_at=datetime.fromisoformat(review_data["submitted_at"]),
+                submitted_at=parse_github_timestamp(review_data["submitted_at"]),
                 body=review_data.get("body"),
                 html_url=review_data.get("html_url")
             )
@@ -143,25 +249,19 @@ class PRCache:
             patch=fs.get("patch")
         ) for fs in data["file_stats"]]
 
-        requested_reviewers = [User(
-            login=user["login"], name=user.get("name"),
-            avatar_url=user.get("avatar_url"), html_url=user.get("html_url")
-        ) for user in data["requested_reviewers"]]
+        requested_reviewers = [to_user(user) for user in data["requested_reviewers"]]
 
-        assignees = [User(
-            login=user["login"], name=user.get("name"),
-            avatar_url=user.get("avatar_url"), html_url=user.get("html_url")
-        ) for user in data["assignees"]]
+        assignees = [to_user(user) for user in data["assignees"]]
 
         return PullRequest(
             number=data["number"],
             title=data["title"],
             body=data["body"],
             state=PRState(data["state"]),
-            created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"]),
-            merged_at=datetime.fromisoformat(data["merged_at"]) if data["merged_at"] else None,
-            closed_at=datetime.fromisoformat(data["closed_at"]) if data["closed_at"] else None,
+            created_at=parse_github_timestamp(data["created_at"]),
+            updated_at=parse_github_timestamp(data["updated_at"]),
+            merged_at=parse_github_timestamp(data["merged_at"]) if data["merged_at"] else None,
+            closed_at=parse_github_timestamp(data["closed_at"]) if data["closed_at"] else None,
             author=author,
             html_url=data["html_url"],
             base_branch=data["base_branch"],
@@ -178,83 +278,198 @@ class PRCache:
             mergeable=data.get("mergeable")
         )
 
+    def _encode_pr(self, pr: PullRequest, cached_at: str) -> bytes:
+        """Serialize a PR for storage in the configured format."""
+        if self.format == "pickle":
+            return pickle.dumps(pr, protocol=pickle.HIGHEST_PROTOCOL)
+        return _dumps(self._pr_to_dict(pr, cached_at))
+
+    def _decode_pr(self, data: bytes) -> PullRequest:
+        """Deserialize a stored PR, detecting pickle vs JSON entries."""
+        if data[:1] == _PICKLE_MARKER:
+            # Never unpickle unless this cache was configured to write pickles
+            if self.format != "pickle":
+                raise ValueError("pickled entry in a JSON-format cache")
+            return pickle.loads(data)
+        return self._dict_to_pr(_loads(data))
+
     def has_pr(self, repository: str, pr_number: int) -> bool:
         """Check if a PR is already cached."""
-        cache_file = self._get_pr_cache_file(repository, pr_number)
-        return cache_file.exists()
+        with self._db_lock:
+            row = self._get_db(repository).execute(
+                "SELECT 1 FROM prs WHERE number = ?", (pr_number,)
+            ).fetchone()
+        return row is not None
 
     def get_pr(self, repository: str, pr_number: int) -> Optional[PullRequest]:
         """Retrieve a PR from cache."""
-        cache_file = self._get_pr_cache_file(repository, pr_number)
-        if not cache_file.exists():
+        with self._db_lock:
+            row = self._get_db(repository).execute(
+                "SELECT data FROM prs WHERE number = ?", (pr_number,)
+            ).fetchone()
+        if row is None:
             return None
 
         try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-            return self._dict_to_pr(data)
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            print(f"Warning: Corrupted cache file {cache_file}: {e}")
+            return self._decode_pr(row[0])
+        except _DECODE_ERRORS as e:
+            print(f"Warning: Corrupted cache entry for PR #{pr_number}: {e}")
             return None
 
+    def get_prs(self, repository: str, pr_numbers: Iterable[int]) -> Dict[int, PullRequest]:
+        """
+        Retrieve several PRs from cache in batched queries.
+
+        Args:
+            repository: Repository name (e.g., "mozilla/bigquery-etl")
+            pr_numbers: PR numbers to look up
+
+        Returns:
+            Dict mapping PR number to cached PullRequest (uncached PRs are
+            left out)
+        """
+        numbers = list(dict.fromkeys(pr_numbers))
+        rows = []
+        with self._db_lock:
+            conn = self._get_db(repository)
+            for start in range(0, len(numbers), _SQLITE_MAX_PARAMS):
+                batch = numbers[start:start + _SQLITE_MAX_PARAMS]
+                placeholders = ", ".join("?" * len(batch))
+                rows.extend(conn.execute(
+                    f"SELECT number, data FROM prs WHERE number IN ({placeholders})", batch
+                ).fetchall())
+
+        prs = {}
+        for number, data in rows:
+            try:
+                prs[number] = self._decode_pr(data)
+            except _DECODE_ERRORS as e:
+                print(f"Warning: Corrupted cache entry for PR #{number}: {e}")
+        return prs
+
     def store_pr(self, repository: str, pr: PullRequest) -> None:
         """Store a PR in the cache."""
-        cache_file = self._get_pr_cache_file(repository, pr.number)
+        self.store_prs(repository, [pr])
 
+    def store_prs(self, repository: str, prs: Iterable[PullRequest]) -> None:
+        """
+        Store several PRs in the cache in one transaction.
+
+        Args:
+            repository: Repository name (e.g., "mozilla/bigquery-etl")
+            prs: PRs to store (replacing any cached copies)
+        """
+        cached_at = datetime.now().isoformat()
+        now = time.time()
+        rows = []
+        for pr in prs:
+            try:
+                rows.append((pr.number, now, self._encode_pr(pr, cached_at)))
+            except Exception as e:
+                print(f"Warning: Failed to cache PR #{pr.number}: {e}")
+
+        if not rows:
+            return
         try:
-            data = self._pr_to_dict(pr)
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with self._db_lock:
+                conn = self._get_db(repository)
+                with conn:
+                    conn.executemany("INSERT OR REPLACE INTO prs VALUES (?, ?, ?)", rows)
+        except sqlite3.Error as e:
+            print(f"Warning: Failed to cache {len(rows)} PR(s) for {repository}: {e}")
 
-            # Update index
-            self._update_index(repository, pr.number)
+    def get_cached_pr_numbers(self, repository: str) -> List[int]:
+        """Get list of PR numbers that are cached for a repository."""
+        with self._db_lock:
+            rows = self._get_db(repository).execute("SELECT number FROM prs ORDER BY number").fetchall()
+        return [number for (number,) in rows]
 
-        except Exception as e:
-            print(f"Warning: Failed to cache PR #{pr.number}: {e}")
+    def cleanup_old_cache(self, repository: str, days: int = 30) -> None:
+        """Remove cached PRs older than specified days."""
+        cutoff = time.time() - (days * 24 * 60 * 60)
 
-    def _update_index(self, repository: str, pr_number: int) -> None:
-        """Update the repository index with cached PR."""
-        index_file = self._get_index_file(repository)
+        with self._db_lock:
+            removed = self._get_db(repository).execute(
+                "DELETE FROM prs WHERE cached_at < ?", (cutoff,)
+            ).rowcount
+        if removed:
+            print(f"Removed {removed} old cached PR(s) for {repository}")
 
-        # Load existing index
-        index = {"cached_prs": [], "last_updated": None}
-        if index_file.exists():
-            try:
-                with open(index_file, 'r') as f:
-                    index = json.load(f)
-            except json.JSONDecodeError:
-                pass
+    def close(self) -> None:
+        """
+        Close the repository databases.
 
-        # Add PR to index if not already there
-        if pr_number not in index["cached_prs"]:
-            index["cached_prs"].append(pr_number)
-            index["cached_prs"].sort()
+        Called automatically when the cache is garbage collected or at
+        interpreter exit. The cache reopens databases on next use.
+        """
+        _close_connections(self._connections, self._db_lock)
 
-        index["last_updated"] = datetime.now().isoformat()
 
-        # Save updated index
-        with open(index_file, 'w') as f:
-            json.dump(index, f, indent=2)
+class ResponseCache:
+    """
+    Persistent cache of GitHub REST responses for conditional requests.
 
-    def get_cached_pr_numbers(self, repository: str) -> List[int]:
-        """Get list of PR numbers that are cached for a repository."""
-        index_file = self._get_index_file(repository)
-        if not index_file.exists():
-            return []
+    Each response body is stored with its ETag so the next request for the
+    same URL can send If-None-Match. GitHub answers unchanged resources with
+    304 Not Modified, which doesn't count against the rate limit.
 
+    Cache structure:
+    cache/
+    └── _responses/
+        └── <sha256 of URL>.json  # {"url": ..., "etag": ..., "link": ..., "body": ...}
+    """
+
+    def __init__(self, cache_dir: str = "cache"):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Directory to store cache files (shared with PRCache)
+        """
+        self.cache_dir = Path(cache_dir) / "_responses"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def cache_key(url: str, params: Optional[Dict[str, str]] = None) -> str:
+        """Build the cache key (full request URL) for a URL and its query parameters."""
+        if not params:
+            return url
+        return f"{url}?{urllib.parse.urlencode(sorted(params.items()))}"
+
+    def _get_cache_file(self, key: str) -> Path:
+        """Get cache file path for a request URL."""
+        return self.cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a cached response.
+
+        Returns:
+            Dict with "etag", "link" and "body", or None if not cached
+        """
+        # Opening directly (no exists() check first) saves a stat per lookup;
+        # a missing file is just another OSError
         try:
-            with open(index_file, 'r') as f:
-                index = json.load(f)
-            return index.get("cached_prs", [])
-        except json.JSONDecodeError:
-            return []
+            with open(self._get_cache_file(key), 'rb') as f:
+                entry = _loads(f.read())
+        except (json.JSONDecodeError, OSError):
+            return None
 
-    def cleanup_old_cache(self, repository: str, days: int = 30) -> None:
-        """Remove cache files older than specified days."""
-        repo_dir = self._get_repo_cache_dir(repository)
-        cutoff = datetime.now().timestamp() - (days * 24 * 60 * 60)
+        # Guard against hash collisions
+        return entry if entry.get("url") == key else None
 
-        for cache_file in repo_dir.glob("pr_*.json"):
-            if cache_file.stat().st_mtime < cutoff:
-                cache_file.unlink()
-                print(f"Removed old cache file: {cache_file}")
\ No newline at end of file
+    def store(self, key: str, etag: str, body: Any, link: Optional[str] = None) -> None:
+        """
+        Store a response body with its ETag (and pagination Link header, if any).
+
+        Args:
+            key: Cache key from cache_key()
+            etag: ETag response header
+            body: Parsed JSON response body
+            link: Link response header, needed to paginate from a 304
+        """
+        try:
+            with open(self._get_cache_file(key), 'wb') as f:
+                f.write(_dumps({"url": key, "etag": etag, "link": link, "body": body}))
+        except (OSError, TypeError) as e:
+            print(f"Warning: Failed to cache response for {key}: {e}")
@@ -6,19 +6,31 @@ Legacy commands (daily-digest, review-queue, etc.) require old service.py (remov
 """
 
 import argparse
-import json
+import functools
 import sys
 import os
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import date, datetime
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library encoder
+    orjson = None
+
+# Set once .env has been loaded, so repeated handle_ask calls in one
+# process (scripts, tests) don't re-read it
+_ENV_LOADED = False
 
 # Note: Old DeliveryVisibilityService removed - legacy commands disabled
 
 
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
     """
     Create the main argument parser.
 
+    Built once per process; the parser is reused by later calls (e.g. when
+    main() runs repeatedly in tests).
+
     Returns:
         Configured argument parser
     """
@@ -187,6 +199,17 @@ Examples:
     return parser
 
 
+def _to_json(data) -> str:
+    """Serialize data as indented JSON, converting unsupported values with str()."""
+    if orjson is not None:
+        # Serializes datetimes natively instead of calling str() on each
+        return orjson.dumps(
+            data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    import json
+    return json.dumps(data, indent=2, default=str)
+
+
 def parse_date(date_str: str) -> datetime:
     """
     Parse a date string in YYYY-MM-DD format.
@@ -200,6 +223,18 @@ def parse_date(date_str: str) -> datetime:
     Raises:
         ValueError: If date string is invalid
     """
+    # Fast path: date.fromisoformat is implemented in C, while strptime goes
+    # through the regex-based _strptime module. On 3.11+ fromisoformat also
+    # takes other ISO forms (20250102, 2025-W01-1), so it is only used for
+    # the exact YYYY-MM-DD shape
+    if len(date_str) == 10 and date_str[4] == date_str[7] == '-':
+        try:
+            parsed = date.fromisoformat(date_str)
+            return datetime(parsed.year, parsed.month, parsed.day)
+        except ValueError:
+            pass
+
+    # Anything else (e.g. unpadded 2025-1-2) gets the original parser
     try:
         return datetime.strptime(date_str, '%Y-%m-%d')
     except ValueError:
@@ -328,40 +363,47 @@ def handle_analyze(service, args) -> int:
         analysis = service.analyze_repository_activity(days=args.days)
 
         if args.json:
-            print(json.dumps(analysis, indent=2, default=str))
+            print(_to_json(analysis))
         else:
-            # Format as human-readable text
-            print(f"Repository Activity Analysis")
-            print(f"=" * 40)
-            print(f"Repository: {service.repository}")
-            print(f"Period: {analysis['period']['start_date']} to {analysis['period']['end_date']} ({analysis['period']['days']} days)")
-            print()
-
+            # Format as human-readable text, collected and written at once
+            period = analysis['period']
             summary = analysis['summary']
-            print(f"Summary:")
-            print(f"  Total merged PRs: {summary['total_merged_prs']}")
-            print(f"  Total contributors: {summary['total_contributors']}")
-            print(f"  Lines added: {summary['total_additions']:,}")
-            print(f"  Lines deleted: {summary['total_deletions']:,}")
-            print(f"  Average PR size: {summary['average_pr_size']:.0f} lines")
-            print()
-
-            if analysis['themes']:
-                print(f"Top Themes:")
-                for i, theme in enumerate(analysis['themes'][:5], 1):
-                    print(f"  {i}. {theme['name']} ({theme['pr_count']} PRs, {theme['total_changes']} lines)")
-                print()
-
-            if analysis['top_contributors']:
-                print(f"Top Contributors:")
-                for i, contributor in enumerate(analysis['top_contributors'][:5], 1):
-                    print(f"  {i}. @{contributor['username']} ({contributor['pr_count']} PRs)")
-                print()
-
-            if analysis['hotspots']:
-                print(f"Activity Hotspots:")
-                for i, hotspot in enumerate(analysis['hotspots'][:5], 1):
-                    print(f"  {i}. {hotspot['directory']} ({hotspot['changes']} lines changed)")
+            themes = analysis['themes']
+            contributors = analysis['top_contributors']
+            hotspots = analysis['hotspots']
+            lines = [
+                "Repository Activity Analysis",
+                "=" * 40,
+                f"Repository: {service.repository}",
+                f"Period: {period['start_date']} to {period['end_date']} ({period['days']} days)",
+                "",
+                "Summary:",
+                f"  Total merged PRs: {summary['total_merged_prs']}",
+                f"  Total contributors: {summary['total_contributors']}",
+                f"  Lines added: {summary['total_additions']:,}",
+                f"  Lines deleted: {summary['total_deletions']:,}",
+                f"  Average PR size: {summary['average_pr_size']:.0f} lines",
+                "",
+            ]
+
+            if themes:
+                lines.append("Top Themes:")
+                lines.extend(f"  {i}. {theme['name']} ({theme['pr_count']} PRs, {theme['total_changes']} lines)"
+                             for i, theme in enumerate(themes[:5], 1))
+                lines.append("")
+
+            if contributors:
+                lines.append("Top Contributors:")
+                lines.extend(f"  {i}. @{contributor['username']} ({contributor['pr_count']} PRs)"
+                             for i, contributor in enumerate(contributors[:5], 1))
+                lines.append("")
+
+            if hotspots:
+                lines.append("Activity Hotspots:")
+                lines.extend(f"  {i}. {hotspot['directory']} ({hotspot['changes']} lines changed)"
+                             for i, hotspot in enumerate(hotspots[:5], 1))
+
+            sys.stdout.write("\n".join(lines) + "\n")
 
         return 0
 
@@ -405,30 +447,39 @@ def handle_debug_pr(service, args) -> int:
     try:
         debug_info = service.debug_pr_categorization(args.pr_number)
 
-        print(f"PR Categorization Debug - #{debug_info['pr_number']}")
-        print(f"=" * 50)
-        print(f"Title: {debug_info['title']}")
-        print(f"Author: @{debug_info['author']}")
-        print(f"Files changed: {debug_info['files_changed']}")
-        print(f"Changes: +{debug_info['additions']} -{debug_info['deletions']}")
-        print(f"Labels: {', '.join(debug_info['labels']) if debug_info['labels'] else 'None'}")
-        print(f"Directory prefixes: {', '.join(debug_info['directory_prefixes']) if debug_info['directory_prefixes'] else 'None'}")
-        print()
-        print(f"Categorized as: {debug_info['actual_theme']}")
-        print()
-
-        if debug_info['theme_suggestions']:
-            print("Theme suggestions:")
-            for suggestion in debug_info['theme_suggestions']:
-                print(f"  - {suggestion}")
-
-        print()
-        print("File details:")
-        for file_detail in debug_info['file_details'][:10]:  # Limit to first 10 files
-            print(f"  {file_detail['status']}: {file_detail['filename']} (+{file_detail['additions']} -{file_detail['deletions']})")
-
-        if len(debug_info['file_details']) > 10:
-            print(f"  ... and {len(debug_info['file_details']) - 10} more files")
+        labels = ', '.join(debug_info['labels']) if debug_info['labels'] else 'None'
+        prefixes = ', '.join(debug_info['directory_prefixes']) if debug_info['directory_prefixes'] else 'None'
+        suggestions = debug_info['theme_suggestions']
+        file_details = debug_info['file_details']
+        lines = [
+            f"PR Categorization Debug - #{debug_info['pr_number']}",
+            "=" * 50,
+            f"Title: {debug_info['title']}",
+            f"Author: @{debug_info['author']}",
+            f"Files changed: {debug_info['files_changed']}",
+            f"Changes: +{debug_info['additions']} -{debug_info['deletions']}",
+            f"Labels: {labels}",
+            f"Directory prefixes: {prefixes}",
+            "",
+            f"Categorized as: {debug_info['actual_theme']}",
+            "",
+        ]
+
+        if suggestions:
+            lines.append("Theme suggestions:")
+            lines.extend(f"  - {suggestion}" for suggestion in suggestions)
+
+        lines.append("")
+        lines.append("File details:")
+        # Limit to first 10 files
+        lines.extend(f"  {file_detail['status']}: {file_detail['filename']} (+{file_detail['additions']} -{file_detail['deletions']})"
+                     for file_detail in file_details[:10])
+
+        extra_files = len(file_details) - 10
+        if extra_files > 0:
+            lines.append(f"  ... and {extra_files} more files")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
         return 0
 
@@ -451,16 +502,18 @@ def handle_repo_info(service, args) -> int:
     try:
         info = service.get_repository_info()
 
-        print(f"Repository Information")
-        print(f"=" * 30)
-        print(f"Name: {info['full_name']}")
-        print(f"Description: {info['description'] or 'No description'}")
-        print(f"Primary language: {info['language'] or 'Unknown'}")
-        print(f"Stars: {info['stars']:,}")
-        print(f"Forks: {info['forks']:,}")
-        print(f"Open issues: {info['open_issues']:,}")
-        print(f"Default branch: {info['default_branch']}")
-        print(f"Last updated: {info['last_updated']}")
+        sys.stdout.write("\n".join([
+            "Repository Information",
+            "=" * 30,
+            f"Name: {info['full_name']}",
+            f"Description: {info['description'] or 'No description'}",
+            f"Primary language: {info['language'] or 'Unknown'}",
+            f"Stars: {info['stars']:,}",
+            f"Forks: {info['forks']:,}",
+            f"Open issues: {info['open_issues']:,}",
+            f"Default branch: {info['default_branch']}",
+            f"Last updated: {info['last_updated']}",
+        ]) + "\n")
 
         return 0
 
@@ -479,14 +532,17 @@ def handle_ask(args) -> int:
     Returns:
         Exit code (0 for success)
     """
+    global _ENV_LOADED
     try:
-        from dotenv import load_dotenv
         from .llm_client import AnthropicLLMClient
         from .bq_data_source import BigQueryDataSource
         from .github_oracle import GitHubOracle
 
         # Load environment
-        load_dotenv()
+        if not _ENV_LOADED:
+            from dotenv import load_dotenv
+            load_dotenv()
+            _ENV_LOADED = True
 
         # Get config from environment or args
         project_id = os.getenv("BQ_PROJECT_ID", "mozdata-nonprod")
@@ -506,7 +562,8 @@ def handle_ask(args) -> int:
         data_source = BigQueryDataSource(
             project_id=project_id,
             dataset_id=dataset_id,
-            table_prefix=table_prefix
+            table_prefix=table_prefix,
+            verbose=args.verbose
         )
         llm_client = AnthropicLLMClient()
         oracle = GitHubOracle(data_source, llm_client)
@@ -530,6 +587,18 @@ def handle_ask(args) -> int:
         return 1
 
 
+# Command -> handler, for commands that are still available
+_HANDLERS = {
+    'ask': handle_ask,  # Main GitHubOracle command
+}
+
+# Commands that needed the removed service.py
+_LEGACY_COMMANDS = frozenset({
+    'daily-digest', 'biweekly-digest', 'review-queue', 'analyze',
+    'test-connection', 'debug-pr', 'repo-info',
+})
+
+
 def main() -> int:
     """
     Main CLI entry point.
@@ -547,11 +616,10 @@ def main() -> int:
 
     try:
         # Route to command handlers
-        if args.command == 'ask':
-            # Main GitHubOracle command
-            return handle_ask(args)
-        elif args.command in ['daily-digest', 'biweekly-digest', 'review-queue',
-                              'analyze', 'test-connection', 'debug-pr', 'repo-info']:
+        handler = _HANDLERS.get(args.command)
+        if handler is not None:
+            return handler(args)
+        elif args.command in _LEGACY_COMMANDS:
             # Legacy commands - service.py was removed
             print(f"⚠️  '{args.command}' command requires old service.py (removed in MVP)", file=sys.stderr)
             print(f"Use 'ask' command instead:", file=sys.stderr)
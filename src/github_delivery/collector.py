@@ -5,15 +5,29 @@ Handles interaction with the GitHub API to retrieve pull requests, reviews,
 and related metadata with proper error handling and rate limiting.
 """
 
+import asyncio
 import json
+import threading
 import time
 import urllib.request
 import urllib.parse
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
-from .models import PullRequest, Review, FileStat, PRState
-from .cache import PRCache
+from .models import PullRequest, Review, FileStat, PRState, parse_github_timestamp
+from .cache import PRCache, ResponseCache
+from .rate_limit import RateLimiter
+
+try:
+    import aiohttp
+except ImportError:  # Only required for the *_async collection methods
+    aiohttp = None
+
+try:
+    import requests
+except ImportError:  # Fall back to urllib (a new connection per request)
+    requests = None
 
 
 class GitHubAPIError(Exception):
@@ -26,16 +40,97 @@ class RateLimitError(GitHubAPIError):
     pass
 
 
+# Pull requests with their labels, reviews and (optionally) file stats, one page per request.
+# Ordered by most recently updated so collection can stop once it passes the window start.
+_PULL_REQUESTS_QUERY = """
+query($owner: String!, $name: String!, $states: [PullRequestState!], $pageSize: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: $pageSize, after: $cursor, states: $states,
+                 orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { endCursor hasNextPage }
+      nodes {
+        number title body state isDraft mergeable url
+        createdAt updatedAt mergedAt closedAt
+        baseRefName headRefName additions deletions changedFiles
+        author { login avatarUrl url }
+        labels(first: 20) { pageInfo { hasNextPage } nodes { name color description } }
+        assignees(first: 20) { pageInfo { hasNextPage } nodes { login avatarUrl url } }
+        reviewRequests(first: 20) {
+          pageInfo { hasNextPage }
+          nodes { requestedReviewer { ... on User { login avatarUrl url } } }
+        }
+        reviews(first: 50) {
+          pageInfo { hasNextPage }
+          nodes { databaseId state submittedAt body url author { login avatarUrl url } }
+        }
+        %(files)s
+      }
+    }
+  }
+}
+"""
+
+_FILES_SELECTION = "files(first: 100) { pageInfo { hasNextPage } nodes { path additions deletions changeType } }"
+
+# Nested connections that can be cut off by their first: limit
+_NESTED_CONNECTIONS = ('labels', 'assignees', 'reviewRequests', 'reviews', 'files')
+
+
+def _truncated_connections(node: Dict[str, Any]) -> List[str]:
+    """
+    List the nested connections of a GraphQL pullRequest node that have more pages.
+
+    Args:
+        node: GraphQL pullRequest node
+
+    Returns:
+        Names of the connections whose pageInfo reports hasNextPage
+    """
+    return [
+        name for name in _NESTED_CONNECTIONS
+        if ((node.get(name) or {}).get('pageInfo') or {}).get('hasNextPage')
+    ]
+
+
+def _parse_last_page(link_header: Optional[str]) -> Optional[int]:
+    """
+    Extract the last page number from a GitHub ``Link`` pagination header.
+
+    Args:
+        link_header: Raw ``Link`` header value (may be None)
+
+    Returns:
+        Last page number, or None if the response is not paginated
+    """
+    if not link_header:
+        return None
+
+    for part in link_header.split(','):
+        url_part, _, rel = part.partition(';')
+        if 'rel="last"' not in rel:
+            continue
+        query = urllib.parse.urlparse(url_part.strip().strip('<>')).query
+        page = urllib.parse.parse_qs(query).get('page')
+        if page:
+            return int(page[0])
+
+    return None
+
+
 class GitHubCollector:
     """
     Collects data from GitHub API with rate limiting and error handling.
 
-    Designed to work with the GitHub REST API using only Python standard library
-    to minimize dependencies.
+    Designed to work with the GitHub REST API with minimal dependencies:
+    synchronous requests go through a keep-alive requests.Session per thread
+    when requests is installed, and through urllib otherwise.
     """
 
+    # Number of REST requests in flight at once when enriching PRs
+    MAX_CONCURRENT_REQUESTS = 8
+
     def __init__(self, token: str, repository: str, api_base_url: str = "https://api.github.com",
-                 cache_dir: str = "cache"):
+                 cache_dir: str = "cache", etag_cache: bool = False, cache_format: str = "json"):
         """
         Initialize the GitHub collector.
 
@@ -44,6 +139,10 @@ class GitHubCollector:
             repository: Repository in format "owner/repo"
             api_base_url: Base URL for GitHub API
             cache_dir: Directory for persistent PR cache
+            etag_cache: Cache REST responses on disk and revalidate them with
+                If-None-Match (304s don't count against the rate limit)
+            cache_format: PR cache storage format, "json" or "pickle"
+                (see PRCache)
         """
         self.token = token
         self.repository = repository
@@ -53,10 +152,76 @@ class GitHubCollector:
             'Accept': 'application/vnd.github.v3+json',
             'User-Agent': 'GitHub-Delivery-Visibility/0.1.0'
         }
-        self.rate_limit_remaining = 5000
-        self.rate_limit_reset = datetime.now()
+        self.rate_limiter = RateLimiter()  # Per-resource budgets (REST core, GraphQL)
         self._is_public_repo = None  # Cache repository visibility
-        self.cache = PRCache(cache_dir)  # PR caching system
+        self.cache = PRCache(cache_dir, format=cache_format)  # PR caching system
+        self.response_cache = ResponseCache(cache_dir) if etag_cache else None
+
+        # Reuse connections across requests (pagination, files, reviews)
+        # instead of a new TCP+TLS handshake per call. requests.Session isn't
+        # documented as thread-safe, so each thread (e.g. the enrichment
+        # workers) gets its own, created on first use
+        self._thread_local = threading.local()
+
+    def _request_timeout(self, url: str) -> int:
+        """
+        Pick a request timeout based on request type and repository visibility.
+
+        Args:
+            url: API endpoint URL
+
+        Returns:
+            Timeout in seconds
+        """
+        is_diff_request = '/files' in url or '/pulls' in url
+        try:
+            if is_diff_request and self.is_public_repository():
+                return 90  # Longer timeout for diff-heavy requests on public repos
+        except Exception:
+            pass  # Fallback timeout if repo check fails
+        return 30  # Standard timeout
+
+    def _update_rate_limit(self, headers) -> None:
+        """Update rate limit tracking from GitHub response headers."""
+        self.rate_limiter.update(headers)
+
+    def _get_session(self) -> Optional["requests.Session"]:
+        """Get the calling thread's keep-alive session (None without requests)."""
+        if requests is None:
+            return None
+        session = getattr(self._thread_local, 'session', None)
+        if session is None:
+            session = self._thread_local.session = requests.Session()
+            session.headers.update(self.session_headers)
+        return session
+
+    def _send(self, full_url: str, headers: Dict[str, str], timeout: int) -> Tuple[int, Any, bytes]:
+        """
+        Send a GET request over the shared session (or urllib without requests).
+
+        Args:
+            full_url: URL including the query string
+            headers: Request headers
+            timeout: Request timeout in seconds
+
+        Returns:
+            Tuple of (status code, response headers, raw body)
+
+        Raises:
+            OSError: On network errors and timeouts (requests' exceptions
+                derive from it too)
+        """
+        session = self._get_session()
+        if session is not None:
+            response = session.get(full_url, headers=headers, timeout=timeout)
+            return response.status_code, response.headers, response.content
+
+        req = urllib.request.Request(full_url, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as response:
+                return response.status, response.headers, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers, e.read()
 
     def _make_request(self, url: str, params: Optional[Dict[str, str]] = None,
                       max_retries: int = 3, timeout: int = None) -> Dict[str, Any]:
@@ -78,20 +243,10 @@ class GitHubCollector:
         """
         # Auto-calculate timeout based on request type and repository visibility
         if timeout is None:
-            is_diff_request = '/files' in url or '/pulls' in url
-            try:
-                if is_diff_request and self.is_public_repository():
-                    timeout = 90  # Longer timeout for diff-heavy requests on public repos
-                else:
-                    timeout = 30  # Standard timeout
-            except Exception:
-                timeout = 30  # Fallback timeout if repo check fails
+            timeout = self._request_timeout(url)
 
-        # Check rate limit
-        if self.rate_limit_remaining <= 1 and datetime.now() < self.rate_limit_reset:
-            sleep_time = (self.rate_limit_reset - datetime.now()).total_seconds()
-            print(f"Rate limit reached. Sleeping for {sleep_time:.1f} seconds...")
-            time.sleep(sleep_time + 1)
+        # Check the REST rate limit (GraphQL has its own budget)
+        self.rate_limiter.wait_if_needed(min_remaining=2, resource='core')
 
         # Build URL with parameters
         if params:
@@ -100,61 +255,66 @@ class GitHubCollector:
         else:
             full_url = url
 
-        # Create request
-        req = urllib.request.Request(full_url, headers=self.session_headers)
+        # Revalidate a cached response instead of downloading it again
+        cache_key = None
+        cached = None
+        headers = self.session_headers
+        if self.response_cache is not None:
+            cache_key = self.response_cache.cache_key(url, params)
+            cached = self.response_cache.get(cache_key)
+            if cached:
+                headers = {**headers, 'If-None-Match': cached['etag']}
 
         # Retry logic
-        last_exception = None
+        last_error = None
         for attempt in range(max_retries + 1):
             try:
                 # Make request with dynamic timeout
-                with urllib.request.urlopen(req, timeout=timeout) as response:
-                    # Update rate limit info
-                    self.rate_limit_remaining = int(response.headers.get('X-RateLimit-Remaining', 5000))
-                    reset_timestamp = int(response.headers.get('X-RateLimit-Reset', time.time()))
-                    self.rate_limit_reset = datetime.fromtimestamp(reset_timestamp)
-
-                    # Parse response
-                    data = json.loads(response.read().decode('utf-8'))
-                    return data
+                status, response_headers, body = self._send(full_url, headers, timeout)
 
-            except urllib.error.HTTPError as e:
-                if e.code == 403:
+                if status == 304 and cached:
+                    # Not modified: reuse the cached body (free against the rate limit)
+                    self._update_rate_limit(response_headers)
+                    return cached['body']
+                elif status == 403:
                     # Check if it's a rate limit error
                     try:
-                        error_data = json.loads(e.read().decode('utf-8'))
+                        error_data = json.loads(body)
                         if 'rate limit' in error_data.get('message', '').lower():
                             raise RateLimitError("GitHub API rate limit exceeded")
                     except json.JSONDecodeError:
                         pass
-                    raise GitHubAPIError(f"GitHub API access forbidden: {e}")
-                elif e.code == 404:
+                    raise GitHubAPIError(f"GitHub API access forbidden: {status}")
+                elif status == 404:
                     raise GitHubAPIError(f"GitHub API endpoint not found: {url}")
+                elif status >= 300:
+                    last_error = GitHubAPIError(f"GitHub API error {status}")
                 else:
-                    last_exception = e
+                    # Update rate limit info
+                    self._update_rate_limit(response_headers)
+
+                    # Parse response
+                    data = json.loads(body)
+
+                    etag = response_headers.get('ETag')
+                    if cache_key and etag:
+                        self.response_cache.store(cache_key, etag, data, response_headers.get('Link'))
+                    return data
 
             except (urllib.error.URLError, TimeoutError, OSError) as e:
-                last_exception = e
+                last_error = GitHubAPIError(f"Network/timeout error: {e}")
 
             except json.JSONDecodeError as e:
-                last_exception = e
+                last_error = GitHubAPIError(f"Invalid JSON response: {e}")
 
             # If we get here, the request failed - retry with exponential backoff
             if attempt < max_retries:
                 wait_time = (2 ** attempt) + 1  # 2, 3, 5 seconds
                 print(f"Request failed (attempt {attempt + 1}/{max_retries + 1}), retrying in {wait_time}s...")
                 time.sleep(wait_time)
-            else:
-                # Final attempt failed
-                if isinstance(last_exception, urllib.error.HTTPError):
-                    raise GitHubAPIError(f"GitHub API error {last_exception.code}: {last_exception}")
-                elif isinstance(last_exception, (urllib.error.URLError, TimeoutError, OSError)):
-                    raise GitHubAPIError(f"Network/timeout error: {last_exception}")
-                else:
-                    raise GitHubAPIError(f"Invalid JSON response: {last_exception}")
 
-        # Should never reach here
-        raise GitHubAPIError("Unexpected error in request retry logic")
+        # Final attempt failed
+        raise last_error
 
     def _get_all_pages(self, url: str, params: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
         """
@@ -168,13 +328,13 @@ class GitHubCollector:
             List of all items across all pages
         """
         all_items = []
-        current_params = params.copy() if params else {}
-        current_params.setdefault('per_page', '100')  # Max items per page
+        base_params = params.copy() if params else {}
+        base_params.setdefault('per_page', '100')  # Max items per page
+        per_page = int(base_params['per_page'])
 
         page = 1
         while True:
-            current_params['page'] = str(page)
-            data = self._make_request(url, current_params)
+            data = self._make_request(url, dict(base_params, page=str(page)))
 
             if not isinstance(data, list):
                 # Single item response, not paginated
@@ -183,7 +343,7 @@ class GitHubCollector:
             all_items.extend(data)
 
             # Check if we got fewer items than requested (last page)
-            if len(data) < int(current_params['per_page']):
+            if len(data) < per_page:
                 break
 
             page += 1
@@ -225,21 +385,18 @@ class GitHubCollector:
         print(f"Fetching merged PRs from {since_str} to {until_str}...")
         pr_data = self._get_all_pages(url, params)
 
-        merged_prs = []
-        for pr_item in pr_data:
-            # Skip if not merged or outside time window
-            if not pr_item.get('merged_at'):
-                continue
+        # Skip if not merged or outside time window
+        pr_data = [pr_item for pr_item in pr_data if self._is_merged_within(pr_item, since, until)]
 
-            merged_at = datetime.fromisoformat(pr_item['merged_at'].replace('Z', '+00:00'))
-            # Note: until is exclusive (e.g., end_date + 1 day from user input)
-            if merged_at < since or merged_at >= until:
-                continue
+        # Check cache first (one lookup for the whole listing)
+        cached_prs = self.cache.get_prs(self.repository, [pr_item['number'] for pr_item in pr_data])
 
+        merged_prs = []
+        to_enrich = []
+        for pr_item in pr_data:
             pr_number = pr_item['number']
 
-            # Check cache first
-            cached_pr = self.cache.get_pr(self.repository, pr_number)
+            cached_pr = cached_prs.get(pr_number)
             if cached_pr:
                 print(f"Using cached data for PR #{pr_number}")
                 merged_prs.append(cached_pr)
@@ -247,24 +404,31 @@ class GitHubCollector:
 
             # Create PR object from API data
             pr = PullRequest.from_github_data(pr_item)
-
-            # Fetch additional data (files, reviews) if needed
-            pr = self._enrich_pull_request(pr)
-
-            # Cache the enriched PR
-            self.cache.store_pr(self.repository, pr)
-
+            to_enrich.append(pr)
             merged_prs.append(pr)
 
+        # Fetch additional data (files, reviews) for uncached PRs, and cache them
+        self._enrich_pull_requests(to_enrich)
+
         print(f"Found {len(merged_prs)} merged PRs")
         return merged_prs
 
-    def get_open_prs(self, limit: int = 100) -> List[PullRequest]:
+    @staticmethod
+    def _is_merged_within(pr_item: Dict[str, Any], since: datetime, until: datetime) -> bool:
+        """Check whether a PR list item was merged inside [since, until)."""
+        if not pr_item.get('merged_at'):
+            return False
+
+        merged_at = parse_github_timestamp(pr_item['merged_at'])
+        # Note: until is exclusive (e.g., end_date + 1 day from user input)
+        return since <= merged_at < until
+
+    def get_open_prs(self, limit: Optional[int] = 100) -> List[PullRequest]:
         """
         Get all open PRs.
 
         Args:
-            limit: Maximum number of PRs to fetch
+            limit: Maximum number of PRs to fetch (None for all open PRs)
 
         Returns:
             List of open PullRequest objects
@@ -274,32 +438,31 @@ class GitHubCollector:
             'state': 'open',
             'sort': 'updated',
             'direction': 'desc',
-            'per_page': str(min(limit, 100))
+            'per_page': str(min(limit, 100)) if limit else '100'
         }
 
         print("Fetching open PRs...")
         pr_data = self._get_all_pages(url, params)
 
         # Limit results
-        pr_data = pr_data[:limit]
+        if limit:
+            pr_data = pr_data[:limit]
+
+        # Check cache first (but still enrich open PRs since they change frequently)
+        cached_prs = self.cache.get_prs(self.repository, [pr_item['number'] for pr_item in pr_data])
 
         open_prs = []
         for pr_item in pr_data:
-            pr_number = pr_item['number']
-
-            # Check cache first (but still enrich open PRs since they change frequently)
-            cached_pr = self.cache.get_pr(self.repository, pr_number)
+            cached_pr = cached_prs.get(pr_item['number'])
             if cached_pr and cached_pr.state.value == 'open':
                 # For open PRs, we still want fresh review data, so re-enrich
-                pr = self._enrich_pull_request(cached_pr)
-                self.cache.store_pr(self.repository, pr)  # Update cache
+                open_prs.append(cached_pr)
             else:
                 # Create new PR object
-                pr = PullRequest.from_github_data(pr_item)
-                pr = self._enrich_pull_request(pr)
-                self.cache.store_pr(self.repository, pr)
+                open_prs.append(PullRequest.from_github_data(pr_item))
 
-            open_prs.append(pr)
+        # Enrich and (re)cache every open PR
+        self._enrich_pull_requests(open_prs)
 
         print(f"Found {len(open_prs)} open PRs")
         return open_prs
@@ -326,37 +489,589 @@ class GitHubCollector:
         print(f"Found {len(review_requests)} PRs awaiting review from {username}")
         return review_requests
 
-    def _enrich_pull_request(self, pr: PullRequest) -> PullRequest:
+    def _enrich_pull_requests(self, prs: List[PullRequest], chunk_size: int = 50) -> None:
+        """
+        Enrich PRs with additional data (files, reviews) and cache them.
+
+        The files and reviews of every PR in a chunk are fetched concurrently,
+        up to MAX_CONCURRENT_REQUESTS requests at a time.
+
+        Args:
+            prs: PullRequest objects to enrich in place
+            chunk_size: Number of PRs enriched concurrently
+        """
+        if not prs:
+            return
+
+        # Look up repository visibility once, before the worker threads need it
+        try:
+            is_public = self.is_public_repository()
+        except GitHubAPIError:
+            is_public = False
+
+        repo_url = f"{self.api_base_url}/repos/{self.repository}"
+        with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_REQUESTS, 2 * len(prs))) as executor:
+            for i in range(0, len(prs), chunk_size):
+                # Each PR needs at least two REST calls (files + reviews)
+                self.rate_limiter.wait_if_needed(min_remaining=2 * chunk_size, resource='core')
+                chunk = prs[i:i + chunk_size]
+
+                futures = []
+                for pr in chunk:
+                    # For public repos, we can safely include patch content for LLM analysis
+                    if is_public:
+                        print(f"Fetching diff content for public repo PR #{pr.number}")
+                    futures.append((
+                        pr,
+                        executor.submit(self._get_all_pages, f"{repo_url}/pulls/{pr.number}/files"),
+                        executor.submit(self._get_all_pages, f"{repo_url}/pulls/{pr.number}/reviews"),
+                    ))
+
+                for pr, files_future, reviews_future in futures:
+                    try:
+                        pr.file_stats = [FileStat.from_github_data(file_data)
+                                         for file_data in files_future.result()]
+                    except GitHubAPIError as e:
+                        print(f"Warning: Could not fetch files for PR #{pr.number}: {e}")
+
+                    try:
+                        pr.reviews = [Review.from_github_data(review_data)
+                                      for review_data in reviews_future.result()]
+                    except GitHubAPIError as e:
+                        print(f"Warning: Could not fetch reviews for PR #{pr.number}: {e}")
+
+                self.cache.store_prs(self.repository, chunk)
+
+    async def _make_request_async(self, session: "aiohttp.ClientSession", url: str,
+                                  params: Optional[Dict[str, str]] = None,
+                                  max_retries: int = 3, method: str = 'GET',
+                                  json_body: Optional[Dict[str, Any]] = None) -> Tuple[Any, Any]:
+        """
+        Async counterpart of _make_request using a shared aiohttp session.
+
+        Args:
+            session: Shared aiohttp.ClientSession (one connection pool per run)
+            url: API endpoint URL
+            params: Query parameters
+            max_retries: Maximum number of retry attempts
+            method: HTTP method (GET for REST, POST for GraphQL)
+            json_body: Optional JSON request body
+
+        Returns:
+            Tuple of (JSON response data, response headers)
+
+        Raises:
+            RateLimitError: When rate limit is exceeded
+            GitHubAPIError: For other API errors
+        """
+        timeout = aiohttp.ClientTimeout(total=self._request_timeout(url))
+
+        # Check the budget this request draws from (REST core or GraphQL)
+        resource = 'graphql' if url.endswith('/graphql') else 'core'
+        await self.rate_limiter.wait_if_needed_async(min_remaining=2, resource=resource)
+
+        # Revalidate a cached response instead of downloading it again
+        cache_key = None
+        cached = None
+        headers = self.session_headers
+        if self.response_cache is not None and method == 'GET':
+            cache_key = self.response_cache.cache_key(url, params)
+            cached = self.response_cache.get(cache_key)
+            if cached:
+                headers = {**headers, 'If-None-Match': cached['etag']}
+
+        last_error = None
+        for attempt in range(max_retries + 1):
+            try:
+                async with session.request(method, url, params=params, json=json_body,
+                                           headers=headers, timeout=timeout) as response:
+                    self._update_rate_limit(response.headers)
+
+                    if response.status == 304 and cached:
+                        # Not modified: reuse the cached body (free against the rate limit)
+                        response_headers = dict(response.headers)
+                        if cached.get('link'):
+                            response_headers.setdefault('Link', cached['link'])
+                        return cached['body'], response_headers
+                    elif response.status == 403:
+                        message = await response.text()
+                        if 'rate limit' in message.lower():
+                            raise RateLimitError("GitHub API rate limit exceeded")
+                        raise GitHubAPIError(f"GitHub API access forbidden: {response.status} {response.reason}")
+                    elif response.status == 404:
+                        raise GitHubAPIError(f"GitHub API endpoint not found: {url}")
+                    elif response.status >= 400:
+                        last_error = GitHubAPIError(f"GitHub API error {response.status}: {response.reason}")
+                    else:
+                        data = await response.json(content_type=None)
+
+                        etag = response.headers.get('ETag')
+                        if cache_key and etag:
+                            self.response_cache.store(cache_key, etag, data, response.headers.get('Link'))
+                        return data, response.headers
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = GitHubAPIError(f"Network/timeout error: {e}")
+
+            except json.JSONDecodeError as e:
+                last_error = GitHubAPIError(f"Invalid JSON response: {e}")
+
+            # If we get here, the request failed - retry with exponential backoff
+            if attempt < max_retries:
+                wait_time = (2 ** attempt) + 1  # 2, 3, 5 seconds
+                print(f"Request failed (attempt {attempt + 1}/{max_retries + 1}), retrying in {wait_time}s...")
+                await asyncio.sleep(wait_time)
+
+        raise last_error
+
+    async def _resolve_visibility_async(self, session: "aiohttp.ClientSession") -> None:
+        """
+        Look up repository visibility over the session, once per collector.
+
+        _request_timeout needs it for /pulls and /files requests; resolving it
+        here keeps the blocking is_public_repository() call out of the event
+        loop. If the lookup fails the repository is treated as private
+        (standard timeouts).
+
+        Args:
+            session: Shared aiohttp.ClientSession
+        """
+        if self._is_public_repo is not None:
+            return
+        try:
+            repo_info, _ = await self._make_request_async(
+                session, f"{self.api_base_url}/repos/{self.repository}"
+            )
+            self._is_public_repo = not repo_info.get('private', True)
+        except GitHubAPIError as e:
+            print(f"Warning: Could not check repository visibility: {e}")
+            self._is_public_repo = False
+
+    async def _get_all_pages_async(self, session: "aiohttp.ClientSession", url: str,
+                                   params: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch all pages of a paginated API response concurrently.
+
+        The first page is fetched on its own to read the ``Link`` header; the
+        remaining pages are then requested in parallel.
+
+        Args:
+            session: Shared aiohttp.ClientSession
+            url: API endpoint URL
+            params: Query parameters
+
+        Returns:
+            List of all items across all pages (in page order)
+        """
+        base_params = params.copy() if params else {}
+        base_params.setdefault('per_page', '100')  # Max items per page
+
+        data, headers = await self._make_request_async(session, url, dict(base_params, page='1'))
+
+        if not isinstance(data, list):
+            # Single item response, not paginated
+            return [data] if data else []
+
+        last_page = _parse_last_page(headers.get('Link'))
+        if not last_page or last_page <= 1:
+            return data
+
+        # Safety check to match the synchronous pagination cap
+        if last_page > 100:  # Max 10,000 items
+            print(f"Warning: Stopped pagination at page 100 of {last_page} to avoid runaway fetches")
+            last_page = 100
+
+        async def fetch_page(page: int) -> List[Dict[str, Any]]:
+            page_data, _ = await self._make_request_async(session, url, dict(base_params, page=str(page)))
+            return page_data
+
+        pages = await asyncio.gather(*[fetch_page(page) for page in range(2, last_page + 1)])
+
+        all_items = list(data)
+        for page_data in pages:
+            all_items.extend(page_data)
+        return all_items
+
+    async def _enrich_pull_request_async(self, session: "aiohttp.ClientSession",
+                                         pr: PullRequest) -> PullRequest:
         """
-        Enrich a pull request with additional data (files, reviews).
+        Enrich a pull request with files and reviews, fetching both in parallel.
 
         Args:
+            session: Shared aiohttp.ClientSession
             pr: Base PullRequest object
 
         Returns:
             Enriched PullRequest object
         """
-        # Fetch file changes
-        try:
-            files_url = f"{self.api_base_url}/repos/{self.repository}/pulls/{pr.number}/files"
-            # For public repos, we can safely include patch content for LLM analysis
-            if self.is_public_repository():
-                print(f"Fetching diff content for public repo PR #{pr.number}")
-            files_data = self._get_all_pages(files_url)
+        files_url = f"{self.api_base_url}/repos/{self.repository}/pulls/{pr.number}/files"
+        reviews_url = f"{self.api_base_url}/repos/{self.repository}/pulls/{pr.number}/reviews"
+
+        files_data, reviews_data = await asyncio.gather(
+            self._get_all_pages_async(session, files_url),
+            self._get_all_pages_async(session, reviews_url),
+            return_exceptions=True
+        )
+
+        for result in (files_data, reviews_data):
+            if isinstance(result, BaseException) and not isinstance(result, GitHubAPIError):
+                raise result
+
+        if isinstance(files_data, GitHubAPIError):
+            print(f"Warning: Could not fetch files for PR #{pr.number}: {files_data}")
+        else:
             pr.file_stats = [FileStat.from_github_data(file_data) for file_data in files_data]
-        except GitHubAPIError as e:
-            print(f"Warning: Could not fetch files for PR #{pr.number}: {e}")
 
-        # Fetch reviews
-        try:
-            reviews_url = f"{self.api_base_url}/repos/{self.repository}/pulls/{pr.number}/reviews"
-            reviews_data = self._get_all_pages(reviews_url)
+        if isinstance(reviews_data, GitHubAPIError):
+            print(f"Warning: Could not fetch reviews for PR #{pr.number}: {reviews_data}")
+        else:
             pr.reviews = [Review.from_github_data(review_data) for review_data in reviews_data]
-        except GitHubAPIError as e:
-            print(f"Warning: Could not fetch reviews for PR #{pr.number}: {e}")
 
         return pr
 
+    async def _enrich_pull_requests_async(self, session: "aiohttp.ClientSession",
+                                          prs: List[PullRequest], chunk_size: int = 50) -> None:
+        """
+        Enrich and cache PRs concurrently, in chunks to bound in-flight requests.
+
+        Args:
+            session: Shared aiohttp.ClientSession
+            prs: PullRequest objects to enrich in place
+            chunk_size: Number of PRs enriched concurrently
+        """
+        await self._resolve_visibility_async(session)
+        for i in range(0, len(prs), chunk_size):
+            # Each PR needs at least two REST calls (files + reviews)
+            await self.rate_limiter.wait_if_needed_async(min_remaining=2 * chunk_size, resource='core')
+            chunk = prs[i:i + chunk_size]
+            tasks = [asyncio.ensure_future(self._enrich_pull_request_async(session, pr)) for pr in chunk]
+            await asyncio.gather(*tasks)
+
+            self.cache.store_prs(self.repository, chunk)
+
+    async def get_merged_prs_async(self, session: "aiohttp.ClientSession", since: datetime,
+                                   until: Optional[datetime] = None) -> List[PullRequest]:
+        """
+        Async variant of get_merged_prs that fetches pages and PR details concurrently.
+
+        Args:
+            session: Shared aiohttp.ClientSession
+            since: Start datetime for the window
+            until: End datetime for the window (defaults to now)
+
+        Returns:
+            List of merged PullRequest objects
+        """
+        if until is None:
+            from datetime import timezone
+            until = datetime.now(timezone.utc)
+
+        # GitHub API expects ISO format
+        since_str = since.strftime('%Y-%m-%dT%H:%M:%SZ')
+        until_str = until.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+        url = f"{self.api_base_url}/repos/{self.repository}/pulls"
+        params = {
+            'state': 'closed',
+            'sort': 'updated',
+            'direction': 'desc',
+            'since': since_str
+        }
+
+        print(f"Fetching merged PRs from {since_str} to {until_str}...")
+        await self._resolve_visibility_async(session)
+        pr_data = await self._get_all_pages_async(session, url, params)
+
+        # Skip if not merged or outside time window
+        pr_data = [pr_item for pr_item in pr_data if self._is_merged_within(pr_item, since, until)]
+
+        # Check cache first (one lookup for the whole listing)
+        cached_prs = self.cache.get_prs(self.repository, [pr_item['number'] for pr_item in pr_data])
+
+        merged_prs = []
+        to_enrich = []
+        for pr_item in pr_data:
+            pr_number = pr_item['number']
+
+            cached_pr = cached_prs.get(pr_number)
+            if cached_pr:
+                print(f"Using cached data for PR #{pr_number}")
+                merged_prs.append(cached_pr)
+                continue
+
+            pr = PullRequest.from_github_data(pr_item)
+            to_enrich.append(pr)
+            merged_prs.append(pr)
+
+        # Fetch additional data (files, reviews) for uncached PRs
+        await self._enrich_pull_requests_async(session, to_enrich)
+
+        print(f"Found {len(merged_prs)} merged PRs")
+        return merged_prs
+
+    async def get_open_prs_async(self, session: "aiohttp.ClientSession",
+                                 limit: Optional[int] = 100) -> List[PullRequest]:
+        """
+        Async variant of get_open_prs that enriches PRs concurrently.
+
+        Args:
+            session: Shared aiohttp.ClientSession
+            limit: Maximum number of PRs to fetch (None for all open PRs)
+
+        Returns:
+            List of open PullRequest objects
+        """
+        url = f"{self.api_base_url}/repos/{self.repository}/pulls"
+        params = {
+            'state': 'open',
+            'sort': 'updated',
+            'direction': 'desc',
+            'per_page': str(min(limit, 100)) if limit else '100'
+        }
+
+        print("Fetching open PRs...")
+        await self._resolve_visibility_async(session)
+        pr_data = await self._get_all_pages_async(session, url, params)
+
+        # Limit results
+        if limit:
+            pr_data = pr_data[:limit]
+
+        cached_prs = self.cache.get_prs(self.repository, [pr_item['number'] for pr_item in pr_data])
+
+        open_prs = []
+        for pr_item in pr_data:
+            # Open PRs change frequently, so always re-enrich (reuse cached object if present)
+            cached_pr = cached_prs.get(pr_item['number'])
+            if cached_pr and cached_pr.state.value == 'open':
+                open_prs.append(cached_pr)
+            else:
+                open_prs.append(PullRequest.from_github_data(pr_item))
+
+        await self._enrich_pull_requests_async(session, open_prs)
+
+        print(f"Found {len(open_prs)} open PRs")
+        return open_prs
+
+    async def _graphql_query_async(self, session: "aiohttp.ClientSession", query: str,
+                                   variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a GitHub GraphQL query.
+
+        Args:
+            session: Shared aiohttp.ClientSession
+            query: GraphQL query document
+            variables: Query variables
+
+        Returns:
+            The response's "data" object
+
+        Raises:
+            RateLimitError: When the GraphQL rate limit is exceeded
+            GitHubAPIError: If the query returns errors
+        """
+        url = f"{self.api_base_url}/graphql"
+        data, _ = await self._make_request_async(
+            session, url, method='POST', json_body={'query': query, 'variables': variables}
+        )
+
+        if data.get('errors'):
+            messages = '; '.join(error.get('message', str(error)) for error in data['errors'])
+            if any(error.get('type') == 'RATE_LIMITED' for error in data['errors']):
+                raise RateLimitError(f"GitHub GraphQL rate limit exceeded: {messages}")
+            raise GitHubAPIError(f"GitHub GraphQL error: {messages}")
+
+        return data['data']
+
+    async def get_prs_graphql_async(self, session: "aiohttp.ClientSession", since: datetime,
+                                    until: Optional[datetime] = None, state: str = 'merged',
+                                    page_size: int = 100, limit: Optional[int] = None,
+                                    include_patches: bool = True,
+                                    pr_queue: Optional["asyncio.Queue"] = None) -> List[PullRequest]:
+        """
+        Collect PRs with their labels, reviews and files via the GraphQL API.
+
+        One GraphQL request returns a whole page of PRs with their nested
+        reviews/labels/files, replacing the per-PR REST calls. Pages are read
+        newest-updated first, so merged collection stops as soon as it passes
+        the start of the window.
+
+        Args:
+            session: Shared aiohttp.ClientSession
+            since: Start datetime for the window. Merged PRs must be merged
+                after it; open PRs must have been updated after it.
+            until: End datetime for the window (defaults to now, merged PRs only)
+            state: 'merged' (merged within the window) or 'open'
+            page_size: Number of PRs per GraphQL request (max 100)
+            limit: Maximum number of PRs to return (None for no limit)
+            include_patches: Fetch file patches via REST (GraphQL has no diff content)
+            pr_queue: Optional queue that receives each PR as soon as its page
+                is read, so consumers (e.g. embedding) can start before
+                collection finishes. File patches, and lists that overflowed
+                their GraphQL page, may not be filled in yet.
+
+        Returns:
+            List of PullRequest objects
+        """
+        if until is None:
+            from datetime import timezone
+            until = datetime.now(timezone.utc)
+
+        owner, name = self.repository.split('/', 1)
+        # Patches come from REST /files, so only ask GraphQL for files when skipping them
+        query = _PULL_REQUESTS_QUERY % {'files': '' if include_patches else _FILES_SELECTION}
+        variables = {
+            'owner': owner,
+            'name': name,
+            'states': ['MERGED'] if state == 'merged' else ['OPEN'],
+            'pageSize': min(page_size, 100),
+            'cursor': None,
+        }
+
+        print(f"Fetching {state} PRs via GraphQL...")
+
+        prs = []
+        to_enrich = []
+        to_complete = []
+        pages = 0
+        done = False
+        while not done:
+            await self.rate_limiter.wait_if_needed_async(resource='graphql')
+            data = await self._graphql_query_async(session, query, variables)
+            connection = data['repository']['pullRequests']
+            pages += 1
+            page_start = len(prs)
+
+            # Merged PRs don't change, so reuse cached copies (one lookup per page)
+            cached_prs = {}
+            if state == 'merged':
+                cached_prs = self.cache.get_prs(self.repository, [node['number'] for node in connection['nodes']])
+
+            for node in connection['nodes']:
+                # Everything after this was last updated before the window opened
+                updated_at = parse_github_timestamp(node['updatedAt'])
+                if updated_at < since:
+                    done = True
+                    break
+
+                if state == 'merged':
+                    merged_at = parse_github_timestamp(node['mergedAt'])
+                    if not since <= merged_at < until:
+                        continue
+
+                    cached_pr = cached_prs.get(node['number'])
+                    if cached_pr:
+                        prs.append(cached_pr)
+                        continue
+
+                pr = PullRequest.from_graphql_data(node)
+                prs.append(pr)
+                to_enrich.append(pr)
+
+                truncated = _truncated_connections(node)
+                if truncated:
+                    to_complete.append((pr, truncated))
+
+                if limit is not None and len(prs) >= limit:
+                    done = True
+                    break
+
+            if pr_queue is not None:
+                for pr in prs[page_start:]:
+                    await pr_queue.put(pr)
+
+            if not connection['pageInfo']['hasNextPage']:
+                done = True
+            variables['cursor'] = connection['pageInfo']['endCursor']
+
+        print(f"  Read {pages} GraphQL page(s)")
+
+        if to_complete:
+            print(f"  Fetching the rest of truncated labels/reviews/files for {len(to_complete)} PR(s)...")
+            await self._complete_truncated_async(session, to_complete)
+        if include_patches:
+            await self._fetch_patches_async(session, to_enrich)
+        self.cache.store_prs(self.repository, to_enrich)
+
+        print(f"Found {len(prs)} {state} PRs")
+        return prs
+
+    async def _complete_truncated_async(self, session: "aiohttp.ClientSession",
+                                        truncated: List[Tuple[PullRequest, List[str]]],
+                                        chunk_size: int = 50) -> None:
+        """
+        Replace nested lists that overflowed their GraphQL page with the full REST lists.
+
+        Reviews and files come from their paginated REST endpoints; labels,
+        assignees and requested reviewers all come complete on the REST pull
+        request itself, so one call covers any of the three.
+
+        Args:
+            session: Shared aiohttp.ClientSession
+            truncated: (PullRequest, truncated connection names) pairs to update in place
+            chunk_size: Number of PRs completed concurrently
+        """
+        async def complete(pr: PullRequest, connections: List[str]) -> None:
+            pr_url = f"{self.api_base_url}/repos/{self.repository}/pulls/{pr.number}"
+            try:
+                if 'reviews' in connections:
+                    reviews_data = await self._get_all_pages_async(session, f"{pr_url}/reviews")
+                    pr.reviews = [Review.from_github_data(review_data) for review_data in reviews_data]
+                if 'files' in connections:
+                    files_data = await self._get_all_pages_async(session, f"{pr_url}/files")
+                    pr.file_stats = [FileStat.from_github_data(file_data) for file_data in files_data]
+                if {'labels', 'assignees', 'reviewRequests'} & set(connections):
+                    pr_data, _ = await self._make_request_async(session, pr_url)
+                    rest_pr = PullRequest.from_github_data(pr_data)
+                    pr.labels = rest_pr.labels
+                    pr.assignees = rest_pr.assignees
+                    pr.requested_reviewers = rest_pr.requested_reviewers
+            except GitHubAPIError as e:
+                print(f"Warning: Could not fetch the rest of {', '.join(connections)} for PR #{pr.number}: {e}")
+
+        await self._resolve_visibility_async(session)
+        for i in range(0, len(truncated), chunk_size):
+            # Up to three REST calls per PR (reviews, files, pull request)
+            await self.rate_limiter.wait_if_needed_async(min_remaining=3 * chunk_size, resource='core')
+            await asyncio.gather(*[complete(pr, connections) for pr, connections in truncated[i:i + chunk_size]])
+
+    async def _fetch_patches_async(self, session: "aiohttp.ClientSession",
+                                   prs: List[PullRequest], chunk_size: int = 50) -> None:
+        """
+        Fill in file stats (including patch content) from the REST files endpoint.
+
+        Args:
+            session: Shared aiohttp.ClientSession
+            prs: PullRequest objects to update in place
+            chunk_size: Number of PRs fetched concurrently
+        """
+        async def fetch_files(pr: PullRequest) -> None:
+            files_url = f"{self.api_base_url}/repos/{self.repository}/pulls/{pr.number}/files"
+            try:
+                files_data = await self._get_all_pages_async(session, files_url)
+                pr.file_stats = [FileStat.from_github_data(file_data) for file_data in files_data]
+            except GitHubAPIError as e:
+                print(f"Warning: Could not fetch files for PR #{pr.number}: {e}")
+
+        await self._resolve_visibility_async(session)
+        for i in range(0, len(prs), chunk_size):
+            # Each chunk needs at least one REST call per PR
+            await self.rate_limiter.wait_if_needed_async(min_remaining=chunk_size, resource='core')
+            await asyncio.gather(*[fetch_files(pr) for pr in prs[i:i + chunk_size]])
+
+    def refresh_rate_limit(self) -> RateLimiter:
+        """
+        Load current rate limit budgets from GET /rate_limit.
+
+        This call does not count against the rate limit.
+
+        Returns:
+            The collector's RateLimiter, updated for all resources
+        """
+        status = self._make_request(f"{self.api_base_url}/rate_limit")
+        self.rate_limiter.update_from_status(status)
+        return self.rate_limiter
+
     def get_repository_info(self) -> Dict[str, Any]:
         """
         Get basic repository information.
@@ -5,11 +5,50 @@ This module converts text into vector embeddings for semantic search.
 Uses Google's text-embedding-004 model which produces 768-dimensional vectors.
 """
 
-from typing import List, Optional
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from google import genai
 from google.genai import types
 
 
+# Process-wide LRU of text -> embedding, keyed by (model, sha256 of text).
+# Shared by every EmbeddingGenerator so re-runs over the same PRs, and texts
+# repeated between PR bodies, reviews and patches, skip the API. Vectors are
+# stored as float32 arrays (~3 KB each instead of ~25 KB as a list), the
+# model's native precision and what BigQuery staging loads write anyway.
+_EMBEDDING_CACHE: "OrderedDict[Tuple[str, str], array]" = OrderedDict()
+_EMBEDDING_CACHE_SIZE = 40000
+_EMBEDDING_CACHE_LOCK = threading.Lock()
+
+
+def _text_key(model: str, text: str) -> Tuple[str, str]:
+    """Build the embedding cache key for a text."""
+    return model, hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _get_cached_embedding(key: Tuple[str, str]) -> Optional[List[float]]:
+    """Look up an embedding in the process-wide cache."""
+    with _EMBEDDING_CACHE_LOCK:
+        vector = _EMBEDDING_CACHE.get(key)
+        if vector is None:
+            return None
+        _EMBEDDING_CACHE.move_to_end(key)
+    return vector.tolist()
+
+
+def _cache_embedding(key: Tuple[str, str], embedding: List[float]) -> None:
+    """Store an embedding in the process-wide cache, evicting the oldest."""
+    with _EMBEDDING_CACHE_LOCK:
+        _EMBEDDING_CACHE[key] = array("f", embedding)
+        _EMBEDDING_CACHE.move_to_end(key)
+        while len(_EMBEDDING_CACHE) > _EMBEDDING_CACHE_SIZE:
+            _EMBEDDING_CACHE.popitem(last=False)
+
+
 class EmbeddingGenerator:
     """
     Generates vector embeddings from text using Vertex AI.
@@ -28,6 +67,15 @@ class EmbeddingGenerator:
     MODEL_NAME = "text-embedding-004"
     EMBEDDING_DIMENSION = 768
 
+    # Request size budget for batching (~4 chars per token against the
+    # 20k-token per-request limit). Inputs are truncated by the model at
+    # 2048 tokens, so longer texts only count up to MAX_INPUT_CHARS.
+    MAX_BATCH_CHARS = 60000
+    MAX_INPUT_CHARS = 8000
+
+    # Number of embedding requests in flight at once per batch call
+    MAX_CONCURRENT_REQUESTS = 4
+
     def __init__(
         self,
         project_id: str = "mozdata",
@@ -121,13 +169,20 @@ class EmbeddingGenerator:
         - Batching is more efficient than one-at-a-time
         - We use batch_size=5 as a conservative default
 
+        Texts are sorted by length before being split into batches ("smart
+        batching"), so each request carries similarly-sized inputs and large
+        batch sizes stay within the per-request token budget. Up to
+        MAX_CONCURRENT_REQUESTS batches are sent at once. Identical texts
+        are only embedded once, and texts embedded earlier in this process
+        are served from an in-memory cache.
+
         Args:
             texts: List of texts to embed
-            batch_size: Number of texts per API call (default: 5)
+            batch_size: Maximum number of texts per API call (default: 5)
 
         Returns:
             List of embeddings (same order as input texts)
-            None for any text that failed to embed
+            None for any text that was empty or failed to embed
 
         Example:
             >>> texts = ["Fix bug", "Add feature", "Update docs"]
@@ -137,60 +192,98 @@ class EmbeddingGenerator:
             >>> len(embeddings[0])  # Each embedding has 768 dimensions
             768
         """
-        all_embeddings: List[Optional[List[float]]] = []
-
-        print(f"✓ Generating embeddings for {len(texts)} texts in batches of {batch_size}")
-
-        # Process texts in batches
-        for i in range(0, len(texts), batch_size):
-            # Get a batch of texts
-            batch = texts[i:i + batch_size]
-            batch_num = (i // batch_size) + 1
-            total_batches = (len(texts) + batch_size - 1) // batch_size
-
-            print(f"  Processing batch {batch_num}/{total_batches}...")
-
-            # Filter out empty strings (they would cause errors)
-            # Keep track of which positions had valid text
-            valid_texts = []
-            valid_indices = []
-
-            for j, text in enumerate(batch):
-                if text and text.strip():
-                    valid_texts.append(text)
-                    valid_indices.append(j)
-
-            # Generate embeddings for valid texts
-            if valid_texts:
-                try:
-                    # Call Vertex AI with the batch
-                    response = self.client.models.embed_content(
-                        model=self.MODEL_NAME,
-                        contents=valid_texts
-                    )
-
-                    # Create result list for this batch
-                    # Initialize with None for all positions
-                    batch_results: List[Optional[List[float]]] = [None] * len(batch)
-
-                    # Fill in the embeddings for valid texts
-                    for idx, embedding_obj in zip(valid_indices, response.embeddings):
-                        batch_results[idx] = embedding_obj.values
-
-                    all_embeddings.extend(batch_results)
-                    print(f"    ✓ Generated {len(valid_texts)} embeddings")
-
-                except Exception as e:
-                    # If batch fails, return None for all texts in batch
-                    print(f"    ✗ Error: {e}")
-                    all_embeddings.extend([None] * len(batch))
-            else:
-                # No valid texts in this batch
-                all_embeddings.extend([None] * len(batch))
-                print(f"    ⊘ No valid texts in batch")
+        all_embeddings: List[Optional[List[float]]] = [None] * len(texts)
+
+        # Empty texts never reach the API (they stay None), and each distinct
+        # text is embedded once and shared by every position it appears at
+        positions: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            if text and text.strip():
+                positions.setdefault(text, []).append(i)
+
+        # Serve texts embedded earlier in this process from the cache
+        keys = {text: _text_key(self.MODEL_NAME, text) for text in positions}
+        cached_count = 0
+        for text in list(positions):
+            embedding = _get_cached_embedding(keys[text])
+            if embedding is not None:
+                for position in positions.pop(text):
+                    all_embeddings[position] = embedding
+                cached_count += 1
+        unique_texts = list(positions)
+
+        # Order texts by length, then cut batches by count and size budget
+        order = sorted(range(len(unique_texts)), key=lambda i: len(unique_texts[i]))
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_chars = 0
+
+        for i in order:
+            text_chars = min(len(unique_texts[i]), self.MAX_INPUT_CHARS)
+            if current and (len(current) >= batch_size or
+                            current_chars + text_chars > self.MAX_BATCH_CHARS):
+                batches.append(current)
+                current, current_chars = [], 0
+            current.append(i)
+            current_chars += text_chars
+
+        if current:
+            batches.append(current)
+
+        non_empty_count = sum(len(indices) for indices in positions.values())
+        empty_count = sum(1 for text in texts if not text or not text.strip())
+        print(f"✓ Generating embeddings for {len(unique_texts)} unique texts in {len(batches)} batches "
+              f"(up to {batch_size} per batch; {non_empty_count - len(unique_texts)} duplicates, "
+              f"{cached_count} cached and {empty_count} empty skipped)")
+
+        # Each request is network-bound, so batches are sent concurrently
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS) as executor:
+            futures = [
+                executor.submit(self._embed_batch, unique_texts, batch_indices, batch_num, len(batches))
+                for batch_num, batch_indices in enumerate(batches, 1)
+            ]
+            for future in futures:
+                for idx, embedding in future.result():
+                    _cache_embedding(keys[unique_texts[idx]], embedding)
+                    for position in positions[unique_texts[idx]]:
+                        all_embeddings[position] = embedding
 
         return all_embeddings
 
+    def _embed_batch(
+        self,
+        texts: List[str],
+        batch_indices: List[int],
+        batch_num: int,
+        total_batches: int
+    ) -> List[Tuple[int, List[float]]]:
+        """
+        Embed one batch of texts.
+
+        Args:
+            texts: All input texts
+            batch_indices: Positions of (non-empty) texts that make up this batch
+            batch_num: Batch number (for progress output)
+            total_batches: Total number of batches (for progress output)
+
+        Returns:
+            List of (original index, embedding) pairs; empty if the batch failed
+        """
+        try:
+            # Call Vertex AI with the batch
+            response = self.client.models.embed_content(
+                model=self.MODEL_NAME,
+                contents=[texts[i] for i in batch_indices]
+            )
+
+            print(f"  ✓ Batch {batch_num}/{total_batches}: generated {len(batch_indices)} embeddings")
+            return [(idx, embedding_obj.values) for idx, embedding_obj in zip(batch_indices, response.embeddings)]
+
+        except Exception as e:
+            # If batch fails, leave None for all texts in batch
+            print(f"  ✗ Batch {batch_num}/{total_batches}: error: {e}")
+            return []
+
     def get_embedding_dimension(self) -> int:
         """
         Get the dimensionality of embeddings produced by this generator.
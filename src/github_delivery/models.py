@@ -10,6 +10,24 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
+try:
+    from ciso8601 import parse_datetime as _parse_iso8601
+except ImportError:  # Optional C parser; fall back to the standard library
+    _parse_iso8601 = None
+
+
+def parse_github_timestamp(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp from the GitHub API (e.g. "2024-01-15T10:30:00Z").
+
+    Uses ciso8601 when installed (much faster for large backfills), otherwise
+    datetime.fromisoformat. Returns a timezone-aware datetime.
+    """
+    if _parse_iso8601 is not None:
+        return _parse_iso8601(value)
+    # fromisoformat only accepts the "Z" suffix on Python 3.11+
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
 
 class PRState(Enum):
     """Pull request state."""
@@ -45,6 +63,18 @@ class User:
             html_url=data.get('html_url')
         )
 
+    @classmethod
+    def from_graphql_data(cls, data: Optional[Dict[str, Any]]) -> 'User':
+        """Create User from a GitHub GraphQL actor node (None for deleted users)."""
+        if not data:
+            return cls(login='ghost')
+        return cls(
+            login=data['login'],
+            name=data.get('name'),
+            avatar_url=data.get('avatarUrl'),
+            html_url=data.get('url')
+        )
+
 
 @dataclass
 class Label:
@@ -62,6 +92,11 @@ class Label:
             description=data.get('description')
         )
 
+    @classmethod
+    def from_graphql_data(cls, data: Dict[str, Any]) -> 'Label':
+        """Create Label from a GitHub GraphQL label node."""
+        return cls.from_github_data(data)
+
 
 @dataclass
 class FileStat:
@@ -92,6 +127,27 @@ class FileStat:
             patch=data.get('patch')  # Include patch content if available
         )
 
+    # GraphQL PatchStatus -> REST file status
+    _GRAPHQL_STATUS = {
+        'ADDED': 'added',
+        'DELETED': 'removed',
+        'MODIFIED': 'modified',
+        'RENAMED': 'renamed',
+        'COPIED': 'copied',
+        'CHANGED': 'changed',
+    }
+
+    @classmethod
+    def from_graphql_data(cls, data: Dict[str, Any]) -> 'FileStat':
+        """Create FileStat from a GitHub GraphQL file node (no patch content)."""
+        return cls(
+            filename=data['path'],
+            additions=data['additions'],
+            deletions=data['deletions'],
+            changes=data['additions'] + data['deletions'],
+            status=cls._GRAPHQL_STATUS.get(data['changeType'], data['changeType'].lower())
+        )
+
 
 @dataclass
 class Review:
@@ -106,7 +162,7 @@ class Review:
     @classmethod
     def from_github_data(cls, data: Dict[str, Any]) -> 'Review':
         """Create Review from GitHub API response."""
-        submitted_at = datetime.fromisoformat(data['submitted_at'].replace('Z', '+00:00'))
+        submitted_at = parse_github_timestamp(data['submitted_at'])
         return cls(
             id=data['id'],
             user=User.from_github_data(data['user']),
@@ -116,6 +172,19 @@ class Review:
             html_url=data.get('html_url')
         )
 
+    @classmethod
+    def from_graphql_data(cls, data: Dict[str, Any]) -> 'Review':
+        """Create Review from a GitHub GraphQL review node."""
+        submitted_at = parse_github_timestamp(data['submittedAt'])
+        return cls(
+            id=data['databaseId'],
+            user=User.from_graphql_data(data.get('author')),
+            state=ReviewState(data['state']),
+            submitted_at=submitted_at,
+            body=data.get('body'),
+            html_url=data.get('url')
+        )
+
 
 @dataclass
 class PullRequest:
@@ -199,16 +268,16 @@ class PullRequest:
     @classmethod
     def from_github_data(cls, data: Dict[str, Any]) -> 'PullRequest':
         """Create PullRequest from GitHub API response."""
-        created_at = datetime.fromisoformat(data['created_at'].replace('Z', '+00:00'))
-        updated_at = datetime.fromisoformat(data['updated_at'].replace('Z', '+00:00'))
+        created_at = parse_github_timestamp(data['created_at'])
+        updated_at = parse_github_timestamp(data['updated_at'])
 
         merged_at = None
         if data.get('merged_at'):
-            merged_at = datetime.fromisoformat(data['merged_at'].replace('Z', '+00:00'))
+            merged_at = parse_github_timestamp(data['merged_at'])
 
         closed_at = None
         if data.get('closed_at'):
-            closed_at = datetime.fromisoformat(data['closed_at'].replace('Z', '+00:00'))
+            closed_at = parse_github_timestamp(data['closed_at'])
 
         # Determine state
         if merged_at:
@@ -256,6 +325,59 @@ class PullRequest:
             mergeable=data.get('mergeable')
         )
 
+    @classmethod
+    def from_graphql_data(cls, data: Dict[str, Any]) -> 'PullRequest':
+        """
+        Create PullRequest from a GitHub GraphQL pullRequest node.
+
+        Labels, reviews, requested reviewers, assignees and (if selected) file
+        stats are read from the node's nested connections.
+        """
+        def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+            return parse_github_timestamp(value) if value else None
+
+        state = {'MERGED': PRState.MERGED, 'CLOSED': PRState.CLOSED}.get(data['state'], PRState.OPEN)
+        mergeable = {'MERGEABLE': True, 'CONFLICTING': False}.get(data.get('mergeable'))
+
+        # Pending reviews have no submission time and aren't returned by the REST API either
+        reviews = [
+            Review.from_graphql_data(review_data)
+            for review_data in data.get('reviews', {}).get('nodes', [])
+            if review_data.get('submittedAt')
+        ]
+
+        # Team review requests have no login; only user requests are tracked
+        requested_reviewers = [
+            User.from_graphql_data(request['requestedReviewer'])
+            for request in data.get('reviewRequests', {}).get('nodes', [])
+            if request.get('requestedReviewer') and request['requestedReviewer'].get('login')
+        ]
+
+        return cls(
+            number=data['number'],
+            title=data['title'],
+            body=data.get('body'),
+            state=state,
+            created_at=parse_timestamp(data['createdAt']),
+            updated_at=parse_timestamp(data['updatedAt']),
+            merged_at=parse_timestamp(data.get('mergedAt')),
+            closed_at=parse_timestamp(data.get('closedAt')),
+            author=User.from_graphql_data(data.get('author')),
+            html_url=data['url'],
+            base_branch=data['baseRefName'],
+            head_branch=data['headRefName'],
+            labels=[Label.from_graphql_data(label) for label in data.get('labels', {}).get('nodes', [])],
+            reviews=reviews,
+            file_stats=[FileStat.from_graphql_data(f) for f in (data.get('files') or {}).get('nodes', [])],
+            requested_reviewers=requested_reviewers,
+            assignees=[User.from_graphql_data(user) for user in data.get('assignees', {}).get('nodes', [])],
+            additions=data.get('additions', 0),
+            deletions=data.get('deletions', 0),
+            changed_files=data.get('changedFiles', 0),
+            draft=data.get('isDraft', False),
+            mergeable=mergeable
+        )
+
 
 @dataclass
 class DigestTheme:
@@ -0,0 +1,93 @@
+"""
+GitHub API rate limit tracking.
+
+Keeps the latest remaining/reset values reported by GitHub so long-running
+collections can pause until the budget resets instead of failing mid-run.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class RateLimiter:
+    """
+    Tracks GitHub rate limit budgets from response headers.
+
+    GitHub keeps a separate budget per resource (REST "core", "graphql", ...).
+    The resource is read from the X-RateLimit-Resource header, so REST and
+    GraphQL traffic are tracked independently.
+
+    Example:
+        >>> limiter = RateLimiter()
+        >>> limiter.update(response.headers)
+        >>> limiter.wait_if_needed(min_remaining=50)
+    """
+
+    def __init__(self):
+        """Initialize with no known budgets (nothing blocks until GitHub reports one)."""
+        self._limits: Dict[str, Tuple[int, float]] = {}  # resource -> (remaining, reset epoch)
+
+    def update(self, headers: Any) -> None:
+        """
+        Record rate limit state from a GitHub API response's headers.
+
+        Args:
+            headers: Response headers (any mapping with .get())
+        """
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            return
+
+        resource = headers.get('X-RateLimit-Resource', 'core')
+        reset_at = float(headers.get('X-RateLimit-Reset', time.time()))
+        self._limits[resource] = (int(remaining), reset_at)
+
+    def update_from_status(self, status: Dict[str, Any]) -> None:
+        """
+        Record rate limit state from a GET /rate_limit response body.
+
+        Args:
+            status: Parsed JSON from the /rate_limit endpoint
+        """
+        for resource, info in status.get('resources', {}).items():
+            self._limits[resource] = (int(info['remaining']), float(info['reset']))
+
+    def remaining(self, resource: str = 'core') -> Optional[int]:
+        """Get the last known remaining budget for a resource (None if unknown)."""
+        state = self._limits.get(resource)
+        return state[0] if state else None
+
+    def seconds_until_available(self, min_remaining: int = 50, resource: str = 'core') -> float:
+        """
+        Get how long to wait before the resource has at least min_remaining calls.
+
+        Returns:
+            Seconds to wait (0 if the budget is sufficient or already reset)
+        """
+        state = self._limits.get(resource)
+        if state is None:
+            return 0.0
+
+        remaining, reset_at = state
+        if remaining >= min_remaining:
+            return 0.0
+
+        wait = reset_at - time.time()
+        return wait + 1 if wait > 0 else 0.0
+
+    def wait_if_needed(self, min_remaining: int = 50, resource: str = 'core') -> None:
+        """Sleep until the budget resets if fewer than min_remaining calls are left."""
+        wait = self.seconds_until_available(min_remaining, resource)
+        if wait > 0:
+            print(f"GitHub {resource} rate limit low ({self.remaining(resource)} left). "
+                  f"Sleeping for {wait:.1f} seconds...")
+            time.sleep(wait)
+
+    async def wait_if_needed_async(self, min_remaining: int = 50, resource: str = 'core') -> None:
+        """Async variant of wait_if_needed that doesn't block the event loop."""
+        wait = self.seconds_until_available(min_remaining, resource)
+        if wait > 0:
+            print(f"GitHub {resource} rate limit low ({self.remaining(resource)} left). "
+                  f"Sleeping for {wait:.1f} seconds...")
+            await asyncio.sleep(wait)
@@ -76,10 +76,6 @@ def test_bigquery_access():
             table = client.create_table(table)
             print(f"   ✓ Table recreated: {table_ref}")
 
-        # Wait for table to be available
-        print(f"   - Waiting for table to be ready...")
-        time.sleep(3)
-
         # Step 4: Insert test data
         print(f"\n4. Inserting test data...")
         rows_to_insert = [
@@ -97,12 +93,18 @@ def test_bigquery_access():
             },
         ]
 
-        errors = client.insert_rows_json(table_ref, rows_to_insert)
-        if errors:
-            print(f"   ✗ Errors occurred while inserting rows: {errors}")
+        # Batch load job (as BigQueryLoader uses) rather than streaming inserts
+        job_config = bigquery.LoadJobConfig(
+            schema=schema,
+            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+            write_disposition="WRITE_APPEND",
+        )
+        try:
+            client.load_table_from_json(rows_to_insert, table_ref, job_config=job_config).result()
+        except Exception as e:
+            print(f"   ✗ Errors occurred while loading rows: {e}")
             return False
-        else:
-            print(f"   ✓ Inserted {len(rows_to_insert)} rows successfully")
+        print(f"   ✓ Loaded {len(rows_to_insert)} rows successfully")
 
         # Step 5: Query the data
         print(f"\n5. Querying test data...")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test the SQLite-backed PRCache.
+
+Runs offline against a temporary cache directory.
+"""
+
+import json
+import time
+from datetime import datetime, timezone
+
+from src.github_delivery.cache import PRCache
+from src.github_delivery.models import (
+    FileStat, Label, PRState, PullRequest, Review, ReviewState, User
+)
+
+REPO = "mozilla/bigquery-etl"
+
+
+def make_pr(number, **overrides):
+    """Build a merged PR with one of each nested item."""
+    author = User(login="alice", html_url="https://github.com/alice")
+    fields = dict(
+        number=number,
+        title=f"PR {number}",
+        body="Body",
+        state=PRState.MERGED,
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        updated_at=datetime(2025, 1, 3, tzinfo=timezone.utc),
+        merged_at=datetime(2025, 1, 2, tzinfo=timezone.utc),
+        closed_at=datetime(2025, 1, 2, tzinfo=timezone.utc),
+        author=author,
+        html_url=f"https://github.com/{REPO}/pull/{number}",
+        base_branch="main",
+        head_branch="feature",
+        labels=[Label(name="bug", color="f00")],
+        reviews=[Review(id=number * 10, user=User(login="bob"), state=ReviewState.APPROVED,
+                        submitted_at=datetime(2025, 1, 2, tzinfo=timezone.utc), body="LGTM")],
+        file_stats=[FileStat(filename="sql/a.sql", additions=3, deletions=1, changes=4,
+                             status="modified", patch="@@ -1 +1 @@")],
+        requested_reviewers=[User(login="bob")],
+        assignees=[author],
+        additions=3,
+        deletions=1,
+        changed_files=1,
+        mergeable=True,
+    )
+    fields.update(overrides)
+    return PullRequest(**fields)
+
+
+def test_store_and_get_round_trip(tmp_path):
+    cache = PRCache(str(tmp_path))
+    prs = [make_pr(1), make_pr(2, state=PRState.OPEN, merged_at=None, closed_at=None, mergeable=None)]
+    cache.store_prs(REPO, prs)
+
+    assert cache.get_cached_pr_numbers(REPO) == [1, 2]
+    assert cache.get_prs(REPO, [2, 1, 3]) == {1: prs[0], 2: prs[1]}
+    assert cache.get_pr(REPO, 1) == prs[0]
+    assert cache.get_pr(REPO, 3) is None
+    assert cache.has_pr(REPO, 2)
+
+    # A new cache over the same directory reads the same database
+    cache.close()
+    assert PRCache(str(tmp_path)).get_pr(REPO, 2) == prs[1]
+
+
+def test_imports_legacy_json_files(tmp_path, capsys):
+    repo_dir = tmp_path / "mozilla_bigquery-etl"
+    repo_dir.mkdir()
+    writer = PRCache(str(tmp_path / "other"))
+    for number in (5, 6):
+        data = writer._pr_to_dict(make_pr(number))
+        (repo_dir / f"pr_{number}.json").write_text(json.dumps(data, indent=2))
+    (repo_dir / "pr_7.json").write_text("{not json")
+
+    cache = PRCache(str(tmp_path))
+
+    assert cache.get_cached_pr_numbers(REPO) == [5, 6]
+    assert cache.get_pr(REPO, 5) == make_pr(5)
+    assert (repo_dir / "prs.sqlite").exists()
+    output = capsys.readouterr().out
+    assert "Skipping corrupted cache file" in output
+    assert "Imported 2 cached PRs" in output
+
+
+def test_cleanup_old_cache_uses_cached_at(tmp_path):
+    cache = PRCache(str(tmp_path))
+    cache.store_prs(REPO, [make_pr(1), make_pr(2)])
+
+    # Age PR 1 past the cutoff
+    old = time.time() - 40 * 24 * 60 * 60
+    with cache._db_lock:
+        cache._get_db(REPO).execute("UPDATE prs SET cached_at = ? WHERE number = 1", (old,))
+
+    cache.cleanup_old_cache(REPO, days=30)
+
+    assert cache.get_cached_pr_numbers(REPO) == [2]
+
+
+def test_corrupted_row_warns(tmp_path, capsys):
+    cache = PRCache(str(tmp_path))
+    cache.store_prs(REPO, [make_pr(1)])
+    with cache._db_lock:
+        cache._get_db(REPO).execute(
+            "INSERT INTO prs VALUES (?, ?, ?)", (2, time.time(), b'{"number": 2}')
+        )
+
+    assert cache.get_pr(REPO, 2) is None
+    assert list(cache.get_prs(REPO, [1, 2])) == [1]
+    assert "Corrupted cache entry for PR #2" in capsys.readouterr().out
+
+
+def test_pickle_format_round_trip(tmp_path):
+    cache = PRCache(str(tmp_path), format="pickle")
+    cache.store_prs(REPO, [make_pr(1)])
+
+    assert cache.get_pr(REPO, 1) == make_pr(1)
+
+
+def test_json_cache_never_unpickles(tmp_path, capsys):
+    PRCache(str(tmp_path), format="pickle").store_prs(REPO, [make_pr(1)])
+    json_cache = PRCache(str(tmp_path))
+    json_cache.store_prs(REPO, [make_pr(2)])
+
+    # Pickled entries read as corrupted (and get refetched); JSON entries still load
+    assert json_cache.get_prs(REPO, [1, 2]) == {2: make_pr(2)}
+    assert "Corrupted cache entry for PR #1" in capsys.readouterr().out
+
+    # A pickle cache still reads JSON entries
+    assert PRCache(str(tmp_path), format="pickle").get_pr(REPO, 2) == make_pr(2)
@@ -29,9 +29,12 @@ def test_deduplication():
     print("Testing Deduplication Logic")
     print("=" * 70)
 
+    # All four existing-record sets come from one query
+    existing = loader._get_all_existing(repo_name)
+
     # Test 1: Check existing PRs
     print("\n1. Testing PR deduplication...")
-    existing_prs = loader._get_existing_pr_numbers(repo_name)
+    existing_prs = existing["prs"]
     print(f"   Found {len(existing_prs)} existing PRs in BigQuery")
     if existing_prs:
         sample_prs = list(existing_prs)[:5]
@@ -39,7 +42,7 @@ def test_deduplication():
 
     # Test 2: Check existing reviews
     print("\n2. Testing review deduplication...")
-    existing_reviews = loader._get_existing_review_ids(repo_name)
+    existing_reviews = existing["reviews"]
     print(f"   Found {len(existing_reviews)} existing reviews in BigQuery")
     if existing_reviews:
         sample_reviews = list(existing_reviews)[:5]
@@ -47,7 +50,7 @@ def test_deduplication():
 
     # Test 3: Check existing files
     print("\n3. Testing file deduplication...")
-    existing_files = loader._get_existing_files(repo_name)
+    existing_files = existing["files"]
     print(f"   Found {len(existing_files)} existing file records in BigQuery")
     if existing_files:
         sample_files = list(existing_files)[:3]
@@ -55,7 +58,7 @@ def test_deduplication():
 
     # Test 4: Check existing labels
     print("\n4. Testing label deduplication...")
-    existing_labels = loader._get_existing_labels(repo_name)
+    existing_labels = existing["labels"]
     print(f"   Found {len(existing_labels)} existing label records in BigQuery")
     if existing_labels:
         sample_labels = list(existing_labels)[:5]
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test parsing of GitHub GraphQL pullRequest nodes.
+
+Runs offline against hand-built nodes shaped like the collector's
+_PULL_REQUESTS_QUERY responses.
+"""
+
+from src.github_delivery.collector import _truncated_connections
+from src.github_delivery.models import PullRequest, PRState, Review, ReviewState, User
+
+
+def make_node(**overrides):
+    """Build a merged pullRequest node with one of each nested item."""
+    node = {
+        'number': 42,
+        'title': 'Add widgets',
+        'body': 'Adds widgets',
+        'state': 'MERGED',
+        'isDraft': False,
+        'mergeable': 'UNKNOWN',
+        'url': 'https://github.com/o/r/pull/42',
+        'createdAt': '2025-01-01T00:00:00Z',
+        'updatedAt': '2025-01-03T00:00:00Z',
+        'mergedAt': '2025-01-02T00:00:00Z',
+        'closedAt': '2025-01-02T00:00:00Z',
+        'baseRefName': 'main',
+        'headRefName': 'widgets',
+        'additions': 10,
+        'deletions': 2,
+        'changedFiles': 1,
+        'author': {'login': 'alice', 'avatarUrl': 'a', 'url': 'u'},
+        'labels': {'pageInfo': {'hasNextPage': False}, 'nodes': [{'name': 'bug', 'color': 'f00'}]},
+        'assignees': {'pageInfo': {'hasNextPage': False}, 'nodes': [{'login': 'bob'}]},
+        'reviewRequests': {
+            'pageInfo': {'hasNextPage': False},
+            'nodes': [{'requestedReviewer': {'login': 'carol'}}],
+        },
+        'reviews': {
+            'pageInfo': {'hasNextPage': False},
+            'nodes': [{
+                'databaseId': 7, 'state': 'APPROVED', 'submittedAt': '2025-01-02T00:00:00Z',
+                'body': 'LGTM', 'url': 'r', 'author': {'login': 'dave'},
+            }],
+        },
+        'files': {
+            'pageInfo': {'hasNextPage': False},
+            'nodes': [{'path': 'src/w.py', 'additions': 10, 'deletions': 2, 'changeType': 'DELETED'}],
+        },
+    }
+    node.update(overrides)
+    return node
+
+
+def test_parses_nested_connections():
+    pr = PullRequest.from_graphql_data(make_node())
+
+    assert pr.state == PRState.MERGED
+    assert pr.author.login == 'alice'
+    assert [label.name for label in pr.labels] == ['bug']
+    assert [user.login for user in pr.assignees] == ['bob']
+    assert [user.login for user in pr.requested_reviewers] == ['carol']
+    assert [(review.id, review.state) for review in pr.reviews] == [(7, ReviewState.APPROVED)]
+    assert [(f.filename, f.changes, f.status) for f in pr.file_stats] == [('src/w.py', 12, 'removed')]
+
+
+def test_ghost_authors():
+    review = {'databaseId': 8, 'state': 'COMMENTED', 'submittedAt': '2025-01-02T00:00:00Z', 'author': None}
+    node = make_node(
+        author=None,
+        reviews={'pageInfo': {'hasNextPage': False}, 'nodes': [review]},
+    )
+    pr = PullRequest.from_graphql_data(node)
+
+    assert pr.author.login == 'ghost'
+    assert pr.reviews[0].user.login == 'ghost'
+    assert User.from_graphql_data({}).login == 'ghost'
+    assert Review.from_graphql_data(review).user.login == 'ghost'
+
+
+def test_team_review_requests_skipped():
+    requests = {'pageInfo': {'hasNextPage': False}, 'nodes': [
+        {'requestedReviewer': {}},  # Team: no User fields selected
+        {'requestedReviewer': None},
+        {'requestedReviewer': {'login': 'carol'}},
+    ]}
+    pr = PullRequest.from_graphql_data(make_node(reviewRequests=requests))
+
+    assert [user.login for user in pr.requested_reviewers] == ['carol']
+
+
+def test_pending_reviews_filtered():
+    reviews = {'pageInfo': {'hasNextPage': False}, 'nodes': [
+        {'databaseId': 1, 'state': 'PENDING', 'submittedAt': None, 'author': {'login': 'erin'}},
+        {'databaseId': 2, 'state': 'CHANGES_REQUESTED', 'submittedAt': '2025-01-02T00:00:00Z',
+         'author': {'login': 'frank'}},
+    ]}
+    pr = PullRequest.from_graphql_data(make_node(reviews=reviews))
+
+    assert [review.id for review in pr.reviews] == [2]
+
+
+def test_mergeable_enum_maps_to_bool():
+    assert PullRequest.from_graphql_data(make_node(mergeable='MERGEABLE')).mergeable is True
+    assert PullRequest.from_graphql_data(make_node(mergeable='CONFLICTING')).mergeable is False
+    assert PullRequest.from_graphql_data(make_node(mergeable='UNKNOWN')).mergeable is None
+
+
+def test_open_pr_without_files_selection():
+    node = make_node(state='OPEN', mergedAt=None, closedAt=None)
+    del node['files']
+    pr = PullRequest.from_graphql_data(node)
+
+    assert pr.state == PRState.OPEN
+    assert pr.merged_at is None
+    assert pr.file_stats == []
+
+
+def test_truncated_connections():
+    assert _truncated_connections(make_node()) == []
+
+    node = make_node()
+    node['reviews']['pageInfo']['hasNextPage'] = True
+    node['labels']['pageInfo']['hasNextPage'] = True
+    assert _truncated_connections(node) == ['labels', 'reviews']
+
+    # Files aren't selected when patches come from REST
+    del node['files']
+    assert _truncated_connections(node) == ['labels', 'reviews']
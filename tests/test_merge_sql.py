@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test the generated staging -> production MERGE statements.
+
+Runs offline: only renders SQL and query parameters, no BigQuery client.
+"""
+
+import re
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("google.cloud.bigquery")
+
+from src.github_delivery.bigquery_loader import _UPSERT_SPECS, _merge_sql, _range_parameters
+
+
+def on_clause(sql):
+    """Get a MERGE statement's ON condition."""
+    return re.search(r"^ON (.*)$", sql, re.MULTILINE).group(1)
+
+
+@pytest.mark.parametrize("kind", sorted(_UPSERT_SPECS))
+def test_merge_on_predicates(kind):
+    spec = _UPSERT_SPECS[kind]
+    sql = _merge_sql(spec, "p.d.prod", "p.d.staging")
+
+    assert "MERGE `p.d.prod` T" in sql
+    assert "USING `p.d.staging` S" in sql
+
+    expected = ["T.repo_name = @repo_name"] + [f"T.{col} = S.{col}" for col in spec.key_cols]
+    if spec.partition_col:
+        col = spec.partition_col
+        expected.append(f"(T.{col} IS NULL OR T.{col} BETWEEN @min_{col} AND @max_{col})")
+    assert on_clause(sql) == " AND ".join(expected)
+
+
+@pytest.mark.parametrize("kind", sorted(_UPSERT_SPECS))
+def test_merge_updates_and_inserts(kind):
+    spec = _UPSERT_SPECS[kind]
+    sql = _merge_sql(spec, "p.d.prod", "p.d.staging")
+
+    update_set = re.search(r"UPDATE SET (.*)$", sql, re.MULTILINE).group(1)
+    assert update_set.split(", ") == [f"{col} = S.{col}" for col in spec.update_cols]
+
+    # Key columns are never overwritten, only inserted
+    for col in spec.key_cols:
+        assert f"{col} = S.{col}" not in update_set
+
+    insert_columns = re.search(r"INSERT \((.*)\)$", sql, re.MULTILINE).group(1).split(", ")
+    assert insert_columns == list(spec.key_cols + spec.update_cols)
+
+
+def test_range_parameters_all_none():
+    params = _range_parameters("merged_at", [None, None])
+
+    assert [(p.name, p.type_, p.value) for p in params] == [
+        ("min_merged_at", "TIMESTAMP", None),
+        ("max_merged_at", "TIMESTAMP", None),
+    ]
+    assert [p.value for p in _range_parameters("merged_at", [])] == [None, None]
+
+
+def test_range_parameters_mixed():
+    early = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    late = datetime(2025, 3, 1, tzinfo=timezone.utc)
+    params = _range_parameters("submitted_at", [None, late, early, None])
+
+    assert [(p.name, p.type_, p.value) for p in params] == [
+        ("min_submitted_at", "TIMESTAMP", early),
+        ("max_submitted_at", "TIMESTAMP", late),
+    ]
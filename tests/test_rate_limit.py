@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test GitHub rate limit tracking and Link-header pagination parsing.
+
+Runs offline with a frozen clock; nothing actually sleeps.
+"""
+
+import asyncio
+
+import pytest
+
+from src.github_delivery import rate_limit
+from src.github_delivery.collector import _parse_last_page
+from src.github_delivery.rate_limit import RateLimiter
+
+NOW = 1_700_000_000.0
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze time.time() at NOW and record sleeps instead of sleeping."""
+    sleeps = []
+    monkeypatch.setattr(rate_limit.time, "time", lambda: NOW)
+    monkeypatch.setattr(rate_limit.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def headers(remaining, reset, resource=None):
+    """Build GitHub rate limit response headers."""
+    values = {'X-RateLimit-Remaining': str(remaining), 'X-RateLimit-Reset': str(int(reset))}
+    if resource:
+        values['X-RateLimit-Resource'] = resource
+    return values
+
+
+def test_unknown_budget_never_blocks(clock):
+    limiter = RateLimiter()
+
+    assert limiter.remaining() is None
+    assert limiter.seconds_until_available(min_remaining=10_000) == 0.0
+    limiter.update({})  # No rate limit headers: nothing recorded
+    assert limiter.remaining() is None
+
+
+def test_resources_tracked_separately(clock):
+    limiter = RateLimiter()
+    limiter.update(headers(4000, NOW + 600))  # No resource header means core
+    limiter.update(headers(3, NOW + 60, resource='graphql'))
+
+    assert limiter.remaining('core') == 4000
+    assert limiter.remaining('graphql') == 3
+    assert limiter.seconds_until_available(50, 'core') == 0.0
+    assert limiter.seconds_until_available(50, 'graphql') == 61.0
+    assert limiter.seconds_until_available(50, 'search') == 0.0
+
+
+def test_reset_math(clock):
+    limiter = RateLimiter()
+
+    limiter.update(headers(10, NOW + 120))
+    assert limiter.seconds_until_available(min_remaining=10) == 0.0
+    assert limiter.seconds_until_available(min_remaining=11) == 121.0
+
+    # Reset time already passed: the budget has refilled
+    limiter.update(headers(0, NOW - 5))
+    assert limiter.seconds_until_available(min_remaining=1) == 0.0
+
+
+def test_update_from_status(clock):
+    limiter = RateLimiter()
+    limiter.update_from_status({'resources': {
+        'core': {'limit': 5000, 'remaining': 20, 'reset': NOW + 30},
+        'graphql': {'limit': 5000, 'remaining': 4999, 'reset': NOW + 3600},
+    }})
+
+    assert limiter.remaining('core') == 20
+    assert limiter.remaining('graphql') == 4999
+    assert limiter.seconds_until_available(50, 'core') == 31.0
+
+
+def test_wait_if_needed_sleeps_until_reset(clock):
+    limiter = RateLimiter()
+    limiter.update(headers(100, NOW + 90))
+
+    limiter.wait_if_needed(min_remaining=50)
+    assert clock == []
+
+    limiter.wait_if_needed(min_remaining=200)
+    assert clock == [91.0]
+
+
+def test_wait_if_needed_async(clock, monkeypatch):
+    async_sleeps = []
+
+    async def fake_sleep(seconds):
+        async_sleeps.append(seconds)
+
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", fake_sleep)
+    limiter = RateLimiter()
+    limiter.update(headers(0, NOW + 9, resource='graphql'))
+
+    asyncio.run(limiter.wait_if_needed_async(resource='core'))
+    asyncio.run(limiter.wait_if_needed_async(resource='graphql'))
+    assert async_sleeps == [10.0]
+    assert clock == []
+
+
+def test_parse_last_page():
+    link = ('<https://api.github.com/repositories/1/pulls?state=closed&per_page=100&page=2>; rel="next", '
+            '<https://api.github.com/repositories/1/pulls?state=closed&per_page=100&page=14>; rel="last"')
+    assert _parse_last_page(link) == 14
+
+
+def test_parse_last_page_without_last():
+    # On the last page GitHub only sends prev/first links
+    link = ('<https://api.github.com/repositories/1/pulls?page=13>; rel="prev", '
+            '<https://api.github.com/repositories/1/pulls?page=1>; rel="first"')
+    assert _parse_last_page(link) is None
+    assert _parse_last_page(None) is None
+    assert _parse_last_page('') is None
+
+
+def test_parse_last_page_ignores_per_page():
+    link = '<https://api.github.com/repos/o/r/pulls/1/files?per_page=100&page=3>; rel="last"'
+    assert _parse_last_page(link) == 3
+
+
+def test_collector_rest_checks_ignore_graphql_budget(clock, tmp_path):
+    from src.github_delivery.collector import GitHubCollector
+
+    collector = GitHubCollector('token', 'o/r', cache_dir=str(tmp_path), etag_cache=False)
+    collector._send = lambda url, request_headers, timeout: (200, headers(4000, NOW + 600), b'{}')
+
+    # An exhausted GraphQL budget doesn't hold up REST requests...
+    collector._update_rate_limit(headers(0, NOW + 600, resource='graphql'))
+    collector._make_request('https://api.github.com/repos/o/r/pulls', timeout=30)
+    assert clock == []
+
+    # ...and a GraphQL response doesn't reset an exhausted REST budget
+    collector._update_rate_limit(headers(1, NOW + 30))
+    collector._update_rate_limit(headers(4999, NOW + 3600, resource='graphql'))
+    collector._make_request('https://api.github.com/repos/o/r/pulls', timeout=30)
+    assert clock == [31.0]